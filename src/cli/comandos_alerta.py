@@ -3,6 +3,7 @@ Comandos CLI para gerenciamento de alertas.
 """
 
 import click
+from operator import attrgetter
 
 from .formatadores import get_gerenciador
 
@@ -25,7 +26,7 @@ def listar_alertas(todos: bool):
     click.echo(f"\n🔔 ALERTAS ({len(alertas)} encontrados)")
     click.echo("=" * 60)
     
-    for alerta in sorted(alertas):
+    for alerta in sorted(alertas, key=attrgetter("sort_key")):
         click.echo(f"   {alerta}")
     
     click.echo()
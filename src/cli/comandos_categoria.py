@@ -6,7 +6,7 @@ import click
 from typing import Optional
 
 from ..models.categoria import TipoCategoria
-from .formatadores import get_gerenciador, parse_tipo_categoria
+from .formatadores import get_gerenciador, EnumChoice
 
 
 @click.group("categoria")
@@ -16,13 +16,12 @@ def categoria_group():
 
 
 @categoria_group.command("listar")
-@click.option("--tipo", "-t", type=click.Choice(["receita", "despesa"]), help="Filtrar por tipo")
-def listar_categorias(tipo: Optional[str]):
+@click.option("--tipo", "-t", type=EnumChoice(TipoCategoria), help="Filtrar por tipo")
+def listar_categorias(tipo: Optional[TipoCategoria]):
     """Lista todas as categorias cadastradas."""
     gerenciador = get_gerenciador()
-    
-    tipo_filtro = parse_tipo_categoria(tipo) if tipo else None
-    categorias = gerenciador.listar_categorias(tipo_filtro)
+
+    categorias = gerenciador.listar_categorias(tipo)
     
     if not categorias:
         click.echo("📭 Nenhuma categoria cadastrada.")
@@ -31,20 +30,23 @@ def listar_categorias(tipo: Optional[str]):
     click.echo("\n📁 CATEGORIAS CADASTRADAS")
     click.echo("=" * 60)
     
-    # Agrupar por tipo
-    receitas = [c for c in categorias if c.tipo == TipoCategoria.RECEITA]
-    despesas = [c for c in categorias if c.tipo == TipoCategoria.DESPESA]
-    
-    if receitas and (not tipo or tipo == "receita"):
+    # Agrupar por tipo em uma única passada (a lista já vem ordenada
+    # por nome do gerenciador)
+    receitas: list = []
+    despesas: list = []
+    for cat in categorias:
+        (receitas if cat.tipo == TipoCategoria.RECEITA else despesas).append(cat)
+
+    if receitas and (not tipo or tipo == TipoCategoria.RECEITA):
         click.echo("\n💚 RECEITAS:")
-        for cat in sorted(receitas):
+        for cat in receitas:
             click.echo(f"   • {cat.nome}")
             if cat.descricao:
                 click.echo(f"     {cat.descricao}")
     
-    if despesas and (not tipo or tipo == "despesa"):
+    if despesas and (not tipo or tipo == TipoCategoria.DESPESA):
         click.echo("\n❤️  DESPESAS:")
-        for cat in sorted(despesas):
+        for cat in despesas:
             limite = f" (Limite: R${cat.limite_mensal:.2f})" if cat.limite_mensal else ""
             click.echo(f"   • {cat.nome}{limite}")
             if cat.descricao:
@@ -55,18 +57,17 @@ def listar_categorias(tipo: Optional[str]):
 
 @categoria_group.command("adicionar")
 @click.option("--nome", "-n", required=True, help="Nome da categoria")
-@click.option("--tipo", "-t", required=True, type=click.Choice(["receita", "despesa"]), help="Tipo da categoria")
+@click.option("--tipo", "-t", required=True, type=EnumChoice(TipoCategoria), help="Tipo da categoria")
 @click.option("--limite", "-l", type=float, help="Limite mensal (apenas para despesas)")
 @click.option("--descricao", "-d", help="Descrição da categoria")
-def adicionar_categoria(nome: str, tipo: str, limite: Optional[float], descricao: Optional[str]):
+def adicionar_categoria(nome: str, tipo: TipoCategoria, limite: Optional[float], descricao: Optional[str]):
     """Adiciona uma nova categoria."""
     gerenciador = get_gerenciador()
-    tipo_cat = parse_tipo_categoria(tipo)
-    
+
     try:
         categoria = gerenciador.criar_categoria(
             nome=nome,
-            tipo=tipo_cat,
+            tipo=tipo,
             limite_mensal=limite,
             descricao=descricao
         )
@@ -77,15 +78,14 @@ def adicionar_categoria(nome: str, tipo: str, limite: Optional[float], descricao
 
 @categoria_group.command("editar")
 @click.argument("nome_atual")
-@click.option("--tipo", "-t", required=True, type=click.Choice(["receita", "despesa"]), help="Tipo da categoria")
+@click.option("--tipo", "-t", required=True, type=EnumChoice(TipoCategoria), help="Tipo da categoria")
 @click.option("--novo-nome", "-n", help="Novo nome")
 @click.option("--limite", "-l", type=float, help="Novo limite mensal")
 @click.option("--descricao", "-d", help="Nova descrição")
-def editar_categoria(nome_atual: str, tipo: str, novo_nome: Optional[str], limite: Optional[float], descricao: Optional[str]):
+def editar_categoria(nome_atual: str, tipo: TipoCategoria, novo_nome: Optional[str], limite: Optional[float], descricao: Optional[str]):
     """Edita uma categoria existente."""
     gerenciador = get_gerenciador()
-    tipo_cat = parse_tipo_categoria(tipo)
-    categoria = gerenciador.buscar_categoria_por_nome(nome_atual, tipo_cat)
+    categoria = gerenciador.buscar_categoria_por_nome(nome_atual, tipo)
     
     if not categoria:
         click.echo(f"❌ Categoria '{nome_atual}' não encontrada.", err=True)
@@ -105,13 +105,12 @@ def editar_categoria(nome_atual: str, tipo: str, novo_nome: Optional[str], limit
 
 @categoria_group.command("excluir")
 @click.argument("nome")
-@click.option("--tipo", "-t", required=True, type=click.Choice(["receita", "despesa"]), help="Tipo da categoria")
+@click.option("--tipo", "-t", required=True, type=EnumChoice(TipoCategoria), help="Tipo da categoria")
 @click.confirmation_option(prompt="Tem certeza que deseja excluir esta categoria?")
-def excluir_categoria(nome: str, tipo: str):
+def excluir_categoria(nome: str, tipo: TipoCategoria):
     """Exclui uma categoria."""
     gerenciador = get_gerenciador()
-    tipo_cat = parse_tipo_categoria(tipo)
-    categoria = gerenciador.buscar_categoria_por_nome(nome, tipo_cat)
+    categoria = gerenciador.buscar_categoria_por_nome(nome, tipo)
     
     if not categoria:
         click.echo(f"❌ Categoria '{nome}' não encontrada.", err=True)
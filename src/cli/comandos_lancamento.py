@@ -3,9 +3,11 @@ Comandos CLI para gerenciamento de lançamentos (receitas e despesas).
 """
 
 import click
+import csv
 from typing import Optional
 
-from .formatadores import get_gerenciador, parse_data, parse_forma_pagamento
+from ..models.lancamento import FormaPagamento
+from .formatadores import get_gerenciador, parse_data, formatar_data, echo_em_bloco, EnumChoice
 
 
 @click.command("adicionar-receita")
@@ -13,15 +15,15 @@ from .formatadores import get_gerenciador, parse_data, parse_forma_pagamento
 @click.option("--categoria", "-c", required=True, help="Nome da categoria")
 @click.option("--data", "-d", required=True, help="Data (DD/MM/YYYY)")
 @click.option("--descricao", "-D", required=True, help="Descrição")
-@click.option("--pagamento", "-p", default="pix", help="Forma de pagamento (dinheiro/debito/credito/pix)")
-def adicionar_receita(valor: float, categoria: str, data: str, descricao: str, pagamento: str):
+@click.option("--pagamento", "-p", type=EnumChoice(FormaPagamento), default="pix", help="Forma de pagamento")
+def adicionar_receita(valor: float, categoria: str, data: str, descricao: str, pagamento: FormaPagamento):
     """💚 Adiciona uma nova receita."""
     gerenciador = get_gerenciador()
-    
+
     try:
         data_lancamento = parse_data(data)
-        forma_pagamento = parse_forma_pagamento(pagamento)
-        
+        forma_pagamento = pagamento
+
         receita, alertas = gerenciador.adicionar_receita(
             valor=valor,
             categoria_nome=categoria,
@@ -44,15 +46,15 @@ def adicionar_receita(valor: float, categoria: str, data: str, descricao: str, p
 @click.option("--categoria", "-c", required=True, help="Nome da categoria")
 @click.option("--data", "-d", required=True, help="Data (DD/MM/YYYY)")
 @click.option("--descricao", "-D", required=True, help="Descrição")
-@click.option("--pagamento", "-p", default="debito", help="Forma de pagamento (dinheiro/debito/credito/pix)")
-def adicionar_despesa(valor: float, categoria: str, data: str, descricao: str, pagamento: str):
+@click.option("--pagamento", "-p", type=EnumChoice(FormaPagamento), default="debito", help="Forma de pagamento")
+def adicionar_despesa(valor: float, categoria: str, data: str, descricao: str, pagamento: FormaPagamento):
     """❤️  Adiciona uma nova despesa."""
     gerenciador = get_gerenciador()
-    
+
     try:
         data_lancamento = parse_data(data)
-        forma_pagamento = parse_forma_pagamento(pagamento)
-        
+        forma_pagamento = pagamento
+
         despesa, alertas = gerenciador.adicionar_despesa(
             valor=valor,
             categoria_nome=categoria,
@@ -76,6 +78,46 @@ def adicionar_despesa(valor: float, categoria: str, data: str, descricao: str, p
         click.echo(f"❌ Erro: {e}", err=True)
 
 
+@click.command("adicionar-despesas-csv")
+@click.argument("csv_path", type=click.Path(exists=True))
+def adicionar_despesas_csv(csv_path: str):
+    """📥 Importa despesas em lote de um arquivo CSV.
+
+    Formato das colunas: valor,categoria,data,descricao[,pagamento].
+    Todas as linhas são processadas no mesmo processo e a persistência
+    é gravada uma única vez ao final.
+    """
+    gerenciador = get_gerenciador()
+
+    importadas = 0
+    erros = 0
+
+    gerenciador.suspender_salvamento()
+    try:
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            for num_linha, linha in enumerate(csv.reader(f), start=1):
+                if not linha or linha[0].startswith("#"):
+                    continue
+                try:
+                    valor, categoria, data, descricao = linha[:4]
+                    pagamento = linha[4] if len(linha) > 4 else "debito"
+                    gerenciador.adicionar_despesa(
+                        valor=float(valor),
+                        categoria_nome=categoria.strip(),
+                        data_lancamento=parse_data(data),
+                        descricao=descricao.strip(),
+                        forma_pagamento=FormaPagamento[pagamento.strip().upper()]
+                    )
+                    importadas += 1
+                except (ValueError, KeyError, click.BadParameter) as e:
+                    erros += 1
+                    click.echo(f"❌ Linha {num_linha}: {e}", err=True)
+    finally:
+        gerenciador.flush()
+
+    click.echo(f"✅ {importadas} despesa(s) importada(s), {erros} erro(s).")
+
+
 @click.command("listar-lancamentos")
 @click.option("--mes", "-m", type=int, help="Filtrar por mês (1-12)")
 @click.option("--ano", "-a", type=int, help="Filtrar por ano")
@@ -96,28 +138,31 @@ def listar_lancamentos(mes: Optional[int], ano: Optional[int], tipo: Optional[st
         click.echo("📭 Nenhum lançamento encontrado.")
         return
     
-    click.echo(f"\n📋 LANÇAMENTOS ({len(lancamentos)} encontrados)")
-    click.echo("=" * 70)
-    
-    total_receitas = 0.0
-    total_despesas = 0.0
-    
+    # Acumular as linhas e emitir uma única vez: um write no stdout
+    # em vez de um por lançamento
+    linhas = [f"\n📋 LANÇAMENTOS ({len(lancamentos)} encontrados)", "=" * 70]
+
+    # Dict de acumuladores: substitui o branch if/else por uma
+    # atribuição indexada no corpo do loop
+    totais = {"RECEITA": 0.0, "DESPESA": 0.0}
+
     for lanc in lancamentos:
         icone = "💚" if lanc.tipo == "RECEITA" else "❤️ "
-        click.echo(
-            f"{icone} {lanc.data.strftime('%d/%m/%Y')} | "
+        linhas.append(
+            f"{icone} {formatar_data(lanc.data)} | "
             f"R${lanc.valor:>10.2f} | "
             f"{lanc.categoria.nome:<15} | "
             f"{lanc.descricao}"
         )
-        
-        if lanc.tipo == "RECEITA":
-            total_receitas += lanc.valor
-        else:
-            total_despesas += lanc.valor
-    
-    click.echo("=" * 70)
-    click.echo(f"💚 Total Receitas: R${total_receitas:.2f}")
-    click.echo(f"❤️  Total Despesas: R${total_despesas:.2f}")
-    click.echo(f"💰 Saldo: R${total_receitas - total_despesas:.2f}")
-    click.echo()
+
+        totais[lanc.tipo] += lanc.valor
+
+    total_receitas = totais["RECEITA"]
+    total_despesas = totais["DESPESA"]
+
+    linhas.append("=" * 70)
+    linhas.append(f"💚 Total Receitas: R${total_receitas:.2f}")
+    linhas.append(f"❤️  Total Despesas: R${total_despesas:.2f}")
+    linhas.append(f"💰 Saldo: R${total_receitas - total_despesas:.2f}")
+    linhas.append("")
+    echo_em_bloco(linhas)
@@ -7,6 +7,10 @@ import click
 from .formatadores import get_gerenciador
 
 
+# Barras de progresso pré-construídas (0% a 100%, passos de 5%)
+_BARS = tuple("█" * i for i in range(21))
+
+
 @click.command("relatorio-mensal")
 @click.option("--mes", "-m", required=True, type=int, help="Mês (1-12)")
 @click.option("--ano", "-a", required=True, type=int, help="Ano")
@@ -41,7 +45,7 @@ def relatorio_mensal(mes: int, ano: int):
         click.echo(f"\n📁 DESPESAS POR CATEGORIA:")
         for cat, valor in sorted(relatorio["despesas_por_categoria"].items(), key=lambda x: -x[1]):
             percentual = relatorio["percentual_por_categoria"].get(cat, 0)
-            barra = "█" * int(percentual / 5)
+            barra = _BARS[min(int(percentual / 5), 20)]
             click.echo(f"   {cat:<15} R${valor:>10.2f} ({percentual:>5.1f}%) {barra}")
     
     # Despesas por forma de pagamento
@@ -2,61 +2,101 @@
 Funções auxiliares de formatação e parsing para a CLI.
 """
 
+import sys
+
 import click
-from datetime import datetime, date
-from typing import Optional
+from datetime import date
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING
 
 from ..models.categoria import TipoCategoria
 from ..models.lancamento import FormaPagamento
-from ..persistence.gerenciador_dados import GerenciadorDados
-
 
-# Instância global do gerenciador
-_gerenciador: Optional[GerenciadorDados] = None
+if TYPE_CHECKING:
+    from ..persistence.gerenciador_dados import GerenciadorDados
 
 
-def get_gerenciador() -> GerenciadorDados:
-    """Obtém ou cria a instância do gerenciador."""
-    global _gerenciador
-    if _gerenciador is None:
-        _gerenciador = GerenciadorDados()
-        _gerenciador.inicializar_categorias_padrao()
-    return _gerenciador
+@cache
+def get_gerenciador() -> "GerenciadorDados":
+    """Obtém ou cria a instância do gerenciador (memoizada)."""
+    # Import tardio: comandos como --help não precisam carregar a persistência
+    from ..persistence.gerenciador_dados import GerenciadorDados
+    return GerenciadorDados()
 
 
 def parse_data(data_str: str) -> date:
-    """Converte string para data."""
-    formatos = ["%d/%m/%Y", "%Y-%m-%d", "%d-%m-%Y"]
-    for fmt in formatos:
-        try:
-            return datetime.strptime(data_str, fmt).date()
-        except ValueError:
-            continue
+    """
+    Converte string para data.
+
+    Faz o parsing por fatiamento direto (DD/MM/YYYY, DD-MM-YYYY ou
+    YYYY-MM-DD), evitando o custo de `strptime` em importações em lote.
+    """
+    s = data_str.strip()
+    try:
+        if len(s) == 10:
+            if s[2] in "/-":
+                # DD/MM/YYYY ou DD-MM-YYYY
+                return date(int(s[6:10]), int(s[3:5]), int(s[0:2]))
+            if s[4] == "-":
+                # ISO YYYY-MM-DD
+                return date(int(s[0:4]), int(s[5:7]), int(s[8:10]))
+    except ValueError:
+        pass
     raise click.BadParameter(f"Data inválida: {data_str}. Use DD/MM/YYYY")
 
 
-def parse_forma_pagamento(forma: str) -> FormaPagamento:
-    """Converte string para FormaPagamento."""
-    mapa = {
-        "dinheiro": FormaPagamento.DINHEIRO,
-        "debito": FormaPagamento.DEBITO,
-        "credito": FormaPagamento.CREDITO,
-        "pix": FormaPagamento.PIX,
-    }
-    forma_lower = forma.lower()
-    if forma_lower not in mapa:
-        raise click.BadParameter(
-            f"Forma de pagamento inválida: {forma}. "
-            f"Use: {', '.join(mapa.keys())}"
-        )
-    return mapa[forma_lower]
+class EnumChoice(click.Choice):
+    """
+    click.Choice que devolve direto o membro do Enum.
+
+    Move a conversão string -> enum para dentro do parsing do Click,
+    eliminando uma função de parse (e um dict) por invocação de comando.
+    """
+
+    def __init__(self, enum_cls):
+        self._enum_cls = enum_cls
+        super().__init__([membro.name.lower() for membro in enum_cls])
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, self._enum_cls):
+            return value
+        nome = super().convert(value.lower(), param, ctx)
+        return self._enum_cls[nome.upper()]
+
+
+def echo_em_bloco(linhas: list[str]) -> None:
+    """
+    Emite várias linhas de uma vez.
+
+    Fora de um terminal (saída redirecionada), codifica o bloco inteiro
+    em UTF-8 uma única vez e escreve no stream binário — um encode e um
+    write para centenas de linhas com emoji. Num TTY cai no click.echo,
+    que trata cores e codec do terminal.
+    """
+    saida = "\n".join(linhas)
+    if sys.stdout.isatty():
+        click.echo(saida)
+    else:
+        stream = click.get_binary_stream("stdout")
+        stream.write((saida + "\n").encode("utf-8"))
+        stream.flush()
+
+
+@lru_cache(maxsize=4096)
+def formatar_data(d: date) -> str:
+    """
+    Formata uma data como DD/MM/YYYY.
+
+    Cacheada por data: numa listagem mensal a maioria das linhas repete
+    poucas datas, e a formatação por f-string dispensa o strftime/locale.
+    """
+    return f"{d.day:02d}/{d.month:02d}/{d.year}"
 
 
-def parse_tipo_categoria(tipo: str) -> TipoCategoria:
-    """Converte string para TipoCategoria."""
-    return TipoCategoria.RECEITA if tipo == "receita" else TipoCategoria.DESPESA
+# Tabela de tradução para o formato brasileiro (troca , e . em uma passada)
+_BR_TRANS = str.maketrans({",": ".", ".": ","})
 
 
 def formatar_valor(valor: float) -> str:
     """Formata valor monetário."""
-    return f"R${valor:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+    return f"R${valor:,.2f}".translate(_BR_TRANS)
@@ -2,53 +2,90 @@
 CLI Principal - Interface de linha de comando para o sistema de finanças.
 """
 
+import importlib
+import shlex
+import sys
+
 import click
 
 from .formatadores import get_gerenciador
-from .comandos_categoria import categoria_group
-from .comandos_lancamento import adicionar_receita, adicionar_despesa, listar_lancamentos
-from .comandos_relatorio import relatorio_mensal, relatorio_comparativo, estatisticas
-from .comandos_alerta import listar_alertas, marcar_alertas_lidos
 
 
-@click.group()
+# Mapa de subcomandos -> (módulo, atributo). Os módulos só são importados
+# quando o subcomando é de fato invocado, encurtando o startup de --help
+# e de qualquer comando isolado.
+_COMANDOS = {
+    "categoria": ("comandos_categoria", "categoria_group"),
+    "adicionar-receita": ("comandos_lancamento", "adicionar_receita"),
+    "adicionar-despesa": ("comandos_lancamento", "adicionar_despesa"),
+    "adicionar-despesas-csv": ("comandos_lancamento", "adicionar_despesas_csv"),
+    "listar-lancamentos": ("comandos_lancamento", "listar_lancamentos"),
+    "relatorio-mensal": ("comandos_relatorio", "relatorio_mensal"),
+    "relatorio-comparativo": ("comandos_relatorio", "relatorio_comparativo"),
+    "estatisticas": ("comandos_relatorio", "estatisticas"),
+    "alertas": ("comandos_alerta", "listar_alertas"),
+    "marcar-alertas-lidos": ("comandos_alerta", "marcar_alertas_lidos"),
+}
+
+
+class LazyGroup(click.Group):
+    """Grupo Click que importa os módulos de comandos sob demanda."""
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        comandos = set(_COMANDOS) | set(self.commands)
+        return sorted(comandos)
+
+    def get_command(self, ctx: click.Context, name: str):
+        if name in self.commands:
+            return self.commands[name]
+        entrada = _COMANDOS.get(name)
+        if entrada is None:
+            return None
+        modulo, atributo = entrada
+        mod = importlib.import_module(f".{modulo}", __package__)
+        return getattr(mod, atributo)
+
+
+@click.group(cls=LazyGroup)
 @click.version_option(version="1.0.0", prog_name="Controle de Despesas")
 def cli():
     """
     💰 Sistema de Controle de Despesas e Receitas.
-    
+
     Gerencie suas finanças pessoais com facilidade!
     """
     pass
 
 
-# Registrar grupos de comandos
-cli.add_command(categoria_group)
-
-# Registrar comandos de lançamentos
-cli.add_command(adicionar_receita)
-cli.add_command(adicionar_despesa)
-cli.add_command(listar_lancamentos)
-
-# Registrar comandos de relatórios
-cli.add_command(relatorio_mensal)
-cli.add_command(relatorio_comparativo)
-cli.add_command(estatisticas)
-
-# Registrar comandos de alertas
-cli.add_command(listar_alertas)
-cli.add_command(marcar_alertas_lidos)
-
-
 @cli.command("inicializar")
 def inicializar():
     """🚀 Inicializa o sistema com categorias padrão."""
     gerenciador = get_gerenciador()
-    
+
     gerenciador.inicializar_categorias_padrao()
     click.echo("✅ Sistema inicializado com categorias padrão!")
     click.echo("\n💡 Use 'financas categoria listar' para ver as categorias disponíveis.")
 
 
+@cli.command("batch")
+def batch():
+    """⚡ Executa comandos em lote lidos da entrada padrão (um por linha).
+
+    Amortiza o custo de startup do Python e do carregamento dos dados
+    em uma única invocação do processo, útil para importações scriptadas.
+    """
+    for num_linha, linha in enumerate(sys.stdin, start=1):
+        linha = linha.strip()
+        if not linha or linha.startswith("#"):
+            continue
+        try:
+            args = shlex.split(linha)
+            cli.main(args, standalone_mode=False, prog_name="financas")
+        except click.ClickException as e:
+            click.echo(f"❌ Linha {num_linha}: {e.format_message()}", err=True)
+        except Exception as e:
+            click.echo(f"❌ Linha {num_linha}: {e}", err=True)
+
+
 if __name__ == "__main__":
     cli()
@@ -0,0 +1,14 @@
+"""
+Geração de identificadores únicos para os modelos.
+
+`os.urandom(16).hex()` produz 128 bits de aleatoriedade — a mesma
+entropia de um UUID4 — sem construir o objeto UUID nem formatar a
+versão com hífens, o que barateia a criação em massa de instâncias.
+"""
+
+import os
+
+
+def novo_id() -> str:
+    """Retorna um identificador hexadecimal aleatório de 32 caracteres."""
+    return os.urandom(16).hex()
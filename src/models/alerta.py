@@ -3,18 +3,36 @@ Módulo de Alertas - Sistema de notificações do sistema financeiro.
 """
 
 from datetime import datetime
-from enum import Enum
+from enum import IntEnum
+from ._ids import novo_id
 from typing import Optional
-import uuid
 
 
-class TipoAlerta(Enum):
-    """Enum para tipos de alerta."""
-    ALTO_VALOR = "ALTO_VALOR"
-    LIMITE_EXCEDIDO = "LIMITE_EXCEDIDO"
-    DEFICIT_ORCAMENTARIO = "DEFICIT_ORCAMENTARIO"
-    SALDO_NEGATIVO = "SALDO_NEGATIVO"
-    META_NAO_ATINGIDA = "META_NAO_ATINGIDA"
+class TipoAlerta(IntEnum):
+    """Enum para tipos de alerta (IntEnum: comparações no fast path de int)."""
+    ALTO_VALOR = 1
+    LIMITE_EXCEDIDO = 2
+    DEFICIT_ORCAMENTARIO = 3
+    SALDO_NEGATIVO = 4
+    META_NAO_ATINGIDA = 5
+
+
+# Severidade por tipo de alerta, construída uma única vez no import
+# (1 = informativo, 2 = atenção, 3 = crítico).
+_SEVERIDADE = {
+    TipoAlerta.ALTO_VALOR: 1,
+    TipoAlerta.META_NAO_ATINGIDA: 2,
+    TipoAlerta.LIMITE_EXCEDIDO: 2,
+    TipoAlerta.SALDO_NEGATIVO: 3,
+    TipoAlerta.DEFICIT_ORCAMENTARIO: 3,
+}
+
+# Membros por rótulo persistido (nome ou int), para que from_dict não
+# pague o __call__ da metaclasse de Enum por alerta desserializado
+_TIPO_POR_ROTULO = {
+    **{m.name: m for m in TipoAlerta},
+    **{m.value: m for m in TipoAlerta},
+}
 
 
 class Alerta:
@@ -31,7 +49,23 @@ class Alerta:
         mes_ano: Mês/ano de referência (se aplicável)
         lido: Indica se o alerta foi lido/visualizado
     """
-    
+
+    __slots__ = (
+        "_id",
+        "_tipo",
+        "_mensagem",
+        "_data_criacao",
+        "_lancamento_id",
+        "_categoria_id",
+        "_mes_ano",
+        "_lido",
+        "_nivel_severidade",
+        "_sort_key",
+        "_tipo_value",
+        "_data_criacao_iso",
+        "_dict_cache",
+    )
+
     def __init__(
         self,
         tipo: TipoAlerta,
@@ -43,18 +77,25 @@ class Alerta:
         data_criacao: Optional[datetime] = None,
         lido: bool = False
     ):
-        self._id = id or str(uuid.uuid4())
-        self._tipo = None
-        self._mensagem = None
+        if not isinstance(tipo, TipoAlerta):
+            raise TypeError("Tipo deve ser um TipoAlerta válido.")
+        if not mensagem or not isinstance(mensagem, str):
+            raise ValueError("Mensagem do alerta é obrigatória.")
+        self._id = id or novo_id()
+        self._tipo = tipo
+        self._tipo_value = tipo.name  # Rótulo serializado/exibido
+        self._nivel_severidade = _SEVERIDADE.get(tipo, 1)
+        self._mensagem = mensagem.strip()
         self._data_criacao = data_criacao or datetime.now()
+        # Chave de ordenação pré-computada: mais severo primeiro,
+        # depois mais recente primeiro
+        self._sort_key = (-self._nivel_severidade, -self._data_criacao.timestamp())
         self._lancamento_id = lancamento_id
         self._categoria_id = categoria_id
         self._mes_ano = mes_ano
         self._lido = lido
-        
-        # Usar setters para validação
-        self.tipo = tipo
-        self.mensagem = mensagem
+        self._data_criacao_iso = None
+        self._dict_cache = None
     
     # ==================== PROPRIEDADES ====================
     
@@ -65,28 +106,14 @@ class Alerta:
     
     @property
     def tipo(self) -> TipoAlerta:
-        """Retorna o tipo do alerta."""
+        """Retorna o tipo do alerta (somente leitura)."""
         return self._tipo
-    
-    @tipo.setter
-    def tipo(self, valor: TipoAlerta) -> None:
-        """Define o tipo do alerta com validação."""
-        if not isinstance(valor, TipoAlerta):
-            raise TypeError("Tipo deve ser um TipoAlerta válido.")
-        self._tipo = valor
-    
+
     @property
     def mensagem(self) -> str:
-        """Retorna a mensagem do alerta."""
+        """Retorna a mensagem do alerta (somente leitura)."""
         return self._mensagem
-    
-    @mensagem.setter
-    def mensagem(self, valor: str) -> None:
-        """Define a mensagem do alerta."""
-        if not valor or not isinstance(valor, str):
-            raise ValueError("Mensagem do alerta é obrigatória.")
-        self._mensagem = valor.strip()
-    
+
     @property
     def data_criacao(self) -> datetime:
         """Retorna a data de criação do alerta."""
@@ -109,19 +136,15 @@ class Alerta:
     
     @property
     def lido(self) -> bool:
-        """Retorna se o alerta foi lido."""
+        """Retorna se o alerta foi lido (mude via marcar_como_lido)."""
         return self._lido
-    
-    @lido.setter
-    def lido(self, valor: bool) -> None:
-        """Define se o alerta foi lido."""
-        self._lido = bool(valor)
-    
+
     # ==================== MÉTODOS ====================
     
     def marcar_como_lido(self) -> None:
         """Marca o alerta como lido."""
         self._lido = True
+        self._dict_cache = None
     
     @property
     def nivel_severidade(self) -> int:
@@ -133,21 +156,16 @@ class Alerta:
             2: Atenção
             3: Crítico
         """
-        severidades = {
-            TipoAlerta.ALTO_VALOR: 1,
-            TipoAlerta.META_NAO_ATINGIDA: 2,
-            TipoAlerta.LIMITE_EXCEDIDO: 2,
-            TipoAlerta.SALDO_NEGATIVO: 3,
-            TipoAlerta.DEFICIT_ORCAMENTARIO: 3,
-        }
-        return severidades.get(self._tipo, 1)
+        return self._nivel_severidade
     
     # ==================== MÉTODOS ESPECIAIS ====================
     
     def __str__(self) -> str:
         """Representação amigável do alerta."""
+        # Concatenação simples com o rótulo já cacheado: evita o custo de
+        # interpolação ao renderizar listas grandes de alertas
         status = "✓" if self._lido else "●"
-        return f"[{status}] {self._tipo.value}: {self._mensagem}"
+        return "[" + status + "] " + self._tipo_value + ": " + self._mensagem
     
     def __repr__(self) -> str:
         """Representação técnica do alerta."""
@@ -166,36 +184,81 @@ class Alerta:
         """Hash baseado no ID."""
         return hash(self._id)
     
+    @property
+    def sort_key(self) -> tuple[int, float]:
+        """Chave de ordenação pré-computada (para list.sort(key=...))."""
+        return self._sort_key
+
     def __lt__(self, other: "Alerta") -> bool:
         """Ordenação por severidade (mais severo primeiro), depois por data."""
         if not isinstance(other, Alerta):
             return NotImplemented
-        if self.nivel_severidade != other.nivel_severidade:
-            return self.nivel_severidade > other.nivel_severidade
-        return self._data_criacao > other._data_criacao
+        return self._sort_key < other._sort_key
     
     # ==================== MÉTODOS DE SERIALIZAÇÃO ====================
     
     def to_dict(self) -> dict:
         """Converte o alerta para dicionário (serialização)."""
-        return {
-            "id": self._id,
-            "tipo": self._tipo.value,
-            "mensagem": self._mensagem,
-            "data_criacao": self._data_criacao.isoformat(),
-            "lancamento_id": self._lancamento_id,
-            "categoria_id": self._categoria_id,
-            "mes_ano": list(self._mes_ano) if self._mes_ano else None,
-            "lido": self._lido,
-        }
+        # Dicionário cacheado até o alerta mudar de estado (lido); o
+        # mes_ano segue como tupla, que o json.dumps emite como array
+        data = self._dict_cache
+        if data is None:
+            if self._data_criacao_iso is None:
+                self._data_criacao_iso = self._data_criacao.isoformat()
+            data = self._dict_cache = {
+                "id": self._id,
+                "tipo": self._tipo_value,
+                "mensagem": self._mensagem,
+                "data_criacao": self._data_criacao_iso,
+                "lancamento_id": self._lancamento_id,
+                "categoria_id": self._categoria_id,
+                "mes_ano": self._mes_ano,
+                "lido": self._lido,
+            }
+        return data
     
+    @classmethod
+    def _unchecked(
+        cls,
+        id: Optional[str],
+        tipo: TipoAlerta,
+        mensagem: str,
+        data_criacao: Optional[datetime],
+        lancamento_id: Optional[str],
+        categoria_id: Optional[str],
+        mes_ano: Optional[tuple[int, int]],
+        lido: bool
+    ) -> "Alerta":
+        """
+        Constrói um alerta sem passar pelos setters de validação.
+
+        Caminho rápido para desserialização em massa de dados já
+        validados na gravação (ver from_dict).
+        """
+        obj = cls.__new__(cls)
+        obj._id = id or novo_id()
+        obj._tipo = tipo
+        obj._tipo_value = tipo.name
+        obj._nivel_severidade = _SEVERIDADE.get(tipo, 1)
+        obj._data_criacao_iso = None
+        obj._mensagem = mensagem
+        obj._data_criacao = data_criacao or datetime.now()
+        obj._sort_key = (-obj._nivel_severidade, -obj._data_criacao.timestamp())
+        obj._lancamento_id = lancamento_id
+        obj._categoria_id = categoria_id
+        obj._mes_ano = mes_ano
+        obj._lido = lido
+        obj._dict_cache = None
+        return obj
+
     @classmethod
     def from_dict(cls, data: dict) -> "Alerta":
         """Cria um alerta a partir de um dicionário."""
         mes_ano = tuple(data["mes_ano"]) if data.get("mes_ano") else None
-        return cls(
+        return cls._unchecked(
             id=data.get("id"),
-            tipo=TipoAlerta(data["tipo"]),
+            # Aceita tanto o nome (formato persistido) quanto o int
+            tipo=_TIPO_POR_ROTULO[data["tipo"]],
             mensagem=data["mensagem"],
             data_criacao=datetime.fromisoformat(data["data_criacao"]) if data.get("data_criacao") else None,
             lancamento_id=data.get("lancamento_id"),
@@ -4,7 +4,7 @@ Módulo de Categoria - Gerencia categorias de receitas e despesas.
 
 from enum import Enum
 from typing import Optional
-import uuid
+from ._ids import novo_id
 
 
 class TipoCategoria(Enum):
@@ -13,10 +13,19 @@ class TipoCategoria(Enum):
     DESPESA = "DESPESA"
 
 
+# Membros por valor persistido, para que from_dict não pague o __call__
+# da metaclasse de Enum por categoria desserializada
+_TIPO_POR_VALOR = {m.value: m for m in TipoCategoria}
+
+
 class Categoria:
     """
     Classe que representa uma categoria de lançamento financeiro.
-    
+
+    Os atributos são slots públicos validados na construção (e em
+    atualizar(), único caminho de edição: reatribuições diretas são
+    bloqueadas), sem a indireção de properties no caminho de leitura.
+
     Attributes:
         id: Identificador único da categoria
         nome: Nome da categoria
@@ -24,7 +33,12 @@ class Categoria:
         limite_mensal: Limite de gastos mensais (apenas para DESPESA)
         descricao: Descrição opcional da categoria
     """
-    
+
+    __slots__ = (
+        "id", "nome", "tipo", "limite_mensal", "descricao",
+        "_str_cache", "_nome_lower", "_dict_cache", "_hash",
+    )
+
     def __init__(
         self,
         nome: str,
@@ -33,128 +47,149 @@ class Categoria:
         descricao: Optional[str] = None,
         id: Optional[str] = None
     ):
-        self._id = id or str(uuid.uuid4())
-        self._nome = None
-        self._tipo = None
-        self._limite_mensal = None
-        self._descricao = descricao
-        
-        # Usar setters para validação
-        self.nome = nome
-        self.tipo = tipo
-        self.limite_mensal = limite_mensal
-    
-    # ==================== PROPRIEDADES ====================
-    
-    @property
-    def id(self) -> str:
-        """Retorna o ID da categoria (somente leitura)."""
-        return self._id
-    
-    @property
-    def nome(self) -> str:
-        """Retorna o nome da categoria."""
-        return self._nome
-    
-    @nome.setter
-    def nome(self, valor: str) -> None:
-        """Define o nome da categoria com validação."""
+        # Escritas via object.__setattr__: __setattr__ é bloqueado para
+        # que só atualizar() altere a instância (ver abaixo)
+        _set = object.__setattr__
+        _set(self, "id", id or novo_id())
+        nome = self._validar_nome(nome)
+        _set(self, "nome", nome)
+        # Forma minúscula cacheada: __eq__/__lt__ comparam sem alocar strings
+        _set(self, "_nome_lower", nome.lower())
+        _set(self, "tipo", self._validar_tipo(tipo))
+        _set(self, "limite_mensal", self._validar_limite(tipo, limite_mensal))
+        _set(self, "descricao", descricao.strip() if descricao else None)
+        _set(self, "_str_cache", None)
+        _set(self, "_dict_cache", None)
+        _set(self, "_hash", None)
+
+    def __setattr__(self, nome: str, valor: object) -> None:
+        """
+        Bloqueia reatribuições diretas.
+
+        Os índices por nome e a ordenação das listagens dependem dos
+        campos da categoria; edições passam por atualizar(), que
+        revalida e permite à camada de serviço migrar os índices.
+        """
+        raise AttributeError(
+            f"Categoria é imutável fora de atualizar(); "
+            f"não é possível reatribuir {nome!r}."
+        )
+
+    # ==================== VALIDAÇÃO ====================
+
+    @staticmethod
+    def _validar_nome(valor: str) -> str:
+        """Valida o nome da categoria e retorna a forma normalizada."""
         if not valor or not isinstance(valor, str):
             raise ValueError("Nome da categoria é obrigatório e deve ser uma string.")
         if len(valor.strip()) < 2:
             raise ValueError("Nome da categoria deve ter pelo menos 2 caracteres.")
-        self._nome = valor.strip()
-    
-    @property
-    def tipo(self) -> TipoCategoria:
-        """Retorna o tipo da categoria."""
-        return self._tipo
-    
-    @tipo.setter
-    def tipo(self, valor: TipoCategoria) -> None:
-        """Define o tipo da categoria com validação."""
+        return valor.strip()
+
+    @staticmethod
+    def _validar_tipo(valor: TipoCategoria) -> TipoCategoria:
+        """Valida o tipo da categoria."""
         if not isinstance(valor, TipoCategoria):
             raise TypeError("Tipo deve ser um TipoCategoria válido.")
-        self._tipo = valor
-    
-    @property
-    def limite_mensal(self) -> Optional[float]:
-        """Retorna o limite mensal da categoria."""
-        return self._limite_mensal
-    
-    @limite_mensal.setter
-    def limite_mensal(self, valor: Optional[float]) -> None:
-        """Define o limite mensal com validação."""
+        return valor
+
+    @staticmethod
+    def _validar_limite(
+        tipo: TipoCategoria, valor: Optional[float]
+    ) -> Optional[float]:
+        """Valida o limite mensal para o tipo de categoria."""
         if valor is not None:
             # Categorias de receita não podem ter limite
-            if self._tipo == TipoCategoria.RECEITA:
+            if tipo == TipoCategoria.RECEITA:
                 raise ValueError("Categorias de receita não podem ter limite de gastos.")
             if not isinstance(valor, (int, float)):
                 raise TypeError("Limite mensal deve ser um número.")
             if valor <= 0:
                 raise ValueError("Limite mensal deve ser maior que zero.")
-        self._limite_mensal = float(valor) if valor is not None else None
-    
-    @property
-    def descricao(self) -> Optional[str]:
-        """Retorna a descrição da categoria."""
-        return self._descricao
-    
-    @descricao.setter
-    def descricao(self, valor: Optional[str]) -> None:
-        """Define a descrição da categoria."""
-        self._descricao = valor.strip() if valor else None
-    
+        return float(valor) if valor is not None else None
+
+    def atualizar(
+        self,
+        nome: Optional[str] = None,
+        limite_mensal: Optional[float] = None,
+        descricao: Optional[str] = None
+    ) -> None:
+        """Atualiza campos editáveis passando pelas mesmas validações."""
+        _set = object.__setattr__
+        if nome is not None:
+            nome = self._validar_nome(nome)
+            _set(self, "nome", nome)
+            _set(self, "_nome_lower", nome.lower())
+        if limite_mensal is not None:
+            _set(self, "limite_mensal", self._validar_limite(self.tipo, limite_mensal))
+        if descricao is not None:
+            _set(self, "descricao", descricao.strip() if descricao else None)
+        _set(self, "_str_cache", None)
+        _set(self, "_dict_cache", None)
+        _set(self, "_hash", None)
+
     # ==================== MÉTODOS ESPECIAIS ====================
-    
+
     def __str__(self) -> str:
-        """Representação amigável da categoria."""
-        limite_info = f" (Limite: R${self._limite_mensal:.2f})" if self._limite_mensal else ""
-        return f"{self._nome} [{self._tipo.value}]{limite_info}"
-    
+        """Representação amigável da categoria (formatada uma única vez)."""
+        if self._str_cache is None:
+            limite_info = f" (Limite: R${self.limite_mensal:.2f})" if self.limite_mensal else ""
+            object.__setattr__(
+                self, "_str_cache", f"{self.nome} [{self.tipo.value}]{limite_info}"
+            )
+        return self._str_cache
+
     def __repr__(self) -> str:
         """Representação técnica da categoria."""
         return (
-            f"Categoria(id={self._id!r}, nome={self._nome!r}, "
-            f"tipo={self._tipo!r}, limite_mensal={self._limite_mensal!r}, "
-            f"descricao={self._descricao!r})"
+            f"Categoria(id={self.id!r}, nome={self.nome!r}, "
+            f"tipo={self.tipo!r}, limite_mensal={self.limite_mensal!r}, "
+            f"descricao={self.descricao!r})"
         )
-    
+
     def __eq__(self, other: object) -> bool:
         """Compara categorias pelo nome e tipo."""
         if not isinstance(other, Categoria):
             return NotImplemented
-        return self._nome.lower() == other._nome.lower() and self._tipo == other._tipo
-    
+        return self._nome_lower == other._nome_lower and self.tipo == other.tipo
+
     def __hash__(self) -> int:
-        """Hash baseado no ID."""
-        return hash(self._id)
-    
+        """Hash baseado no ID, cacheado na primeira chamada (o ID não muda)."""
+        h = self._hash
+        if h is None:
+            h = hash(self.id)
+            object.__setattr__(self, "_hash", h)
+        return h
+
     def __lt__(self, other: "Categoria") -> bool:
         """Ordenação por nome."""
         if not isinstance(other, Categoria):
             return NotImplemented
-        return self._nome.lower() < other._nome.lower()
-    
+        return self._nome_lower < other._nome_lower
+
     # ==================== MÉTODOS DE SERIALIZAÇÃO ====================
-    
+
     def to_dict(self) -> dict:
-        """Converte a categoria para dicionário (serialização)."""
-        return {
-            "id": self._id,
-            "nome": self._nome,
-            "tipo": self._tipo.value,
-            "limite_mensal": self._limite_mensal,
-            "descricao": self._descricao,
-        }
-    
+        """Converte a categoria para dicionário (cacheado até atualizar())."""
+        data = self._dict_cache
+        if data is None:
+            data = {
+                "id": self.id,
+                "nome": self.nome,
+                "tipo": self.tipo.value,
+                "limite_mensal": self.limite_mensal,
+                "descricao": self.descricao,
+            }
+            object.__setattr__(self, "_dict_cache", data)
+        return data
+
     @classmethod
     def from_dict(cls, data: dict) -> "Categoria":
         """Cria uma categoria a partir de um dicionário."""
         return cls(
             id=data.get("id"),
             nome=data["nome"],
-            tipo=TipoCategoria(data["tipo"]),
+            tipo=_TIPO_POR_VALOR[data["tipo"]],
             limite_mensal=data.get("limite_mensal"),
             descricao=data.get("descricao"),
         )
@@ -3,27 +3,59 @@ Módulo de Lançamentos - Classes base e especializadas para receitas e despesas
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from datetime import date, datetime
-from enum import Enum
-from typing import Optional, TYPE_CHECKING
-import uuid
+from enum import IntEnum
+from typing import Optional
+from ._ids import novo_id
 
-if TYPE_CHECKING:
-    from .categoria import Categoria
+from .categoria import Categoria, TipoCategoria
 
 
-class FormaPagamento(Enum):
-    """Enum para formas de pagamento."""
-    DINHEIRO = "DINHEIRO"
-    DEBITO = "DEBITO"
-    CREDITO = "CREDITO"
-    PIX = "PIX"
+class _ROList(Sequence):
+    """
+    Visão somente leitura de uma lista interna.
+
+    Substitui o `.copy()` defensivo das propriedades de coleção: o
+    chamador pode iterar, indexar e medir sem que cada acesso pague a
+    alocação de uma lista nova.
+    """
+
+    __slots__ = ("_l",)
+
+    def __init__(self, lista: list):
+        self._l = lista
+
+    def __getitem__(self, indice):
+        return self._l[indice]
+
+    def __len__(self) -> int:
+        return len(self._l)
+
+    def __iter__(self):
+        return iter(self._l)
+
+    def __repr__(self) -> str:
+        return repr(self._l)
+
+
+class FormaPagamento(IntEnum):
+    """Enum para formas de pagamento (IntEnum: comparações no fast path de int)."""
+    DINHEIRO = 1
+    DEBITO = 2
+    CREDITO = 3
+    PIX = 4
 
 
 class Lancamento(ABC):
     """
     Classe base abstrata para lançamentos financeiros.
-    
+
+    Os atributos são slots públicos validados na construção e congelados
+    depois dela, sem a indireção de properties nos caminhos de leitura
+    quentes (agregações e agrupamentos leem valor/categoria/data
+    diretamente).
+
     Attributes:
         id: Identificador único do lançamento
         valor: Valor do lançamento (deve ser > 0)
@@ -32,177 +64,221 @@ class Lancamento(ABC):
         descricao: Descrição do lançamento
         forma_pagamento: Forma de pagamento utilizada
     """
-    
+
+    __slots__ = (
+        "id", "valor", "categoria", "data", "descricao", "forma_pagamento",
+        "_data_br", "_descricao_lower", "_mes_ano", "_dict_cache", "_hash",
+    )
+
     def __init__(
         self,
         valor: float,
-        categoria: "Categoria",
+        categoria: Categoria,
         data: date,
         descricao: str,
         forma_pagamento: FormaPagamento,
         id: Optional[str] = None
     ):
-        self._id = id or str(uuid.uuid4())
-        self._valor = None
-        self._categoria = None
-        self._data = None
-        self._descricao = None
-        self._forma_pagamento = None
-        
-        # Usar setters para validação
-        self.valor = valor
-        self.categoria = categoria
-        self.data = data
-        self.descricao = descricao
-        self.forma_pagamento = forma_pagamento
-    
-    # ==================== PROPRIEDADES ====================
-    
-    @property
-    def id(self) -> str:
-        """Retorna o ID do lançamento (somente leitura)."""
-        return self._id
-    
-    @property
-    def valor(self) -> float:
-        """Retorna o valor do lançamento."""
-        return self._valor
-    
-    @valor.setter
-    def valor(self, valor: float) -> None:
-        """Define o valor do lançamento com validação."""
+        # Escritas via object.__setattr__: __setattr__ é bloqueado para
+        # congelar a instância após a construção (ver abaixo)
+        _set = object.__setattr__
+        _set(self, "id", id or novo_id())
+        _set(self, "valor", self._validar_valor(valor))
+        _set(self, "categoria", self._validar_categoria_base(categoria))
+        data = self._validar_data(data)
+        _set(self, "data", data)
+        # Derivados da data cacheados na construção: data pt-BR para
+        # __str__ e tupla (mês, ano) para agrupamentos/validações
+        _set(self, "_data_br", f"{data.day:02d}/{data.month:02d}/{data.year}")
+        _set(self, "_mes_ano", (data.month, data.year))
+        descricao = self._validar_descricao(descricao)
+        _set(self, "descricao", descricao)
+        # Forma minúscula cacheada: __eq__ compara sem alocar strings
+        _set(self, "_descricao_lower", descricao.lower())
+        _set(self, "forma_pagamento", self._validar_forma_pagamento(forma_pagamento))
+        _set(self, "_dict_cache", None)
+        _set(self, "_hash", None)
+
+    def __setattr__(self, nome: str, valor: object) -> None:
+        """
+        Bloqueia reatribuições após a construção.
+
+        Os agregados incrementais e os índices por ID/mês/categoria
+        assumem que valor, data e categoria não mudam depois que o
+        lançamento é registrado; congelar a instância elimina essa
+        classe de corrupção sem custo nos caminhos de leitura.
+        """
+        raise AttributeError(
+            f"{self.__class__.__name__} é imutável; "
+            f"não é possível reatribuir {nome!r}."
+        )
+
+    # ==================== VALIDAÇÃO ====================
+
+    @staticmethod
+    def _validar_valor(valor: float) -> float:
+        """Valida o valor do lançamento."""
         if not isinstance(valor, (int, float)):
             raise TypeError("Valor deve ser um número.")
         if valor <= 0:
             raise ValueError("Valor do lançamento deve ser maior que zero.")
-        self._valor = float(valor)
-    
-    @property
-    def categoria(self) -> "Categoria":
-        """Retorna a categoria do lançamento."""
-        return self._categoria
-    
-    @categoria.setter
-    def categoria(self, valor: "Categoria") -> None:
-        """Define a categoria do lançamento com validação."""
-        from .categoria import Categoria
+        return float(valor)
+
+    def _validar_categoria_base(self, valor: Categoria) -> Categoria:
+        """Valida a categoria e delega a checagem de tipo à subclasse."""
         if not isinstance(valor, Categoria):
             raise TypeError("Categoria deve ser uma instância de Categoria.")
         self._validar_categoria(valor)
-        self._categoria = valor
-    
+        return valor
+
     @abstractmethod
-    def _validar_categoria(self, categoria: "Categoria") -> None:
+    def _validar_categoria(self, categoria: Categoria) -> None:
         """Valida se a categoria é compatível com o tipo de lançamento."""
         pass
-    
-    @property
-    def data(self) -> date:
-        """Retorna a data do lançamento."""
-        return self._data
-    
-    @data.setter
-    def data(self, valor: date) -> None:
-        """Define a data do lançamento com validação."""
+
+    @staticmethod
+    def _validar_data(valor: date) -> date:
+        """Valida a data do lançamento."""
         if isinstance(valor, datetime):
             valor = valor.date()
         if not isinstance(valor, date):
             raise TypeError("Data deve ser uma instância de date ou datetime.")
-        self._data = valor
-    
-    @property
-    def descricao(self) -> str:
-        """Retorna a descrição do lançamento."""
-        return self._descricao
-    
-    @descricao.setter
-    def descricao(self, valor: str) -> None:
-        """Define a descrição do lançamento."""
+        return valor
+
+    @staticmethod
+    def _validar_descricao(valor: str) -> str:
+        """Valida a descrição do lançamento."""
         if not valor or not isinstance(valor, str):
             raise ValueError("Descrição é obrigatória.")
-        self._descricao = valor.strip()
-    
-    @property
-    def forma_pagamento(self) -> FormaPagamento:
-        """Retorna a forma de pagamento."""
-        return self._forma_pagamento
-    
-    @forma_pagamento.setter
-    def forma_pagamento(self, valor: FormaPagamento) -> None:
-        """Define a forma de pagamento com validação."""
+        return valor.strip()
+
+    @staticmethod
+    def _validar_forma_pagamento(valor: FormaPagamento) -> FormaPagamento:
+        """Valida a forma de pagamento."""
         if not isinstance(valor, FormaPagamento):
             raise TypeError("Forma de pagamento deve ser um FormaPagamento válido.")
-        self._forma_pagamento = valor
-    
+        return valor
+
+    # ==================== PROPRIEDADES DERIVADAS ====================
+
     @property
     def mes_ano(self) -> tuple[int, int]:
-        """Retorna a tupla (mês, ano) do lançamento."""
-        return (self._data.month, self._data.year)
-    
+        """Retorna a tupla (mês, ano) do lançamento (cacheada)."""
+        return self._mes_ano
+
     @property
     @abstractmethod
     def tipo(self) -> str:
         """Retorna o tipo do lançamento (RECEITA ou DESPESA)."""
         pass
-    
+
     # ==================== MÉTODOS ESPECIAIS ====================
-    
+
     def __str__(self) -> str:
         """Representação amigável do lançamento."""
         return (
-            f"{self.tipo}: R${self._valor:.2f} - {self._descricao} "
-            f"({self._data.strftime('%d/%m/%Y')}) [{self._categoria.nome}]"
+            f"{self.tipo}: R${self.valor:.2f} - {self.descricao} "
+            f"({self._data_br}) [{self.categoria.nome}]"
         )
-    
+
     def __repr__(self) -> str:
         """Representação técnica do lançamento."""
         return (
-            f"{self.__class__.__name__}(id={self._id!r}, valor={self._valor!r}, "
-            f"categoria={self._categoria.nome!r}, data={self._data!r}, "
-            f"descricao={self._descricao!r}, forma_pagamento={self._forma_pagamento!r})"
+            f"{self.__class__.__name__}(id={self.id!r}, valor={self.valor!r}, "
+            f"categoria={self.categoria.nome!r}, data={self.data!r}, "
+            f"descricao={self.descricao!r}, forma_pagamento={self.forma_pagamento!r})"
         )
-    
+
     def __eq__(self, other: object) -> bool:
         """Compara lançamentos pelo ID ou pela combinação de data + descrição."""
         if not isinstance(other, Lancamento):
             return NotImplemented
-        return self._id == other._id or (
-            self._data == other._data and 
-            self._descricao.lower() == other._descricao.lower()
+        return self.id == other.id or (
+            self.data == other.data and
+            self._descricao_lower == other._descricao_lower
         )
-    
+
     def __hash__(self) -> int:
-        """Hash baseado no ID."""
-        return hash(self._id)
-    
+        """Hash baseado no ID, cacheado na primeira chamada (instância congelada)."""
+        h = self._hash
+        if h is None:
+            h = hash(self.id)
+            object.__setattr__(self, "_hash", h)
+        return h
+
     def __lt__(self, other: "Lancamento") -> bool:
         """Ordenação por data (mais antigo primeiro), depois por valor."""
         if not isinstance(other, Lancamento):
             return NotImplemented
-        if self._data == other._data:
-            return self._valor < other._valor
-        return self._data < other._data
-    
+        if self.data == other.data:
+            return self.valor < other.valor
+        return self.data < other.data
+
     def __add__(self, other: "Lancamento") -> float:
         """Soma valores de lançamentos do mesmo tipo."""
         if not isinstance(other, Lancamento):
             return NotImplemented
         if type(self) != type(other):
             raise TypeError("Só é possível somar lançamentos do mesmo tipo.")
-        return self._valor + other._valor
-    
+        return self.valor + other.valor
+
     # ==================== MÉTODOS DE SERIALIZAÇÃO ====================
-    
+
+    @classmethod
+    def _unchecked(
+        cls,
+        id: Optional[str],
+        valor: float,
+        categoria: Categoria,
+        data: date,
+        descricao: str,
+        forma_pagamento: FormaPagamento,
+    ) -> "Lancamento":
+        """
+        Constrói um lançamento sem passar pelas validações.
+
+        Caminho rápido para desserialização em massa de dados já
+        validados na gravação (mesmo padrão do _unchecked de Alerta).
+        """
+        obj = cls.__new__(cls)
+        _set = object.__setattr__
+        _set(obj, "id", id or novo_id())
+        _set(obj, "valor", valor)
+        _set(obj, "categoria", categoria)
+        _set(obj, "data", data)
+        _set(obj, "_data_br", f"{data.day:02d}/{data.month:02d}/{data.year}")
+        _set(obj, "_mes_ano", (data.month, data.year))
+        _set(obj, "descricao", descricao)
+        _set(obj, "_descricao_lower", descricao.lower())
+        _set(obj, "forma_pagamento", forma_pagamento)
+        _set(obj, "_dict_cache", None)
+        _set(obj, "_hash", None)
+        return obj
+
     def to_dict(self) -> dict:
-        """Converte o lançamento para dicionário (serialização)."""
+        """
+        Converte o lançamento para dicionário (serialização).
+
+        O dicionário é montado uma vez e cacheado: como a instância é
+        congelada, cada regravação completa do arquivo reaproveita os
+        dicts já construídos em vez de realocar N deles.
+        """
+        data = self._dict_cache
+        if data is None:
+            data = self._montar_dict()
+            object.__setattr__(self, "_dict_cache", data)
+        return data
+
+    def _montar_dict(self) -> dict:
+        """Monta o dicionário de serialização (sem cache)."""
         return {
-            "id": self._id,
+            "id": self.id,
             "tipo": self.tipo,
-            "valor": self._valor,
-            "categoria_id": self._categoria.id,
-            "data": self._data.isoformat(),
-            "descricao": self._descricao,
-            "forma_pagamento": self._forma_pagamento.value,
+            "valor": self.valor,
+            "categoria_id": self.categoria.id,
+            "data": self.data.isoformat(),
+            "descricao": self.descricao,
+            "forma_pagamento": self.forma_pagamento.name,
         }
 
 
@@ -211,13 +287,14 @@ class Receita(Lancamento):
     Classe que representa uma receita (entrada de dinheiro).
     Herda de Lancamento.
     """
-    
-    def _validar_categoria(self, categoria: "Categoria") -> None:
+
+    __slots__ = ()
+
+    def _validar_categoria(self, categoria: Categoria) -> None:
         """Valida se a categoria é do tipo RECEITA."""
-        from .categoria import TipoCategoria
         if categoria.tipo != TipoCategoria.RECEITA:
             raise ValueError("Receitas devem ter categoria do tipo RECEITA.")
-    
+
     @property
     def tipo(self) -> str:
         """Retorna o tipo do lançamento."""
@@ -228,66 +305,85 @@ class Despesa(Lancamento):
     """
     Classe que representa uma despesa (saída de dinheiro).
     Herda de Lancamento.
-    
+
     Attributes:
         alerta_limite: Indica se a despesa excedeu o limite da categoria
     """
-    
+
+    __slots__ = ("_alertas",)
+
+    # Alerta de alto valor (configurável, padrão R$500)
+    LIMITE_ALTO_VALOR: float = 500.0
+
     def __init__(
         self,
         valor: float,
-        categoria: "Categoria",
+        categoria: Categoria,
         data: date,
         descricao: str,
         forma_pagamento: FormaPagamento,
         id: Optional[str] = None
     ):
         super().__init__(valor, categoria, data, descricao, forma_pagamento, id)
-        self._alertas: list[str] = []
-        self._verificar_alertas()
-    
-    def _validar_categoria(self, categoria: "Categoria") -> None:
+        # Lista criada apenas quando há alerta: o caso comum (valor
+        # pequeno) não paga a alocação
+        object.__setattr__(
+            self,
+            "_alertas",
+            ["ALTO_VALOR"] if self.valor > Despesa.LIMITE_ALTO_VALOR else None,
+        )
+
+    @classmethod
+    def _unchecked(cls, *args) -> "Despesa":
+        """Caminho rápido de desserialização (completa o slot de alertas)."""
+        obj = super()._unchecked(*args)
+        object.__setattr__(
+            obj,
+            "_alertas",
+            ["ALTO_VALOR"] if obj.valor > Despesa.LIMITE_ALTO_VALOR else None,
+        )
+        return obj
+
+    def _validar_categoria(self, categoria: Categoria) -> None:
         """Valida se a categoria é do tipo DESPESA."""
-        from .categoria import TipoCategoria
         if categoria.tipo != TipoCategoria.DESPESA:
             raise ValueError("Despesas devem ter categoria do tipo DESPESA.")
-    
+
     @property
     def tipo(self) -> str:
         """Retorna o tipo do lançamento."""
         return "DESPESA"
-    
+
     @property
-    def alertas(self) -> list[str]:
-        """Retorna a lista de alertas associados a esta despesa."""
-        return self._alertas.copy()
-    
-    def _verificar_alertas(self) -> None:
-        """Verifica e registra alertas para esta despesa."""
-        # Alerta de alto valor (configurável, padrão R$500)
-        LIMITE_ALTO_VALOR = 500.0
-        if self._valor > LIMITE_ALTO_VALOR:
-            self._alertas.append("ALTO_VALOR")
-    
+    def alertas(self) -> Sequence[str]:
+        """Retorna os alertas associados a esta despesa (visão somente leitura)."""
+        return _ROList(self._alertas) if self._alertas is not None else ()
+
     def verificar_limite_categoria(self, total_categoria_mes: float) -> bool:
         """
         Verifica se o total de despesas na categoria excedeu o limite.
-        
+
         Args:
             total_categoria_mes: Total já gasto na categoria no mês
-            
+
         Returns:
             True se excedeu o limite, False caso contrário
         """
-        if self._categoria.limite_mensal is not None:
-            if total_categoria_mes + self._valor > self._categoria.limite_mensal:
-                if "LIMITE_EXCEDIDO" not in self._alertas:
+        if self.categoria.limite_mensal is not None:
+            if total_categoria_mes + self.valor > self.categoria.limite_mensal:
+                if self._alertas is None:
+                    object.__setattr__(self, "_alertas", ["LIMITE_EXCEDIDO"])
+                elif "LIMITE_EXCEDIDO" not in self._alertas:
                     self._alertas.append("LIMITE_EXCEDIDO")
+                else:
+                    return True
+                object.__setattr__(self, "_dict_cache", None)
                 return True
         return False
-    
-    def to_dict(self) -> dict:
-        """Converte a despesa para dicionário (serialização)."""
-        data = super().to_dict()
-        data["alertas"] = self._alertas
+
+    def _montar_dict(self) -> dict:
+        """Monta o dicionário de serialização (inclui os alertas)."""
+        data = super()._montar_dict()
+        # Cópia da lista: o dict cacheado não pode mudar se _alertas mudar
+        data["alertas"] = list(self._alertas) if self._alertas else []
         return data
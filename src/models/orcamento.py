@@ -2,12 +2,14 @@
 Módulo de Orçamento Mensal - Gerencia o orçamento e lançamentos de um mês.
 """
 
+from bisect import insort
+from collections.abc import Sequence
 from datetime import date
 from typing import Optional, Iterator
 from collections import defaultdict
-import uuid
+from ._ids import novo_id
 
-from .lancamento import Lancamento, Receita, Despesa, FormaPagamento
+from .lancamento import Lancamento, Receita, Despesa, FormaPagamento, _ROList
 from .categoria import Categoria, TipoCategoria
 from .alerta import Alerta, TipoAlerta
 
@@ -25,7 +27,16 @@ class OrcamentoMensal:
         lancamentos: Lista de lançamentos do mês
         alertas: Lista de alertas gerados
     """
-    
+
+    __slots__ = (
+        "_id", "_mes", "_ano", "_mes_ano", "_receitas_previstas",
+        "_lancamentos", "_alertas",
+        "_sum_receitas", "_sum_despesas", "_sum_por_categoria",
+        "_receitas", "_despesas",
+        "_despesas_por_cat", "_despesas_por_forma",
+        "_por_id", "_chaves_duplicidade", "_has_deficit_alert",
+    )
+
     def __init__(
         self,
         mes: int,
@@ -33,12 +44,36 @@ class OrcamentoMensal:
         receitas_previstas: float = 0.0,
         id: Optional[str] = None
     ):
-        self._id = id or str(uuid.uuid4())
+        self._id = id or novo_id()
         self._mes = None
         self._ano = None
+        self._mes_ano = None
         self._receitas_previstas = None
         self._lancamentos: list[Lancamento] = []
         self._alertas: list[Alerta] = []
+
+        # Agregados mantidos incrementalmente (ver _vincular_lancamento):
+        # as propriedades de totais viram leituras O(1)
+        self._sum_receitas = 0.0
+        self._sum_despesas = 0.0
+        self._sum_por_categoria: dict[str, float] = defaultdict(float)
+        self._receitas: list[Receita] = []
+        self._despesas: list[Despesa] = []
+
+        # Agrupamentos de despesas mantidos incrementalmente. As chaves
+        # são a própria Categoria e o membro de FormaPagamento (hash de
+        # int), não strings; os nomes só são resolvidos no relatório.
+        # Dicts planos: o relatório devolve comprehensions sem o par
+        # defaultdict-e-desembrulho por chamada.
+        self._despesas_por_cat: dict[Categoria, float] = {}
+        self._despesas_por_forma: dict[FormaPagamento, float] = {}
+
+        # Índices para busca e checagem de duplicidade em O(1)
+        self._por_id: dict[str, Lancamento] = {}
+        self._chaves_duplicidade: set[tuple[date, str]] = set()
+
+        # Flag que substitui a varredura linear de alertas de déficit
+        self._has_deficit_alert = False
         
         # Usar setters para validação
         self.mes = mes
@@ -63,6 +98,7 @@ class OrcamentoMensal:
         if not isinstance(valor, int) or not 1 <= valor <= 12:
             raise ValueError("Mês deve ser um inteiro entre 1 e 12.")
         self._mes = valor
+        self._mes_ano = (valor, self._ano)
     
     @property
     def ano(self) -> int:
@@ -75,6 +111,7 @@ class OrcamentoMensal:
         if not isinstance(valor, int) or valor < 1900 or valor > 2100:
             raise ValueError("Ano deve ser um inteiro válido (1900-2100).")
         self._ano = valor
+        self._mes_ano = (self._mes, valor)
     
     @property
     def receitas_previstas(self) -> float:
@@ -91,37 +128,31 @@ class OrcamentoMensal:
         self._receitas_previstas = float(valor)
     
     @property
-    def lancamentos(self) -> list[Lancamento]:
-        """Retorna a lista de lançamentos (cópia)."""
-        return self._lancamentos.copy()
-    
+    def lancamentos(self) -> Sequence[Lancamento]:
+        """Retorna os lançamentos do mês (visão somente leitura)."""
+        return _ROList(self._lancamentos)
+
     @property
-    def alertas(self) -> list[Alerta]:
-        """Retorna a lista de alertas (cópia)."""
-        return self._alertas.copy()
+    def alertas(self) -> Sequence[Alerta]:
+        """Retorna os alertas do mês (visão somente leitura)."""
+        return _ROList(self._alertas)
     
     @property
     def mes_ano(self) -> tuple[int, int]:
-        """Retorna a tupla (mês, ano)."""
-        return (self._mes, self._ano)
+        """Retorna a tupla (mês, ano) (cacheada pelos setters)."""
+        return self._mes_ano
     
     # ==================== PROPRIEDADES CALCULADAS ====================
     
     @property
     def total_receitas(self) -> float:
-        """Calcula o total de receitas do mês."""
-        return sum(
-            lanc.valor for lanc in self._lancamentos 
-            if isinstance(lanc, Receita)
-        )
-    
+        """Retorna o total de receitas do mês (agregado incremental)."""
+        return self._sum_receitas
+
     @property
     def total_despesas(self) -> float:
-        """Calcula o total de despesas do mês."""
-        return sum(
-            lanc.valor for lanc in self._lancamentos 
-            if isinstance(lanc, Despesa)
-        )
+        """Retorna o total de despesas do mês (agregado incremental)."""
+        return self._sum_despesas
     
     @property
     def saldo(self) -> float:
@@ -139,14 +170,14 @@ class OrcamentoMensal:
         return self.saldo < 0
     
     @property
-    def receitas(self) -> list[Receita]:
-        """Retorna apenas as receitas do mês."""
-        return [lanc for lanc in self._lancamentos if isinstance(lanc, Receita)]
-    
+    def receitas(self) -> Sequence[Receita]:
+        """Retorna apenas as receitas do mês (visão somente leitura)."""
+        return _ROList(self._receitas)
+
     @property
-    def despesas(self) -> list[Despesa]:
-        """Retorna apenas as despesas do mês."""
-        return [lanc for lanc in self._lancamentos if isinstance(lanc, Despesa)]
+    def despesas(self) -> Sequence[Despesa]:
+        """Retorna apenas as despesas do mês (visão somente leitura)."""
+        return _ROList(self._despesas)
     
     # ==================== MÉTODOS DE GERENCIAMENTO ====================
     
@@ -170,8 +201,11 @@ class OrcamentoMensal:
                 f"ao orçamento de {self._mes:02d}/{self._ano}."
             )
         
-        # Verificar duplicidade
-        if lancamento in self._lancamentos:
+        # Verificar duplicidade (mesmo ID ou mesma data + descrição)
+        if (
+            lancamento.id in self._por_id
+            or (lancamento.data, lancamento._descricao_lower) in self._chaves_duplicidade
+        ):
             raise ValueError("Lançamento já existe neste orçamento.")
         
         alertas_gerados: list[Alerta] = []
@@ -194,75 +228,210 @@ class OrcamentoMensal:
                 )
                 alertas_gerados.append(alerta)
         
-        # Adicionar lançamento
-        self._lancamentos.append(lancamento)
-        self._lancamentos.sort()  # Manter ordenado por data
+        # Adicionar lançamento e atualizar agregados
+        self._vincular_lancamento(lancamento)
         
         # Registrar alertas
         self._alertas.extend(alertas_gerados)
         
-        # Verificar déficit após adicionar
-        if self.tem_deficit:
-            # Verificar se já existe alerta de déficit para este mês
-            deficit_existente = any(
-                a.tipo == TipoAlerta.DEFICIT_ORCAMENTARIO and a.mes_ano == self.mes_ano
-                for a in self._alertas
+        # Verificar déficit após adicionar (flag O(1), sem varrer alertas)
+        if self.tem_deficit and not self._has_deficit_alert:
+            alerta_deficit = Alerta.criar_alerta_deficit(
+                self._mes, self._ano, self.saldo
             )
-            if not deficit_existente:
-                alerta_deficit = Alerta.criar_alerta_deficit(
-                    self._mes, self._ano, self.saldo
+            alertas_gerados.append(alerta_deficit)
+            self._alertas.append(alerta_deficit)
+            self._has_deficit_alert = True
+
+        return alertas_gerados
+
+    def adicionar_lancamentos(self, lancamentos) -> list[Alerta]:
+        """
+        Adiciona vários lançamentos de uma vez (carga em lote).
+
+        Amortiza o custo das inserções: os itens são validados e
+        agregados em um único passo, a lista é ordenada uma só vez ao
+        final e o déficit é verificado apenas uma vez para o lote.
+
+        Args:
+            lancamentos: Iterável de lançamentos do mesmo mês/ano
+
+        Returns:
+            Lista de alertas gerados pelo lote
+
+        Raises:
+            ValueError: Se algum lançamento não pertence a este mês ou é duplicado
+        """
+        lote = list(lancamentos)
+
+        # Valida o lote inteiro antes de tocar em qualquer estado: uma
+        # falha no meio deixaria a lista sem a ordenação (invariante do
+        # insort de _vincular_lancamento) e agregados parciais aplicados
+        ids_lote: set[str] = set()
+        chaves_lote: set[tuple] = set()
+        for lancamento in lote:
+            if lancamento.mes_ano != self.mes_ano:
+                raise ValueError(
+                    f"Lançamento de {lancamento.data.strftime('%m/%Y')} não pertence "
+                    f"ao orçamento de {self._mes:02d}/{self._ano}."
                 )
-                alertas_gerados.append(alerta_deficit)
-                self._alertas.append(alerta_deficit)
-        
+            chave = (lancamento.data, lancamento._descricao_lower)
+            if (
+                lancamento.id in self._por_id
+                or lancamento.id in ids_lote
+                or chave in self._chaves_duplicidade
+                or chave in chaves_lote
+            ):
+                raise ValueError("Lançamento já existe neste orçamento.")
+            ids_lote.add(lancamento.id)
+            chaves_lote.add(chave)
+
+        alertas_gerados: list[Alerta] = []
+        adicionados = 0
+
+        for lancamento in lote:
+            if isinstance(lancamento, Despesa):
+                if "ALTO_VALOR" in lancamento.alertas:
+                    alertas_gerados.append(
+                        Alerta.criar_alerta_alto_valor(lancamento.id, lancamento.valor)
+                    )
+                total_categoria = self.total_por_categoria(lancamento.categoria)
+                if lancamento.verificar_limite_categoria(total_categoria):
+                    alertas_gerados.append(
+                        Alerta.criar_alerta_limite_excedido(
+                            lancamento.categoria.id,
+                            lancamento.categoria.nome,
+                            lancamento.categoria.limite_mensal,
+                            total_categoria + lancamento.valor,
+                        )
+                    )
+
+            # Anexa sem insort: uma única ordenação fecha o lote
+            self._lancamentos.append(lancamento)
+            self._registrar_agregados(lancamento)
+            adicionados += 1
+
+        if adicionados:
+            self._lancamentos.sort()
+
+        self._alertas.extend(alertas_gerados)
+
+        # Déficit verificado uma única vez para o lote inteiro
+        if adicionados and self.tem_deficit and not self._has_deficit_alert:
+            alerta_deficit = Alerta.criar_alerta_deficit(
+                self._mes, self._ano, self.saldo
+            )
+            alertas_gerados.append(alerta_deficit)
+            self._alertas.append(alerta_deficit)
+            self._has_deficit_alert = True
+
         return alertas_gerados
-    
+
+    def _vincular_alerta(self, alerta: Alerta) -> None:
+        """Anexa um alerta já existente (reidratação), mantendo a flag de déficit."""
+        self._alertas.append(alerta)
+        if alerta.tipo == TipoAlerta.DEFICIT_ORCAMENTARIO:
+            self._has_deficit_alert = True
+
+    def _vincular_lancamento(self, lancamento: Lancamento) -> None:
+        """
+        Anexa um lançamento e atualiza os agregados incrementais.
+
+        Usado por adicionar_lancamento e pela camada de persistência ao
+        reidratar orçamentos (sem revalidação).
+        """
+        # Caminho rápido para o padrão comum (lançamento mais recente no
+        # fim): append O(1); fora de ordem, inserção ordenada via insort
+        lancs = self._lancamentos
+        if not lancs or not lancamento < lancs[-1]:
+            lancs.append(lancamento)
+        else:
+            insort(lancs, lancamento)
+        self._registrar_agregados(lancamento)
+
+    def _registrar_agregados(self, lancamento: Lancamento) -> None:
+        """Atualiza agregados e índices incrementais para um lançamento."""
+        if isinstance(lancamento, Receita):
+            self._sum_receitas += lancamento.valor
+            self._receitas.append(lancamento)
+        else:
+            self._sum_despesas += lancamento.valor
+            self._despesas.append(lancamento)
+            cat = lancamento.categoria
+            forma = lancamento.forma_pagamento
+            self._despesas_por_cat[cat] = (
+                self._despesas_por_cat.get(cat, 0.0) + lancamento.valor
+            )
+            self._despesas_por_forma[forma] = (
+                self._despesas_por_forma.get(forma, 0.0) + lancamento.valor
+            )
+        self._sum_por_categoria[lancamento.categoria.id] += lancamento.valor
+        self._por_id[lancamento.id] = lancamento
+        self._chaves_duplicidade.add((lancamento.data, lancamento._descricao_lower))
+
     def remover_lancamento(self, lancamento_id: str) -> Optional[Lancamento]:
         """
         Remove um lançamento pelo ID.
-        
+
         Args:
             lancamento_id: ID do lançamento a remover
-            
+
         Returns:
             O lançamento removido, ou None se não encontrado
         """
-        for i, lanc in enumerate(self._lancamentos):
-            if lanc.id == lancamento_id:
-                return self._lancamentos.pop(i)
-        return None
-    
+        lancamento = self._por_id.pop(lancamento_id, None)
+        if lancamento is None:
+            return None
+
+        self._lancamentos.remove(lancamento)
+        self._chaves_duplicidade.discard((lancamento.data, lancamento._descricao_lower))
+
+        # Reverter os agregados incrementais
+        if isinstance(lancamento, Receita):
+            self._sum_receitas -= lancamento.valor
+            self._receitas.remove(lancamento)
+        else:
+            self._sum_despesas -= lancamento.valor
+            self._despesas.remove(lancamento)
+            self._despesas_por_cat[lancamento.categoria] -= lancamento.valor
+            self._despesas_por_forma[lancamento.forma_pagamento] -= lancamento.valor
+        self._sum_por_categoria[lancamento.categoria.id] -= lancamento.valor
+
+        # O alerta de déficit (se emitido) permanece mesmo que a remoção
+        # recupere o saldo: o gerenciador também o guarda, e descartá-lo
+        # só aqui deixaria as duas listas divergentes — um novo déficit
+        # geraria um segundo alerta não lido para o mesmo mês. A flag
+        # continua espelhando "existe alerta de déficit em _alertas".
+
+        return lancamento
+
     def buscar_lancamento(self, lancamento_id: str) -> Optional[Lancamento]:
-        """Busca um lançamento pelo ID."""
-        for lanc in self._lancamentos:
-            if lanc.id == lancamento_id:
-                return lanc
-        return None
+        """Busca um lançamento pelo ID (lookup O(1))."""
+        return self._por_id.get(lancamento_id)
     
     # ==================== MÉTODOS DE RELATÓRIO ====================
     
     def total_por_categoria(self, categoria: Categoria) -> float:
-        """Calcula o total de lançamentos de uma categoria."""
-        return sum(
-            lanc.valor for lanc in self._lancamentos
-            if lanc.categoria == categoria
-        )
+        """Retorna o total de lançamentos de uma categoria (lookup O(1))."""
+        # .get evita que consultas a categorias sem lançamentos insiram
+        # chaves no defaultdict
+        return self._sum_por_categoria.get(categoria.id, 0.0)
     
     def despesas_por_categoria(self) -> dict[str, float]:
         """Retorna o total de despesas agrupado por categoria."""
-        totais: dict[str, float] = defaultdict(float)
-        for lanc in self._lancamentos:
-            if isinstance(lanc, Despesa):
-                totais[lanc.categoria.nome] += lanc.valor
-        return dict(totais)
+        return {
+            cat.nome: total
+            for cat, total in self._despesas_por_cat.items()
+            if total
+        }
     
     def despesas_por_forma_pagamento(self) -> dict[str, float]:
         """Retorna o total de despesas agrupado por forma de pagamento."""
-        totais: dict[str, float] = defaultdict(float)
-        for lanc in self._lancamentos:
-            if isinstance(lanc, Despesa):
-                totais[lanc.forma_pagamento.value] += lanc.valor
-        return dict(totais)
+        return {
+            forma.name: total
+            for forma, total in self._despesas_por_forma.items()
+            if total
+        }
     
     def percentual_por_categoria(self) -> dict[str, float]:
         """Retorna o percentual de cada categoria em relação ao total de despesas."""
@@ -280,14 +449,24 @@ class OrcamentoMensal:
         """Calcula o saldo acumulado por dia do mês."""
         saldos: dict[date, float] = {}
         acumulado = 0.0
-        
-        for lanc in sorted(self._lancamentos, key=lambda x: x.data):
-            if isinstance(lanc, Receita):
+        dia_atual: Optional[date] = None
+
+        # Loop enxuto: lista já ordenada por data, uma leitura de valor
+        # por lançamento, checagem de classe exata (sem MRO walk) e uma
+        # única escrita no dict por dia (soma acumulada fechada na troca
+        # de data, em vez de sobrescrever a cada lançamento do mesmo dia)
+        for lanc in self._lancamentos:
+            if lanc.data is not dia_atual and lanc.data != dia_atual:
+                if dia_atual is not None:
+                    saldos[dia_atual] = acumulado
+                dia_atual = lanc.data
+            if type(lanc) is Receita:
                 acumulado += lanc.valor
             else:
                 acumulado -= lanc.valor
-            saldos[lanc.data] = acumulado
-        
+        if dia_atual is not None:
+            saldos[dia_atual] = acumulado
+
         return saldos
     
     # ==================== MÉTODOS ESPECIAIS ====================
@@ -1,5 +1,6 @@
 # Módulo de persistência
 from .json_storage import JsonStorage
+from .sqlite_storage import SqliteStorage
 from .gerenciador_dados import GerenciadorDados
 
-__all__ = ["JsonStorage", "GerenciadorDados"]
+__all__ = ["JsonStorage", "SqliteStorage", "GerenciadorDados"]
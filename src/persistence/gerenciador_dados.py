@@ -2,8 +2,11 @@
 Gerenciador de Dados - Camada de serviço para gerenciar todas as operações de dados.
 """
 
+from bisect import insort
+from heapq import nsmallest
+from contextlib import contextmanager
 from datetime import date
-from typing import Optional
+from typing import Iterator, Optional
 
 from ..models.categoria import Categoria, TipoCategoria
 from ..models.lancamento import Lancamento, Receita, Despesa, FormaPagamento
@@ -24,58 +27,235 @@ class GerenciadorDados:
     def __init__(self, data_dir: str = "data"):
         self._storage = JsonStorage(data_dir)
         self._storage.inicializar_dados()
-        
-        # Cache de dados
-        self._categorias: list[Categoria] = []
-        self._lancamentos: list[Lancamento] = []
-        self._orcamentos: list[OrcamentoMensal] = []
-        self._alertas: list[Alerta] = []
-        
-        # Carregar dados
-        self._carregar_todos_dados()
-    
-    def _carregar_todos_dados(self) -> None:
-        """Carrega todos os dados do armazenamento."""
+
+        # Cache de dados: None = coleção ainda não carregada do disco.
+        # Cada coleção é carregada sob demanda pelo _ensure_* respectivo,
+        # então caminhos de CLI que só tocam uma coleção não pagam o
+        # parse dos quatro arquivos JSON na inicialização.
+        self._categorias: Optional[list[Categoria]] = None
+        self._lancamentos: Optional[list[Lancamento]] = None
+        self._orcamentos: Optional[list[OrcamentoMensal]] = None
+        self._alertas: Optional[list[Alerta]] = None
+
+        # Controle de salvamento agrupado (ver batch/suspender_salvamento):
+        # dentro de um lote só as coleções sujas são gravadas, uma vez
+        self._batch_depth = 0
+        self._sujos: set[str] = set()
+
+        # Snapshots imutáveis expostos pelas propriedades públicas,
+        # invalidados em _gravar (toda mutação passa por lá)
+        self._snapshots: dict[str, tuple] = {}
+
+        # Cache de relatórios mensais, invalidado por (mês, ano) exato
+        self._relatorio_cache: dict[tuple[int, int], dict] = {}
+        self._cache_mes_economico: Optional[dict] = None
+
+    # ==================== CARGA SOB DEMANDA ====================
+
+    def _ensure_categorias(self) -> None:
+        """Carrega as categorias do armazenamento na primeira necessidade."""
+        if self._categorias is not None:
+            return
         self._categorias = self._storage.carregar_categorias()
+        self._categorias.sort()  # Mantidas ordenadas por nome (ver criar_categoria)
+        self._reindexar_categorias()
+
+    def _ensure_alertas(self) -> None:
+        """Carrega os alertas do armazenamento na primeira necessidade."""
+        if self._alertas is not None:
+            return
         self._alertas = self._storage.carregar_alertas()
+        # Lista paralela de alertas não lidos + índice por ID para
+        # remoção O(1) via swap-pop (ver marcar_*)
+        self._nao_lidos: list[Alerta] = [a for a in self._alertas if not a.lido]
+        self._nao_lidos_idx: dict[str, int] = {
+            a.id: i for i, a in enumerate(self._nao_lidos)
+        }
+
+    def _ensure_lancamentos(self) -> None:
+        """Carrega os lançamentos (e, por dependência, as categorias)."""
+        if self._lancamentos is not None:
+            return
+        self._ensure_categorias()
         self._lancamentos = self._storage.carregar_lancamentos(self._categorias)
+        self._reindexar_lancamentos()
+
+    def _ensure_orcamentos(self) -> None:
+        """Carrega os orçamentos (e, por dependência, lançamentos e alertas)."""
+        if self._orcamentos is not None:
+            return
+        self._ensure_lancamentos()
+        self._ensure_alertas()
         self._orcamentos = self._storage.carregar_orcamentos(
             self._lancamentos, self._alertas
         )
-    
-    def _salvar_todos_dados(self) -> None:
-        """Salva todos os dados no armazenamento."""
-        self._storage.salvar_categorias(self._categorias)
-        self._storage.salvar_lancamentos(self._lancamentos)
-        self._storage.salvar_orcamentos(self._orcamentos)
-        self._storage.salvar_alertas(self._alertas)
+        self._orcamentos.sort()  # Mantidos ordenados (ver _obter_ou_criar_orcamento)
+        # Índice de orçamentos por (mês, ano): o caminho quente de
+        # adicionar_* deixa de varrer a lista a cada inserção
+        self._orcamentos_por_mes_ano: dict[tuple[int, int], OrcamentoMensal] = {
+            orc.mes_ano: orc for orc in self._orcamentos
+        }
+        # Totais gerais mantidos incrementalmente em adicionar_*/excluir_*
+        self._total_receitas_geral = sum(o.total_receitas for o in self._orcamentos)
+        self._total_despesas_geral = sum(o.total_despesas for o in self._orcamentos)
+
+    # ==================== ÍNDICES DE CATEGORIAS ====================
+
+    def _reindexar_categorias(self) -> None:
+        """Reconstrói os índices de categorias por ID e por (nome, tipo)."""
+        self._categorias_por_id: dict[str, Categoria] = {
+            cat.id: cat for cat in self._categorias
+        }
+        self._categorias_por_nome: dict[tuple[str, TipoCategoria], Categoria] = {
+            (cat._nome_lower, cat.tipo): cat for cat in self._categorias
+        }
+
+    # ==================== ÍNDICES DE LANÇAMENTOS ====================
+
+    def _reindexar_lancamentos(self) -> None:
+        """Reconstrói os índices de lançamentos por ID, (mês, ano) e categoria."""
+        self._lancamentos_por_id: dict[str, Lancamento] = {}
+        self._lancamentos_por_mes: dict[tuple[int, int], list[Lancamento]] = {}
+        self._lancamentos_por_categoria: dict[str, list[Lancamento]] = {}
+        # Posição de cada lançamento em _lancamentos: a lista é tratada
+        # como não ordenada (listar_lancamentos sempre ordena a saída),
+        # então a exclusão pode usar swap-pop O(1) em vez de pop(i)
+        self._lancamentos_pos: dict[str, int] = {}
+        # Contador por ID de categoria: excluir_categoria checa vínculos
+        # em O(1) sem varrer (nem filtrar) lançamentos
+        self._contagem_por_categoria: dict[str, int] = {}
+        for i, lanc in enumerate(self._lancamentos):
+            self._indexar_lancamento(lanc, i)
+
+    def _indexar_lancamento(self, lancamento: Lancamento, pos: int) -> None:
+        """Registra um lançamento nos índices de busca."""
+        self._lancamentos_por_id[lancamento.id] = lancamento
+        self._lancamentos_pos[lancamento.id] = pos
+        self._lancamentos_por_mes.setdefault(lancamento.mes_ano, []).append(lancamento)
+        cat_id = lancamento.categoria.id
+        # Balde por ID da categoria: estável a renomes (o nome muda em
+        # editar_categoria, o ID nunca)
+        self._lancamentos_por_categoria.setdefault(cat_id, []).append(lancamento)
+        self._contagem_por_categoria[cat_id] = (
+            self._contagem_por_categoria.get(cat_id, 0) + 1
+        )
+
+    def _desindexar_lancamento(self, lancamento: Lancamento) -> None:
+        """Remove um lançamento dos índices de busca."""
+        self._lancamentos_por_id.pop(lancamento.id, None)
+        buckets = (
+            self._lancamentos_por_mes.get(lancamento.mes_ano),
+            self._lancamentos_por_categoria.get(lancamento.categoria.id),
+        )
+        for bucket in buckets:
+            if not bucket:
+                continue
+            for i, lanc in enumerate(bucket):
+                if lanc.id == lancamento.id:
+                    # Baldes também são não ordenados (a listagem ordena):
+                    # swap-pop evita o deslocamento do pop(i)
+                    bucket[i] = bucket[-1]
+                    bucket.pop()
+                    break
+        cat_id = lancamento.categoria.id
+        restantes = self._contagem_por_categoria.get(cat_id, 0) - 1
+        if restantes > 0:
+            self._contagem_por_categoria[cat_id] = restantes
+        else:
+            self._contagem_por_categoria.pop(cat_id, None)
+    
+    def _gravar(self, colecao: str) -> None:
+        """Grava uma coleção agora ou a marca como suja dentro de um lote."""
+        self._snapshots.pop(colecao, None)
+        if self._batch_depth > 0:
+            self._sujos.add(colecao)
+            return
+        if colecao == "categorias":
+            self._storage.salvar_categorias(self._categorias)
+        elif colecao == "lancamentos":
+            self._storage.salvar_lancamentos(self._lancamentos)
+        elif colecao == "orcamentos":
+            self._storage.salvar_orcamentos(self._orcamentos)
+        elif colecao == "alertas":
+            self._storage.salvar_alertas(self._alertas)
+
+    @contextmanager
+    def batch(self) -> Iterator["GerenciadorDados"]:
+        """
+        Agrupa gravações: dentro do bloco nada é escrito em disco e, na
+        saída, apenas as coleções alteradas são gravadas, uma única vez.
+
+        Útil em operações em lote (importação de CSV, categorias padrão):
+        N mutações produzem uma reescrita por arquivo em vez de N.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            self._gravar_pendentes()
+
+    def suspender_salvamento(self) -> None:
+        """
+        Suspende os salvamentos automáticos até o próximo flush().
+
+        Equivalente a abrir um batch() sem o bloco with, para chamadores
+        que precisam controlar o início e o fim separadamente.
+        """
+        self._batch_depth += 1
+
+    def flush(self) -> None:
+        """Reativa o salvamento automático e grava mutações pendentes."""
+        if self._batch_depth > 0:
+            self._batch_depth -= 1
+        self._gravar_pendentes()
+
+    def _gravar_pendentes(self) -> None:
+        """Grava as coleções sujas quando nenhum lote está aberto."""
+        if self._batch_depth == 0 and self._sujos:
+            pendentes, self._sujos = self._sujos, set()
+            for colecao in ("categorias", "lancamentos", "orcamentos", "alertas"):
+                if colecao in pendentes:
+                    self._gravar(colecao)
     
     # ==================== PROPRIEDADES ====================
     
+    def _snapshot(self, colecao: str, itens: list) -> tuple:
+        """Retorna a tupla cacheada de uma coleção, reconstruindo se preciso."""
+        snap = self._snapshots.get(colecao)
+        if snap is None:
+            snap = self._snapshots[colecao] = tuple(itens)
+        return snap
+
     @property
-    def categorias(self) -> list[Categoria]:
-        """Retorna a lista de categorias."""
-        return self._categorias.copy()
-    
+    def categorias(self) -> tuple[Categoria, ...]:
+        """Retorna as categorias (snapshot imutável cacheado)."""
+        self._ensure_categorias()
+        return self._snapshot("categorias", self._categorias)
+
     @property
-    def lancamentos(self) -> list[Lancamento]:
-        """Retorna a lista de lançamentos."""
-        return self._lancamentos.copy()
-    
+    def lancamentos(self) -> tuple[Lancamento, ...]:
+        """Retorna os lançamentos (snapshot imutável cacheado)."""
+        self._ensure_lancamentos()
+        return self._snapshot("lancamentos", self._lancamentos)
+
     @property
-    def orcamentos(self) -> list[OrcamentoMensal]:
-        """Retorna a lista de orçamentos."""
-        return self._orcamentos.copy()
-    
+    def orcamentos(self) -> tuple[OrcamentoMensal, ...]:
+        """Retorna os orçamentos (snapshot imutável cacheado)."""
+        self._ensure_orcamentos()
+        return self._snapshot("orcamentos", self._orcamentos)
+
     @property
-    def alertas(self) -> list[Alerta]:
-        """Retorna a lista de alertas."""
-        return self._alertas.copy()
+    def alertas(self) -> tuple[Alerta, ...]:
+        """Retorna os alertas (snapshot imutável cacheado)."""
+        self._ensure_alertas()
+        return self._snapshot("alertas", self._alertas)
     
     @property
     def alertas_nao_lidos(self) -> list[Alerta]:
-        """Retorna a lista de alertas não lidos."""
-        return [a for a in self._alertas if not a.lido]
+        """Retorna a lista de alertas não lidos (mantida em paralelo)."""
+        self._ensure_alertas()
+        return self._nao_lidos.copy()
     
     # ==================== OPERAÇÕES DE CATEGORIAS ====================
     
@@ -101,23 +281,26 @@ class GerenciadorDados:
         Raises:
             ValueError: Se a categoria já existir
         """
-        # Verificar duplicidade
-        for cat in self._categorias:
-            if cat.nome.lower() == nome.lower() and cat.tipo == tipo:
-                raise ValueError(
-                    f"Categoria '{nome}' do tipo {tipo.value} já existe."
-                )
-        
+        self._ensure_categorias()
+        # Verificar duplicidade (lookup O(1) no índice por nome/tipo)
+        if (nome.lower(), tipo) in self._categorias_por_nome:
+            raise ValueError(
+                f"Categoria '{nome}' do tipo {tipo.value} já existe."
+            )
+
         categoria = Categoria(
             nome=nome,
             tipo=tipo,
             limite_mensal=limite_mensal,
             descricao=descricao
         )
-        
-        self._categorias.append(categoria)
-        self._storage.salvar_categorias(self._categorias)
-        
+
+        # Inserção ordenada: as listagens dispensam o sorted() por chamada
+        insort(self._categorias, categoria)
+        self._categorias_por_id[categoria.id] = categoria
+        self._categorias_por_nome[(categoria._nome_lower, tipo)] = categoria
+        self._gravar("categorias")
+
         return categoria
     
     def editar_categoria(
@@ -147,19 +330,24 @@ class GerenciadorDados:
             raise ValueError(f"Categoria com ID '{categoria_id}' não encontrada.")
         
         if nome:
-            # Verificar duplicidade do novo nome
-            for cat in self._categorias:
-                if cat.id != categoria_id and cat.nome.lower() == nome.lower() and cat.tipo == categoria.tipo:
-                    raise ValueError(f"Categoria '{nome}' já existe neste tipo.")
-            categoria.nome = nome
-        
-        if limite_mensal is not None:
-            categoria.limite_mensal = limite_mensal
-        
-        if descricao is not None:
-            categoria.descricao = descricao
-        
-        self._storage.salvar_categorias(self._categorias)
+            # Verificar duplicidade do novo nome (lookup O(1))
+            existente = self._categorias_por_nome.get((nome.lower(), categoria.tipo))
+            if existente is not None and existente.id != categoria_id:
+                raise ValueError(f"Categoria '{nome}' já existe neste tipo.")
+            nome_lower_antigo = categoria._nome_lower
+
+        categoria.atualizar(
+            nome=nome,
+            limite_mensal=limite_mensal,
+            descricao=descricao
+        )
+        if nome:
+            self._categorias.sort()  # Renome pode quebrar a ordenação
+            # Migrar a chave do índice por nome
+            del self._categorias_por_nome[(nome_lower_antigo, categoria.tipo)]
+            self._categorias_por_nome[(categoria._nome_lower, categoria.tipo)] = categoria
+
+        self._gravar("categorias")
         return categoria
     
     def excluir_categoria(self, categoria_id: str) -> Optional[Categoria]:
@@ -175,72 +363,86 @@ class GerenciadorDados:
         Raises:
             ValueError: Se a categoria tiver lançamentos vinculados
         """
-        # Verificar se há lançamentos vinculados
-        lancamentos_vinculados = [
-            l for l in self._lancamentos if l.categoria.id == categoria_id
-        ]
-        if lancamentos_vinculados:
+        self._ensure_lancamentos()
+        # Verificar se há lançamentos vinculados (contador O(1) por ID)
+        vinculados = self._contagem_por_categoria.get(categoria_id, 0)
+        if vinculados:
             raise ValueError(
                 f"Não é possível excluir: categoria possui "
-                f"{len(lancamentos_vinculados)} lançamento(s) vinculado(s)."
+                f"{vinculados} lançamento(s) vinculado(s)."
             )
         
-        for i, cat in enumerate(self._categorias):
-            if cat.id == categoria_id:
-                categoria = self._categorias.pop(i)
-                self._storage.salvar_categorias(self._categorias)
-                return categoria
-        
-        return None
-    
+        categoria = self._categorias_por_id.pop(categoria_id, None)
+        if categoria is None:
+            return None
+
+        self._categorias.remove(categoria)
+        del self._categorias_por_nome[(categoria._nome_lower, categoria.tipo)]
+        self._gravar("categorias")
+        return categoria
+
     def buscar_categoria(self, categoria_id: str) -> Optional[Categoria]:
-        """Busca uma categoria pelo ID."""
-        for cat in self._categorias:
-            if cat.id == categoria_id:
-                return cat
-        return None
-    
+        """Busca uma categoria pelo ID (lookup O(1))."""
+        self._ensure_categorias()
+        return self._categorias_por_id.get(categoria_id)
+
     def buscar_categoria_por_nome(
         self, nome: str, tipo: TipoCategoria
     ) -> Optional[Categoria]:
-        """Busca uma categoria pelo nome e tipo."""
-        for cat in self._categorias:
-            if cat.nome.lower() == nome.lower() and cat.tipo == tipo:
-                return cat
-        return None
+        """Busca uma categoria pelo nome e tipo (lookup O(1))."""
+        self._ensure_categorias()
+        return self._categorias_por_nome.get((nome.lower(), tipo))
     
     def listar_categorias(
         self, tipo: Optional[TipoCategoria] = None
     ) -> list[Categoria]:
         """Lista categorias, opcionalmente filtradas por tipo."""
+        self._ensure_categorias()
         if tipo:
             return [c for c in self._categorias if c.tipo == tipo]
         return self._categorias.copy()
     
     def inicializar_categorias_padrao(self) -> None:
         """Inicializa as categorias padrão se não houver nenhuma."""
+        self._ensure_categorias()
         if self._categorias:
             return
-        
+
         config = self._storage.carregar_configuracoes()
         categorias_padrao = config.get("categorias_padrao", {})
-        
-        # Criar categorias de receita
+
+        # Construção em lote: em vez de criar_categoria por entrada
+        # (um insort e um lookup por chamada), constrói tudo em memória,
+        # valida unicidade contra o índice e ordena uma única vez
+        novas: list[Categoria] = []
         for cat_data in categorias_padrao.get("receitas", []):
-            self.criar_categoria(
+            novas.append(Categoria(
                 nome=cat_data["nome"],
                 tipo=TipoCategoria.RECEITA,
                 descricao=cat_data.get("descricao")
-            )
-        
-        # Criar categorias de despesa
+            ))
+
         for cat_data in categorias_padrao.get("despesas", []):
-            self.criar_categoria(
+            novas.append(Categoria(
                 nome=cat_data["nome"],
                 tipo=TipoCategoria.DESPESA,
                 limite_mensal=cat_data.get("limite_mensal"),
                 descricao=cat_data.get("descricao")
-            )
+            ))
+
+        for categoria in novas:
+            chave = (categoria._nome_lower, categoria.tipo)
+            if chave in self._categorias_por_nome:
+                raise ValueError(
+                    f"Categoria '{categoria.nome}' duplicada nas categorias padrão."
+                )
+            self._categorias_por_nome[chave] = categoria
+            self._categorias_por_id[categoria.id] = categoria
+
+        self._categorias.extend(novas)
+        self._categorias.sort()
+        # Uma única gravação para todas as categorias criadas
+        self._gravar("categorias")
     
     # ==================== OPERAÇÕES DE LANÇAMENTOS ====================
     
@@ -265,6 +467,7 @@ class GerenciadorDados:
         Returns:
             Tupla com a receita criada e lista de alertas gerados
         """
+        self._ensure_orcamentos()
         # Buscar categoria
         categoria = self.buscar_categoria_por_nome(categoria_nome, TipoCategoria.RECEITA)
         if not categoria:
@@ -285,13 +488,21 @@ class GerenciadorDados:
         )
         alertas = orcamento.adicionar_lancamento(receita)
         
-        # Atualizar caches
+        # Atualizar caches e índices
         self._lancamentos.append(receita)
+        self._indexar_lancamento(receita, len(self._lancamentos) - 1)
+        self._total_receitas_geral += receita.valor
+        self._relatorio_cache.pop(receita.mes_ano, None)
+        self._cache_mes_economico = None
         self._alertas.extend(alertas)
-        
-        # Salvar
-        self._salvar_todos_dados()
-        
+        self._registrar_nao_lidos(alertas)  # alertas novos nascem não lidos
+
+        # Salvar apenas as coleções alteradas (categorias não mudam aqui)
+        self._gravar("lancamentos")
+        self._gravar("orcamentos")
+        if alertas:
+            self._gravar("alertas")
+
         return receita, alertas
     
     def adicionar_despesa(
@@ -315,6 +526,7 @@ class GerenciadorDados:
         Returns:
             Tupla com a despesa criada e lista de alertas gerados
         """
+        self._ensure_orcamentos()
         # Buscar categoria
         categoria = self.buscar_categoria_por_nome(categoria_nome, TipoCategoria.DESPESA)
         if not categoria:
@@ -335,13 +547,21 @@ class GerenciadorDados:
         )
         alertas = orcamento.adicionar_lancamento(despesa)
         
-        # Atualizar caches
+        # Atualizar caches e índices
         self._lancamentos.append(despesa)
+        self._indexar_lancamento(despesa, len(self._lancamentos) - 1)
+        self._total_despesas_geral += despesa.valor
+        self._relatorio_cache.pop(despesa.mes_ano, None)
+        self._cache_mes_economico = None
         self._alertas.extend(alertas)
-        
-        # Salvar
-        self._salvar_todos_dados()
-        
+        self._registrar_nao_lidos(alertas)  # alertas novos nascem não lidos
+
+        # Salvar apenas as coleções alteradas (categorias não mudam aqui)
+        self._gravar("lancamentos")
+        self._gravar("orcamentos")
+        if alertas:
+            self._gravar("alertas")
+
         return despesa, alertas
     
     def excluir_lancamento(self, lancamento_id: str) -> Optional[Lancamento]:
@@ -354,18 +574,34 @@ class GerenciadorDados:
         Returns:
             O lançamento excluído, ou None se não encontrado
         """
-        for i, lanc in enumerate(self._lancamentos):
-            if lanc.id == lancamento_id:
-                lancamento = self._lancamentos.pop(i)
-                
-                # Remover do orçamento correspondente
-                for orc in self._orcamentos:
-                    orc.remover_lancamento(lancamento_id)
-                
-                self._salvar_todos_dados()
-                return lancamento
-        
-        return None
+        self._ensure_orcamentos()
+        lancamento = self._lancamentos_por_id.get(lancamento_id)
+        if lancamento is None:
+            return None
+
+        # Remoção O(1) via swap-pop (a lista interna é não ordenada)
+        i = self._lancamentos_pos.pop(lancamento.id)
+        ultimo = self._lancamentos.pop()
+        if ultimo is not lancamento:
+            self._lancamentos[i] = ultimo
+            self._lancamentos_pos[ultimo.id] = i
+        self._desindexar_lancamento(lancamento)
+        if isinstance(lancamento, Receita):
+            self._total_receitas_geral -= lancamento.valor
+        else:
+            self._total_despesas_geral -= lancamento.valor
+        self._relatorio_cache.pop(lancamento.mes_ano, None)
+        self._cache_mes_economico = None
+
+        # Remover apenas do orçamento do mês correspondente
+        orcamento = self.obter_orcamento(*lancamento.mes_ano)
+        if orcamento is not None:
+            orcamento.remover_lancamento(lancamento_id)
+
+        # Categorias e alertas globais não mudam na exclusão
+        self._gravar("lancamentos")
+        self._gravar("orcamentos")
+        return lancamento
     
     def listar_lancamentos(
         self,
@@ -386,23 +622,34 @@ class GerenciadorDados:
         Returns:
             Lista de lançamentos filtrados
         """
-        resultado = self._lancamentos.copy()
-        
+        self._ensure_lancamentos()
+        # Partir do menor balde indexado disponível; os demais filtros
+        # são fundidos em uma única passada, materializando só o sorted
+        nome_lower = categoria_nome.lower() if categoria_nome else None
+        tipo_upper = tipo.upper() if tipo else None
+
         if mes and ano:
-            resultado = [l for l in resultado if l.mes_ano == (mes, ano)]
-        elif ano:
-            resultado = [l for l in resultado if l.data.year == ano]
-        
-        if tipo:
-            resultado = [l for l in resultado if l.tipo == tipo.upper()]
-        
-        if categoria_nome:
-            resultado = [
-                l for l in resultado 
-                if l.categoria.nome.lower() == categoria_nome.lower()
+            fonte = self._lancamentos_por_mes.get((mes, ano), [])
+            ano = None  # filtro já aplicado pelo índice
+        elif nome_lower is not None:
+            # O balde é por ID; o mesmo nome pode existir nos dois tipos
+            # de categoria, então os baldes correspondentes são somados
+            fonte = [
+                lanc
+                for tipo_cat in (TipoCategoria.RECEITA, TipoCategoria.DESPESA)
+                if (cat := self._categorias_por_nome.get((nome_lower, tipo_cat)))
+                for lanc in self._lancamentos_por_categoria.get(cat.id, [])
             ]
-        
-        return sorted(resultado)
+            nome_lower = None  # filtro já aplicado pelo índice
+        else:
+            fonte = self._lancamentos
+
+        return sorted(
+            l for l in fonte
+            if (ano is None or l.data.year == ano)
+            and (tipo_upper is None or l.tipo == tipo_upper)
+            and (nome_lower is None or l.categoria._nome_lower == nome_lower)
+        )
     
     # ==================== OPERAÇÕES DE ORÇAMENTO ====================
     
@@ -420,28 +667,28 @@ class GerenciadorDados:
         Returns:
             O orçamento obtido ou criado
         """
-        # Buscar existente
-        for orc in self._orcamentos:
-            if orc.mes == mes and orc.ano == ano:
-                return orc
-        
+        self._ensure_orcamentos()
+        # Buscar existente (lookup O(1))
+        orcamento = self._orcamentos_por_mes_ano.get((mes, ano))
+        if orcamento is not None:
+            return orcamento
+
         # Criar novo
         orcamento = OrcamentoMensal(
             mes=mes,
             ano=ano,
             receitas_previstas=receitas_previstas
         )
-        self._orcamentos.append(orcamento)
-        self._orcamentos.sort()
-        
+        # Inserção ordenada no lugar de append + sort completo
+        insort(self._orcamentos, orcamento)
+        self._orcamentos_por_mes_ano[(mes, ano)] = orcamento
+
         return orcamento
-    
+
     def obter_orcamento(self, mes: int, ano: int) -> Optional[OrcamentoMensal]:
-        """Obtém um orçamento pelo mês/ano."""
-        for orc in self._orcamentos:
-            if orc.mes == mes and orc.ano == ano:
-                return orc
-        return None
+        """Obtém um orçamento pelo mês/ano (lookup O(1))."""
+        self._ensure_orcamentos()
+        return self._orcamentos_por_mes_ano.get((mes, ano))
     
     def definir_receitas_previstas(
         self, mes: int, ano: int, receitas_previstas: float
@@ -459,7 +706,9 @@ class GerenciadorDados:
         """
         orcamento = self._obter_ou_criar_orcamento(mes, ano)
         orcamento.receitas_previstas = receitas_previstas
-        self._storage.salvar_orcamentos(self._orcamentos)
+        self._relatorio_cache.pop((mes, ano), None)
+        self._cache_mes_economico = None
+        self._gravar("orcamentos")
         return orcamento
     
     # ==================== RELATÓRIOS ====================
@@ -475,10 +724,14 @@ class GerenciadorDados:
         Returns:
             Dicionário com dados do relatório
         """
+        relatorio = self._relatorio_cache.get((mes, ano))
+        if relatorio is not None:
+            return relatorio
+
         orcamento = self.obter_orcamento(mes, ano)
-        
+
         if not orcamento:
-            return {
+            relatorio = {
                 "mes": mes,
                 "ano": ano,
                 "existe": False,
@@ -486,8 +739,10 @@ class GerenciadorDados:
                 "total_despesas": 0.0,
                 "saldo": 0.0,
             }
-        
-        return {
+            self._relatorio_cache[(mes, ano)] = relatorio
+            return relatorio
+
+        relatorio = {
             "mes": mes,
             "ano": ano,
             "existe": True,
@@ -503,7 +758,9 @@ class GerenciadorDados:
             "num_lancamentos": len(orcamento),
             "num_alertas": len(orcamento.alertas),
         }
-    
+        self._relatorio_cache[(mes, ano)] = relatorio
+        return relatorio
+
     def relatorio_comparativo(self, meses: int = 3) -> list[dict]:
         """
         Gera relatório comparativo dos últimos meses.
@@ -514,12 +771,11 @@ class GerenciadorDados:
         Returns:
             Lista de relatórios mensais ordenados
         """
-        # Ordenar orçamentos do mais recente ao mais antigo
-        orcamentos_ordenados = sorted(self._orcamentos, reverse=True)
-        
-        # Pegar os últimos 'meses' orçamentos
-        orcamentos_selecionados = orcamentos_ordenados[:meses]
-        
+        self._ensure_orcamentos()
+        # A lista já é mantida ordenada (insort na criação): basta
+        # fatiar os últimos meses e inverter, sem sort por chamada
+        orcamentos_selecionados = self._orcamentos[-meses:][::-1]
+
         return [
             self.relatorio_mensal(orc.mes, orc.ano)
             for orc in orcamentos_selecionados
@@ -532,20 +788,40 @@ class GerenciadorDados:
         Returns:
             Dicionário com dados do mês mais econômico
         """
+        self._ensure_orcamentos()
         if not self._orcamentos:
             return None
-        
-        orcamento_minimo = min(
-            self._orcamentos,
-            key=lambda o: o.total_despesas
-        )
-        
-        return {
-            "mes": orcamento_minimo.mes,
-            "ano": orcamento_minimo.ano,
-            "total_despesas": orcamento_minimo.total_despesas,
-            "saldo": orcamento_minimo.saldo,
-        }
+
+        if self._cache_mes_economico is None:
+            orcamento_minimo = min(
+                self._orcamentos,
+                key=lambda o: o.total_despesas
+            )
+            self._cache_mes_economico = {
+                "mes": orcamento_minimo.mes,
+                "ano": orcamento_minimo.ano,
+                "total_despesas": orcamento_minimo.total_despesas,
+                "saldo": orcamento_minimo.saldo,
+            }
+        return self._cache_mes_economico
+
+    def meses_mais_economicos(self, k: int) -> list[dict]:
+        """
+        Retorna os k meses com menor total de despesas.
+
+        Usa heapq.nsmallest (O(N log k)) em vez de ordenar todos os
+        orçamentos só para fatiar o topo.
+        """
+        self._ensure_orcamentos()
+        return [
+            {
+                "mes": orc.mes,
+                "ano": orc.ano,
+                "total_despesas": orc.total_despesas,
+                "saldo": orc.saldo,
+            }
+            for orc in nsmallest(k, self._orcamentos, key=lambda o: o.total_despesas)
+        ]
     
     def estatisticas_gerais(self) -> dict:
         """
@@ -554,37 +830,62 @@ class GerenciadorDados:
         Returns:
             Dicionário com estatísticas
         """
-        total_receitas = sum(orc.total_receitas for orc in self._orcamentos)
-        total_despesas = sum(orc.total_despesas for orc in self._orcamentos)
-        
+        self._ensure_orcamentos()
+        total_receitas = self._total_receitas_geral
+        total_despesas = self._total_despesas_geral
+
         return {
             "total_categorias": len(self._categorias),
             "total_lancamentos": len(self._lancamentos),
             "total_orcamentos": len(self._orcamentos),
             "total_alertas": len(self._alertas),
-            "alertas_nao_lidos": len(self.alertas_nao_lidos),
+            "alertas_nao_lidos": len(self._nao_lidos),
             "total_receitas_geral": total_receitas,
             "total_despesas_geral": total_despesas,
             "saldo_geral": total_receitas - total_despesas,
         }
     
     # ==================== OPERAÇÕES DE ALERTAS ====================
-    
+
+    def _registrar_nao_lidos(self, alertas: list[Alerta]) -> None:
+        """Anexa alertas recém-criados à lista paralela de não lidos."""
+        idx = self._nao_lidos_idx
+        base = len(self._nao_lidos)
+        self._nao_lidos.extend(alertas)
+        for i, alerta in enumerate(alertas, start=base):
+            idx[alerta.id] = i
+
+    def _remover_nao_lido(self, alerta: Alerta) -> None:
+        """Remove um alerta da lista de não lidos em O(1) via swap-pop."""
+        i = self._nao_lidos_idx.pop(alerta.id, None)
+        if i is None:
+            return
+        ultimo = self._nao_lidos.pop()
+        if ultimo is not alerta:
+            self._nao_lidos[i] = ultimo
+            self._nao_lidos_idx[ultimo.id] = i
+
     def marcar_alerta_como_lido(self, alerta_id: str) -> bool:
         """Marca um alerta como lido."""
+        self._ensure_alertas()
         for alerta in self._alertas:
             if alerta.id == alerta_id:
-                alerta.marcar_como_lido()
-                self._storage.salvar_alertas(self._alertas)
+                if not alerta.lido:
+                    alerta.marcar_como_lido()
+                    self._remover_nao_lido(alerta)
+                self._gravar("alertas")
                 return True
         return False
-    
+
     def marcar_todos_alertas_como_lidos(self) -> int:
         """Marca todos os alertas como lidos."""
+        self._ensure_alertas()
         count = 0
         for alerta in self._alertas:
             if not alerta.lido:
                 alerta.marcar_como_lido()
                 count += 1
-        self._storage.salvar_alertas(self._alertas)
+        self._nao_lidos.clear()
+        self._nao_lidos_idx.clear()
+        self._gravar("alertas")
         return count
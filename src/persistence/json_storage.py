@@ -2,17 +2,77 @@
 Módulo de Persistência JSON - Funções para salvar e carregar dados em JSON.
 """
 
+import hashlib
 import json
+import mmap
 import os
+from bisect import insort
+from contextlib import contextmanager
+from functools import lru_cache
+from sys import intern
+
+try:
+    # Dependência opcional (extra "perf"): decodifica e serializa JSON
+    # em C, várias vezes mais rápido que a stdlib em listas grandes
+    import orjson
+except ImportError:
+    orjson = None
+from copy import deepcopy
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from ..models.categoria import Categoria, TipoCategoria
 from ..models.lancamento import Lancamento, Receita, Despesa, FormaPagamento
 from ..models.orcamento import OrcamentoMensal
 from ..models.alerta import Alerta, TipoAlerta
 
+# Buffer de 1 MiB para os arquivos de dados: menos syscalls de leitura
+# e escrita quando as coleções passam do tamanho do buffer padrão (8 KB)
+_TAM_BUFFER = 1 << 20
+
+# Acima deste tamanho o arquivo é mapeado em memória (mmap) e entregue
+# ao decodificador como memoryview, em vez de materializar os bytes
+# inteiros numa cópia própria antes do parse
+_LIMIAR_MMAP = 4 << 20
+
+# Bytes anexados ao NDJSON sem fsync antes de forçar um: um fsync por
+# linha mataria a vantagem do append O(1), então a durabilidade dos
+# appends é amortizada a cada 256 KiB acumulados
+_LIMIAR_FSYNC = 256 << 10
+
+# Membros de FormaPagamento por rótulo persistido (nome ou int),
+# construído uma vez no import: o laço de desserialização faz um lookup
+# de dict em vez de pagar o __call__ da metaclasse de Enum por registro
+_FORMA_POR_ROTULO: dict[Any, FormaPagamento] = {
+    **{m.name: m for m in FormaPagamento},
+    **{m.value: m for m in FormaPagamento},
+}
+
+
+def _internar(valor: Optional[str]) -> Optional[str]:
+    """
+    Interna uma string de identificador (tolerando None).
+
+    O decodificador JSON aloca uma str nova a cada ocorrência; IDs que
+    se repetem entre coleções (um lançamento referenciado por vários
+    orçamentos/alertas) passam a compartilhar o mesmo objeto, cortando
+    RSS e deixando os lookups por ID na comparação de ponteiro.
+    """
+    return intern(valor) if valor is not None else None
+
+
+@lru_cache(maxsize=2048)
+def _data_de_iso(valor: str) -> date:
+    """
+    Converte uma data ISO cacheando o resultado.
+
+    Um mês de lançamentos repete as mesmas poucas datas; como date é
+    imutável, a mesma instância pode ser compartilhada e as repetições
+    viram um hit de dict em vez de um novo parse.
+    """
+    return date.fromisoformat(valor)
+
 
 class JsonStorage:
     """
@@ -26,12 +86,74 @@ class JsonStorage:
         self._data_dir = Path(data_dir)
         self._data_dir.mkdir(parents=True, exist_ok=True)
         
-        # Arquivos de dados
+        # Arquivos de dados. Lançamentos ficam em NDJSON (um registro
+        # por linha): inserções viram append O(1) no fim do arquivo em
+        # vez de reescrita completa da lista (ver adicionar_lancamento)
         self._categorias_file = self._data_dir / "categorias.json"
-        self._lancamentos_file = self._data_dir / "lancamentos.json"
+        self._lancamentos_file = self._data_dir / "lancamentos.ndjson"
         self._orcamentos_file = self._data_dir / "orcamentos.json"
         self._alertas_file = self._data_dir / "alertas.json"
         self._settings_file = self._data_dir / "settings.json"
+
+        # Cache do JSON decodificado por arquivo, validado por
+        # (mtime_ns, tamanho): releituras de um arquivo inalterado viram
+        # um lookup em dict em vez de abrir + decodificar do zero
+        self._cache: dict[Path, tuple[int, int, Any]] = {}
+
+        # Escrita write-back (ver batch/flush): dentro de um lote as
+        # gravações ficam pendentes por arquivo e vão ao disco uma
+        # única vez na saída, com a última versão dos dados
+        self._batch_depth = 0
+        self._pendentes: dict[Path, Any] = {}
+
+        # Índices da última carga de cada coleção: os helpers de
+        # registro (buscar_*, excluir_*, marcar_*) recarregam antes de
+        # operar, então o lookup vira dict em vez de varredura da lista
+        self._categorias_por_id: dict[str, Categoria] = {}
+        self._categorias_por_nome: dict[tuple[str, TipoCategoria], Categoria] = {}
+        self._lancamentos_por_id: dict[str, Lancamento] = {}
+        self._alertas_por_id: dict[str, Alerta] = {}
+        self._orcamentos_por_mes_ano: dict[tuple[int, int], OrcamentoMensal] = {}
+
+        # Pool de instâncias por ID: recargas devolvem o mesmo objeto
+        # quando o registro em disco não mudou, em vez de realocar a
+        # coleção inteira (e dar ao GC a anterior) a cada carregar_*.
+        # Entradas são substituídas no próprio pool quando o registro
+        # muda; IDs excluídos só somem quando o pool é descartado junto
+        # com o storage, o que é aceitável para estas coleções pequenas
+        self._pool_categorias: dict[str, Categoria] = {}
+        self._pool_alertas: dict[str, Alerta] = {}
+
+        # Camada acima do cache decodificado: a lista de modelos já
+        # construída, validada pelo mesmo (mtime_ns, tamanho). No caminho
+        # comum (arquivo inalterado) a recarga devolve uma cópia rasa da
+        # lista e não paga nem o from_dict nem a checagem do pool
+        self._modelos_cache: dict[Path, tuple[int, int, list]] = {}
+        # Lançamentos dependem da lista de categorias do chamador, então
+        # o cache deles guarda também a referência e o tamanho dela
+        self._lanc_modelos_cache: Optional[
+            tuple[int, int, list[Categoria], int, list[Lancamento]]
+        ] = None
+
+        # Hash dos bytes gravados por último em cada arquivo: regravações
+        # idênticas ao que já está no disco são descartadas sem IO
+        self._ultimo_hash: dict[Path, tuple[int, bytes]] = {}
+
+        # Bytes anexados ao log NDJSON desde o último fsync: quando o
+        # acumulado passa de _LIMIAR_FSYNC o próximo append força a
+        # sincronização (durabilidade amortizada, não por linha)
+        self._unsynced_bytes = 0
+
+        # Memoização do mapa de categorias por ID usado ao carregar
+        # lançamentos: (lista de origem, len na época, mapa). Reutilizado
+        # enquanto o chamador passar a mesma lista com o mesmo tamanho
+        self._cat_map_cache: Optional[tuple[list[Categoria], int, dict[str, Categoria]]] = None
+
+        # Mesma memoização para os mapas de vinculação de orçamentos:
+        # chamadas repetidas (buscar_orcamento em sequência na UI) com
+        # as mesmas listas inalteradas reaproveitam os mapas prontos
+        self._lanc_map_cache: Optional[tuple[list[Lancamento], int, dict[str, Lancamento]]] = None
+        self._alerta_map_cache: Optional[tuple[list[Alerta], int, dict[str, Alerta]]] = None
     
     # ==================== PROPRIEDADES ====================
     
@@ -40,6 +162,42 @@ class JsonStorage:
         """Retorna o diretório de dados."""
         return self._data_dir
     
+    # ==================== CACHE DE MODELOS ====================
+
+    def _modelos_cacheados(self, filepath: Path) -> Optional[list]:
+        """
+        Devolve a lista de modelos cacheada se o arquivo não mudou.
+
+        A cópia é rasa de propósito: as instâncias são compartilhadas
+        (mesma garantia do pool), mas cada chamador recebe uma lista
+        própria que pode ordenar e mutar sem corromper o cache.
+        """
+        if filepath in self._pendentes:
+            return None
+        entrada = self._modelos_cache.get(filepath)
+        if entrada is None:
+            return None
+        try:
+            st = filepath.stat()
+        except OSError:
+            return None
+        if entrada[0] == st.st_mtime_ns and entrada[1] == st.st_size:
+            return list(entrada[2])
+        return None
+
+    def _guardar_modelos(self, filepath: Path, modelos: list) -> None:
+        """Registra a lista de modelos vigente para o estado atual do arquivo."""
+        if filepath in self._pendentes:
+            # Dentro de um lote o disco está defasado; o cache só volta
+            # a valer quando o flush gravar e o mtime assentar
+            self._modelos_cache.pop(filepath, None)
+            return
+        try:
+            st = filepath.stat()
+        except OSError:
+            return
+        self._modelos_cache[filepath] = (st.st_mtime_ns, st.st_size, list(modelos))
+
     # ==================== MÉTODOS DE CATEGORIAS ====================
     
     def salvar_categorias(self, categorias: list[Categoria]) -> None:
@@ -50,7 +208,11 @@ class JsonStorage:
             categorias: Lista de categorias a salvar
         """
         data = [cat.to_dict() for cat in categorias]
+        self._cat_map_cache = None  # o conjunto de categorias mudou
         self._escrever_json(self._categorias_file, data)
+        # A lista recém-gravada já é a forma carregada: a próxima
+        # recarga não precisa nem do from_dict
+        self._guardar_modelos(self._categorias_file, categorias)
     
     def carregar_categorias(self) -> list[Categoria]:
         """
@@ -59,11 +221,38 @@ class JsonStorage:
         Returns:
             Lista de categorias carregadas
         """
+        categorias = self._modelos_cacheados(self._categorias_file)
+        if categorias is not None:
+            self._categorias_por_id = {cat.id: cat for cat in categorias}
+            self._categorias_por_nome = {
+                (cat._nome_lower, cat.tipo): cat for cat in categorias
+            }
+            return categorias
+
         data = self._ler_json(self._categorias_file)
         if not data:
+            self._categorias_por_id = {}
+            self._categorias_por_nome = {}
             return []
-        return [Categoria.from_dict(cat_data) for cat_data in data]
-    
+
+        # Reutiliza do pool as categorias cujo registro não mudou: o
+        # to_dict cacheado torna a comparação um == de dicts prontos
+        pool = self._pool_categorias
+        categorias = []
+        for cat_data in data:
+            categoria = pool.get(cat_data.get("id"))
+            if categoria is None or categoria.to_dict() != cat_data:
+                categoria = Categoria.from_dict(cat_data)
+                pool[categoria.id] = categoria
+            categorias.append(categoria)
+
+        self._categorias_por_id = {cat.id: cat for cat in categorias}
+        self._categorias_por_nome = {
+            (cat._nome_lower, cat.tipo): cat for cat in categorias
+        }
+        self._guardar_modelos(self._categorias_file, categorias)
+        return categorias
+
     def adicionar_categoria(self, categoria: Categoria) -> None:
         """
         Adiciona uma categoria ao arquivo JSON.
@@ -72,14 +261,13 @@ class JsonStorage:
             categoria: Categoria a adicionar
         """
         categorias = self.carregar_categorias()
-        
-        # Verificar duplicidade
-        for cat in categorias:
-            if cat == categoria:
-                raise ValueError(
-                    f"Categoria '{categoria.nome}' do tipo {categoria.tipo.value} já existe."
-                )
-        
+
+        # Verificar duplicidade (lookup O(1) no índice por nome/tipo)
+        if (categoria._nome_lower, categoria.tipo) in self._categorias_por_nome:
+            raise ValueError(
+                f"Categoria '{categoria.nome}' do tipo {categoria.tipo.value} já existe."
+            )
+
         categorias.append(categoria)
         self.salvar_categorias(categorias)
     
@@ -91,14 +279,14 @@ class JsonStorage:
             categoria: Categoria com dados atualizados
         """
         categorias = self.carregar_categorias()
-        
-        for i, cat in enumerate(categorias):
-            if cat.id == categoria.id:
-                categorias[i] = categoria
-                self.salvar_categorias(categorias)
-                return
-        
-        raise ValueError(f"Categoria com ID '{categoria.id}' não encontrada.")
+
+        atual = self._categorias_por_id.get(categoria.id)
+        if atual is None:
+            raise ValueError(f"Categoria com ID '{categoria.id}' não encontrada.")
+
+        # index() com atalho de identidade: sem __eq__ por elemento
+        categorias[categorias.index(atual)] = categoria
+        self.salvar_categorias(categorias)
     
     def excluir_categoria(self, categoria_id: str) -> Optional[Categoria]:
         """
@@ -111,14 +299,14 @@ class JsonStorage:
             A categoria excluída, ou None se não encontrada
         """
         categorias = self.carregar_categorias()
-        
-        for i, cat in enumerate(categorias):
-            if cat.id == categoria_id:
-                categoria_excluida = categorias.pop(i)
-                self.salvar_categorias(categorias)
-                return categoria_excluida
-        
-        return None
+
+        categoria_excluida = self._categorias_por_id.get(categoria_id)
+        if categoria_excluida is None:
+            return None
+
+        categorias.remove(categoria_excluida)
+        self.salvar_categorias(categorias)
+        return categoria_excluida
     
     def buscar_categoria(self, categoria_id: str) -> Optional[Categoria]:
         """
@@ -130,11 +318,8 @@ class JsonStorage:
         Returns:
             A categoria encontrada, ou None
         """
-        categorias = self.carregar_categorias()
-        for cat in categorias:
-            if cat.id == categoria_id:
-                return cat
-        return None
+        self.carregar_categorias()
+        return self._categorias_por_id.get(categoria_id)
     
     def buscar_categoria_por_nome(
         self, nome: str, tipo: TipoCategoria
@@ -149,11 +334,8 @@ class JsonStorage:
         Returns:
             A categoria encontrada, ou None
         """
-        categorias = self.carregar_categorias()
-        for cat in categorias:
-            if cat.nome.lower() == nome.lower() and cat.tipo == tipo:
-                return cat
-        return None
+        self.carregar_categorias()
+        return self._categorias_por_nome.get((nome.lower(), tipo))
     
     # ==================== MÉTODOS DE LANÇAMENTOS ====================
     
@@ -165,7 +347,9 @@ class JsonStorage:
             lancamentos: Lista de lançamentos a salvar
         """
         data = [lanc.to_dict() for lanc in lancamentos]
-        self._escrever_json(self._lancamentos_file, data)
+        self._lanc_map_cache = None  # o conjunto de lançamentos mudou
+        self._lanc_modelos_cache = None
+        self._escrever_ndjson(self._lancamentos_file, data)
     
     def carregar_lancamentos(self, categorias: list[Categoria]) -> list[Lancamento]:
         """
@@ -177,59 +361,92 @@ class JsonStorage:
         Returns:
             Lista de lançamentos carregados
         """
-        data = self._ler_json(self._lancamentos_file)
+        # Lista de modelos cacheada: vale enquanto o arquivo e a lista
+        # de categorias do chamador forem os mesmos da última carga
+        cache_modelos = self._lanc_modelos_cache
+        if (
+            cache_modelos is not None
+            and cache_modelos[2] is categorias
+            and cache_modelos[3] == len(categorias)
+            and self._lancamentos_file not in self._pendentes
+        ):
+            try:
+                st = self._lancamentos_file.stat()
+            except OSError:
+                st = None
+            if (
+                st is not None
+                and cache_modelos[0] == st.st_mtime_ns
+                and cache_modelos[1] == st.st_size
+            ):
+                lancamentos = list(cache_modelos[4])
+                self._lancamentos_por_id = {lanc.id: lanc for lanc in lancamentos}
+                return lancamentos
+
+        data = self._ler_ndjson(self._lancamentos_file)
         if not data:
+            self._lancamentos_por_id = {}
             return []
-        
-        # Criar mapa de categorias por ID
-        cat_map = {cat.id: cat for cat in categorias}
-        
-        lancamentos = []
-        for lanc_data in data:
-            categoria = cat_map.get(lanc_data["categoria_id"])
-            if not categoria:
-                continue  # Pular lançamentos com categoria inválida
-            
-            lancamento = self._criar_lancamento_de_dict(lanc_data, categoria)
-            if lancamento:
-                lancamentos.append(lancamento)
-        
+
+        # Criar mapa de categorias por ID (memoizado entre chamadas que
+        # repassam a mesma lista inalterada)
+        cache = self._cat_map_cache
+        if cache is not None and cache[0] is categorias and cache[1] == len(categorias):
+            cat_map = cache[2]
+        else:
+            cat_map = {cat.id: cat for cat in categorias}
+            self._cat_map_cache = (categorias, len(categorias), cat_map)
+
+        # Laço quente de desserialização: enum via tabela pré-construída,
+        # fromisoformat com bind local e construção pelo caminho
+        # _unchecked (os dados já foram validados na gravação)
+        formas = _FORMA_POR_ROTULO
+        fromiso = _data_de_iso
+        classes = {"RECEITA": Receita, "DESPESA": Despesa}
+        buscar_categoria = cat_map.get
+        # List comprehension no lugar de append por iteração: menos
+        # bytecode por registro e lista alocada de uma vez; registros com
+        # categoria inválida ou tipo desconhecido são pulados no filtro
+        lancamentos = [
+            classe._unchecked(
+                _internar(lanc_data.get("id")),
+                lanc_data["valor"],
+                categoria,
+                fromiso(lanc_data["data"]),
+                lanc_data["descricao"],
+                # Aceita tanto o nome (formato persistido) quanto o int
+                formas[lanc_data["forma_pagamento"]],
+            )
+            for lanc_data in data
+            if (categoria := buscar_categoria(lanc_data["categoria_id"])) is not None
+            and (classe := classes.get(lanc_data.get("tipo"))) is not None
+        ]
+
+        self._lancamentos_por_id = {lanc.id: lanc for lanc in lancamentos}
+        if self._lancamentos_file not in self._pendentes:
+            try:
+                st = self._lancamentos_file.stat()
+            except OSError:
+                st = None
+            if st is not None:
+                self._lanc_modelos_cache = (
+                    st.st_mtime_ns, st.st_size,
+                    categorias, len(categorias), list(lancamentos),
+                )
         return lancamentos
     
-    def _criar_lancamento_de_dict(
-        self, data: dict, categoria: Categoria
-    ) -> Optional[Lancamento]:
-        """Cria um lançamento a partir de dados do dicionário."""
-        tipo = data.get("tipo")
-        
-        kwargs = {
-            "id": data.get("id"),
-            "valor": data["valor"],
-            "categoria": categoria,
-            "data": date.fromisoformat(data["data"]),
-            "descricao": data["descricao"],
-            "forma_pagamento": FormaPagamento(data["forma_pagamento"]),
-        }
-        
-        if tipo == "RECEITA":
-            return Receita(**kwargs)
-        elif tipo == "DESPESA":
-            return Despesa(**kwargs)
-        return None
-    
     def adicionar_lancamento(
         self, lancamento: Lancamento, categorias: list[Categoria]
     ) -> None:
         """
-        Adiciona um lançamento ao arquivo JSON.
-        
+        Adiciona um lançamento ao log NDJSON (append O(1), sem reler
+        nem reescrever o restante do arquivo).
+
         Args:
             lancamento: Lançamento a adicionar
-            categorias: Lista de categorias para validação
+            categorias: Mantido por compatibilidade de assinatura
         """
-        lancamentos = self.carregar_lancamentos(categorias)
-        lancamentos.append(lancamento)
-        self.salvar_lancamentos(lancamentos)
+        self._anexar_ndjson(self._lancamentos_file, lancamento.to_dict())
     
     def excluir_lancamento(
         self, lancamento_id: str, categorias: list[Categoria]
@@ -245,14 +462,14 @@ class JsonStorage:
             O lançamento excluído, ou None se não encontrado
         """
         lancamentos = self.carregar_lancamentos(categorias)
-        
-        for i, lanc in enumerate(lancamentos):
-            if lanc.id == lancamento_id:
-                lancamento_excluido = lancamentos.pop(i)
-                self.salvar_lancamentos(lancamentos)
-                return lancamento_excluido
-        
-        return None
+
+        lancamento_excluido = self._lancamentos_por_id.get(lancamento_id)
+        if lancamento_excluido is None:
+            return None
+
+        lancamentos.remove(lancamento_excluido)
+        self.salvar_lancamentos(lancamentos)
+        return lancamento_excluido
     
     # ==================== MÉTODOS DE ORÇAMENTOS ====================
     
@@ -285,26 +502,45 @@ class JsonStorage:
         if not data:
             return []
         
-        # Criar mapas por ID
-        lanc_map = {lanc.id: lanc for lanc in lancamentos}
-        alerta_map = {alerta.id: alerta for alerta in alertas}
+        # Criar mapas por ID (memoizados entre chamadas que repassam as
+        # mesmas listas inalteradas — guarda por identidade + tamanho,
+        # como o mapa de categorias em carregar_lancamentos)
+        cache = self._lanc_map_cache
+        if cache is not None and cache[0] is lancamentos and cache[1] == len(lancamentos):
+            lanc_map = cache[2]
+        else:
+            lanc_map = {lanc.id: lanc for lanc in lancamentos}
+            self._lanc_map_cache = (lancamentos, len(lancamentos), lanc_map)
+
+        cache = self._alerta_map_cache
+        if cache is not None and cache[0] is alertas and cache[1] == len(alertas):
+            alerta_map = cache[2]
+        else:
+            alerta_map = {alerta.id: alerta for alerta in alertas}
+            self._alerta_map_cache = (alertas, len(alertas), alerta_map)
         
         orcamentos = []
         for orc_data in data:
             orcamento = OrcamentoMensal.from_dict(orc_data)
             
-            # Vincular lançamentos
-            for lanc_id in orc_data.get("lancamentos_ids", []):
-                if lanc_id in lanc_map:
-                    orcamento._lancamentos.append(lanc_map[lanc_id])
-            
-            # Vincular alertas
-            for alerta_id in orc_data.get("alertas_ids", []):
-                if alerta_id in alerta_map:
-                    orcamento._alertas.append(alerta_map[alerta_id])
+            # Vincular lançamentos (mantém os agregados incrementais do
+            # orçamento); map + bind local tiram os lookups do laço
+            vincular_lanc = orcamento._vincular_lancamento
+            # intern antes do lookup: as chaves dos mapas também são
+            # internadas, então o get resolve por identidade
+            for lanc in map(lanc_map.get, map(intern, orc_data.get("lancamentos_ids", []))):
+                if lanc is not None:
+                    vincular_lanc(lanc)
+
+            # Vincular alertas (mantém a flag de déficit do orçamento)
+            vincular_alerta = orcamento._vincular_alerta
+            for alerta in map(alerta_map.get, map(intern, orc_data.get("alertas_ids", []))):
+                if alerta is not None:
+                    vincular_alerta(alerta)
             
             orcamentos.append(orcamento)
-        
+
+        self._orcamentos_por_mes_ano = {orc.mes_ano: orc for orc in orcamentos}
         return orcamentos
     
     def buscar_orcamento(
@@ -322,11 +558,8 @@ class JsonStorage:
         Returns:
             O orçamento encontrado, ou None
         """
-        orcamentos = self.carregar_orcamentos(lancamentos, alertas)
-        for orc in orcamentos:
-            if orc.mes == mes and orc.ano == ano:
-                return orc
-        return None
+        self.carregar_orcamentos(lancamentos, alertas)
+        return self._orcamentos_por_mes_ano.get((mes, ano))
     
     def criar_ou_atualizar_orcamento(
         self, 
@@ -343,17 +576,16 @@ class JsonStorage:
             alertas: Lista de alertas para carregar
         """
         orcamentos = self.carregar_orcamentos(lancamentos, alertas)
-        
-        # Verificar se já existe
-        for i, orc in enumerate(orcamentos):
-            if orc.mes_ano == orcamento.mes_ano:
-                orcamentos[i] = orcamento
-                self.salvar_orcamentos(orcamentos)
-                return
-        
-        # Adicionar novo
-        orcamentos.append(orcamento)
-        orcamentos.sort()
+
+        # Verificar se já existe (lookup O(1) no índice por mês/ano)
+        atual = self._orcamentos_por_mes_ano.get(orcamento.mes_ano)
+        if atual is not None:
+            orcamentos[orcamentos.index(atual)] = orcamento
+            self.salvar_orcamentos(orcamentos)
+            return
+
+        # Adicionar novo (inserção ordenada: a lista já está em ordem)
+        insort(orcamentos, orcamento)
         self.salvar_orcamentos(orcamentos)
     
     # ==================== MÉTODOS DE ALERTAS ====================
@@ -366,7 +598,9 @@ class JsonStorage:
             alertas: Lista de alertas a salvar
         """
         data = [alerta.to_dict() for alerta in alertas]
+        self._alerta_map_cache = None  # o conjunto de alertas mudou
         self._escrever_json(self._alertas_file, data)
+        self._guardar_modelos(self._alertas_file, alertas)
     
     def carregar_alertas(self) -> list[Alerta]:
         """
@@ -375,10 +609,43 @@ class JsonStorage:
         Returns:
             Lista de alertas carregados
         """
+        alertas = self._modelos_cacheados(self._alertas_file)
+        if alertas is not None:
+            self._alertas_por_id = {alerta.id: alerta for alerta in alertas}
+            return alertas
+
         data = self._ler_json(self._alertas_file)
         if not data:
+            self._alertas_por_id = {}
             return []
-        return [Alerta.from_dict(alerta_data) for alerta_data in data]
+
+        # IDs repetidos entre coleções (o mesmo lançamento/categoria
+        # referenciado por vários alertas) viram um único objeto str
+        internar = _internar
+        for alerta_data in data:
+            alerta_data["id"] = internar(alerta_data.get("id"))
+            alerta_data["lancamento_id"] = internar(alerta_data.get("lancamento_id"))
+            alerta_data["categoria_id"] = internar(alerta_data.get("categoria_id"))
+            # Normaliza para tupla (forma do to_dict): o JSON decodifica
+            # arrays como listas, o que quebraria o == do pool abaixo
+            mes_ano = alerta_data.get("mes_ano")
+            if mes_ano is not None:
+                alerta_data["mes_ano"] = tuple(mes_ano)
+
+        # Reutiliza do pool os alertas cujo registro não mudou (mesmo
+        # esquema do pool de categorias em carregar_categorias)
+        pool = self._pool_alertas
+        alertas = []
+        for alerta_data in data:
+            alerta = pool.get(alerta_data["id"])
+            if alerta is None or alerta.to_dict() != alerta_data:
+                alerta = Alerta.from_dict(alerta_data)
+                pool[alerta.id] = alerta
+            alertas.append(alerta)
+
+        self._alertas_por_id = {alerta.id: alerta for alerta in alertas}
+        self._guardar_modelos(self._alertas_file, alertas)
+        return alertas
     
     def adicionar_alerta(self, alerta: Alerta) -> None:
         """
@@ -402,14 +669,14 @@ class JsonStorage:
             True se o alerta foi marcado, False se não encontrado
         """
         alertas = self.carregar_alertas()
-        
-        for alerta in alertas:
-            if alerta.id == alerta_id:
-                alerta.marcar_como_lido()
-                self.salvar_alertas(alertas)
-                return True
-        
-        return False
+
+        alerta = self._alertas_por_id.get(alerta_id)
+        if alerta is None:
+            return False
+
+        alerta.marcar_como_lido()
+        self.salvar_alertas(alertas)
+        return True
     
     # ==================== MÉTODOS DE CONFIGURAÇÕES ====================
     
@@ -430,7 +697,7 @@ class JsonStorage:
         Args:
             config: Dicionário de configurações
         """
-        self._escrever_json(self._settings_file, config)
+        self._escrever_json(self._settings_file, config, pretty=True)
     
     def _configuracoes_padrao(self) -> dict[str, Any]:
         """Retorna as configurações padrão do sistema."""
@@ -446,45 +713,281 @@ class JsonStorage:
     
     def _ler_json(self, filepath: Path) -> Optional[Any]:
         """
-        Lê dados de um arquivo JSON.
-        
+        Lê dados de um arquivo JSON (com cache invalidado por mtime).
+
         Args:
             filepath: Caminho do arquivo
-            
+
         Returns:
             Dados lidos, ou None se o arquivo não existir
         """
-        if not filepath.exists():
+        # Escrita pendente de um lote é a versão mais recente dos dados
+        pendente = self._pendentes.get(filepath)
+        if pendente is not None:
+            return deepcopy(pendente[0])
+
+        try:
+            st = filepath.stat()
+        except OSError:
             return None
-        
+
+        entrada = self._cache.get(filepath)
+        if entrada is not None and entrada[0] == st.st_mtime_ns and entrada[1] == st.st_size:
+            # Cópia defensiva: o objeto cacheado precisa continuar
+            # espelhando o que está em disco
+            return deepcopy(entrada[2])
+
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            if orjson is not None and st.st_size > _LIMIAR_MMAP:
+                # Arquivo grande: decodifica direto das páginas mapeadas
+                with open(filepath, "rb") as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        data = orjson.loads(memoryview(mm))
+            else:
+                with open(filepath, "rb", buffering=_TAM_BUFFER) as f:
+                    bruto = f.read()
+                data = orjson.loads(bruto) if orjson is not None else json.loads(bruto)
+        except (ValueError, IOError) as e:
             print(f"Erro ao ler {filepath}: {e}")
             return None
+
+        self._cache[filepath] = (st.st_mtime_ns, st.st_size, data)
+        return data
     
-    def _escrever_json(self, filepath: Path, data: Any) -> None:
+    def _escrever_json(
+        self, filepath: Path, data: Any, pretty: bool = False,
+        *, durable: bool = False
+    ) -> None:
         """
-        Escreve dados em um arquivo JSON.
-        
+        Escreve dados em um arquivo JSON (escrita atômica).
+
+        A serialização acontece inteira em memória e o resultado é
+        gravado em bytes num arquivo temporário renomeado sobre o final:
+        uma única escrita bufferizada por salvamento e nenhum arquivo
+        parcial em caso de interrupção.
+
+        Os arquivos de dados saem compactos (indentação ~dobra os bytes
+        escritos e o custo de serializar); só quem pede pretty=True,
+        como o settings.json editável à mão, recebe saída indentada.
+
+        Por padrão a escrita é não-durável: os bytes vão ao page cache
+        e o SO decide quando tocar o disco. Quem precisar sobreviver a
+        queda de energia passa durable=True, que custa um único fsync
+        por salvamento (escritas em lote, via batch(), são sempre
+        não-duráveis: o flush grava a versão final sem fsync).
+
         Args:
             filepath: Caminho do arquivo
             data: Dados a escrever
+            pretty: Se True, indenta a saída para leitura humana
+            durable: Se True, faz fsync após a escrita
+        """
+        if self._batch_depth > 0:
+            # Dentro de um lote só a última versão de cada arquivo
+            # interessa: N regravações viram uma no flush
+            self._pendentes[filepath] = (data, pretty)
+            return
+
+        if orjson is not None:
+            conteudo = orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 if pretty else 0
+            )
+        elif pretty:
+            conteudo = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        else:
+            conteudo = json.dumps(
+                data, ensure_ascii=False, separators=(",", ":")
+            ).encode("utf-8")
+        self._gravar_bytes(filepath, conteudo, data, durable=durable)
+
+    def _gravar_bytes(
+        self, filepath: Path, conteudo: bytes, data: Any,
+        *, durable: bool = False
+    ) -> None:
+        """Grava bytes de forma atômica e repovoa o cache decodificado."""
+        # Curto-circuito de no-op: se os bytes são idênticos aos da
+        # última gravação e o disco não mudou desde então, não há o que
+        # escrever — só o objeto decodificado do cache é renovado.
+        # Digest criptográfico + tamanho: hash() de 64 bits admite
+        # colisão, o que descartaria uma gravação real em silêncio
+        h = (len(conteudo), hashlib.blake2b(conteudo).digest())
+        if self._ultimo_hash.get(filepath) == h:
+            entrada = self._cache.get(filepath)
+            if entrada is not None:
+                try:
+                    st = filepath.stat()
+                except OSError:
+                    st = None
+                if st is not None and entrada[0] == st.st_mtime_ns and entrada[1] == st.st_size:
+                    self._cache[filepath] = (st.st_mtime_ns, st.st_size, data)
+                    return
+
+        tmp_path = filepath.with_suffix(filepath.suffix + ".tmp")
+        try:
+            with open(tmp_path, "wb", buffering=_TAM_BUFFER) as f:
+                f.write(conteudo)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, filepath)
+        except IOError as e:
+            print(f"Erro ao escrever {filepath}: {e}")
+            raise
+
+        # Repovoar o cache com o que acabou de ir para o disco: a
+        # próxima leitura nem decodifica o arquivo
+        st = filepath.stat()
+        self._cache[filepath] = (st.st_mtime_ns, st.st_size, data)
+        self._ultimo_hash[filepath] = h
+
+    # ==================== NDJSON (LANÇAMENTOS) ====================
+
+    def _ler_ndjson(self, filepath: Path) -> Optional[list]:
         """
+        Lê um arquivo NDJSON (um registro JSON por linha), com o mesmo
+        cache por (mtime_ns, tamanho) de _ler_json.
+        """
+        pendente = self._pendentes.get(filepath)
+        if pendente is not None:
+            return deepcopy(pendente[0])
+
+        try:
+            st = filepath.stat()
+        except OSError:
+            return None
+
+        entrada = self._cache.get(filepath)
+        if entrada is not None and entrada[0] == st.st_mtime_ns and entrada[1] == st.st_size:
+            return deepcopy(entrada[2])
+
+        loads = orjson.loads if orjson is not None else json.loads
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with open(filepath, "rb", buffering=_TAM_BUFFER) as f:
+                data = [loads(linha) for linha in f if linha.strip()]
+        except (ValueError, IOError) as e:
+            print(f"Erro ao ler {filepath}: {e}")
+            return None
+
+        self._cache[filepath] = (st.st_mtime_ns, st.st_size, data)
+        return data
+
+    def _serializar_linha(self, item: Any) -> bytes:
+        """Serializa um registro NDJSON (compacto, terminado em \\n)."""
+        if orjson is not None:
+            return orjson.dumps(item) + b"\n"
+        return (
+            json.dumps(item, ensure_ascii=False, separators=(",", ":")) + "\n"
+        ).encode("utf-8")
+
+    def _escrever_ndjson(
+        self, filepath: Path, data: list, *, durable: bool = False
+    ) -> None:
+        """Reescreve um arquivo NDJSON inteiro (escrita atômica)."""
+        if self._batch_depth > 0:
+            self._pendentes[filepath] = (data, False)
+            return
+        conteudo = b"".join(self._serializar_linha(item) for item in data)
+        self._gravar_bytes(filepath, conteudo, data, durable=durable)
+        # A reescrita substitui o arquivo: o acumulado de appends
+        # não-sincronizados deixa de existir
+        self._unsynced_bytes = 0
+
+    def _anexar_ndjson(self, filepath: Path, item: Any) -> None:
+        """
+        Anexa um registro ao final de um arquivo NDJSON.
+
+        É o caminho O(1) de inserção: uma linha é escrita em modo append
+        sem reler nem reescrever o restante do arquivo. Se o cache ainda
+        espelha o disco, o item entra na cópia em memória e a próxima
+        leitura continua sem decodificar nada.
+
+        Durabilidade amortizada: em vez de um fsync por linha (que
+        serializaria cada append na latência do disco), os bytes
+        anexados são contados e um fsync só acontece quando o acumulado
+        passa de _LIMIAR_FSYNC.
+        """
+        if self._batch_depth > 0:
+            data = self._ler_ndjson(filepath) or []
+            data.append(item)
+            self._pendentes[filepath] = (data, False)
+            return
+
+        entrada = self._cache.get(filepath)
+        cache_valido = False
+        if entrada is not None:
+            try:
+                st = filepath.stat()
+                cache_valido = (
+                    entrada[0] == st.st_mtime_ns and entrada[1] == st.st_size
+                )
+            except OSError:
+                cache_valido = False
+
+        try:
+            linha = self._serializar_linha(item)
+            with open(filepath, "ab") as f:
+                f.write(linha)
+                self._unsynced_bytes += len(linha)
+                if self._unsynced_bytes > _LIMIAR_FSYNC:
+                    f.flush()
+                    os.fsync(f.fileno())
+                    self._unsynced_bytes = 0
         except IOError as e:
             print(f"Erro ao escrever {filepath}: {e}")
             raise
-    
+        # O conteúdo do arquivo divergiu da última gravação completa
+        self._ultimo_hash.pop(filepath, None)
+
+        if cache_valido:
+            entrada[2].append(item)
+            st = filepath.stat()
+            self._cache[filepath] = (st.st_mtime_ns, st.st_size, entrada[2])
+        else:
+            self._cache.pop(filepath, None)
+
+    @contextmanager
+    def batch(self) -> Iterator["JsonStorage"]:
+        """
+        Agrupa gravações: dentro do bloco as escritas ficam pendentes em
+        memória (e visíveis às leituras) e, na saída, cada arquivo sujo
+        é gravado uma única vez com a versão final dos dados.
+
+        Espelha o batch() do GerenciadorDados, mas no nível do storage:
+        útil para quem usa os helpers de registro (adicionar_categoria,
+        adicionar_lancamento, ...) em laço, onde cada chamada faria uma
+        reescrita completa do arquivo.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            self.flush()
+
+    def flush(self) -> None:
+        """Grava agora os arquivos com escrita pendente de lote."""
+        if self._batch_depth == 0 and self._pendentes:
+            pendentes, self._pendentes = self._pendentes, {}
+            for filepath, (data, pretty) in pendentes.items():
+                if filepath.suffix == ".ndjson":
+                    self._escrever_ndjson(filepath, data)
+                else:
+                    self._escrever_json(filepath, data, pretty)
+
     def inicializar_dados(self) -> None:
         """Inicializa os arquivos de dados se não existirem."""
         if not self._categorias_file.exists():
             self._escrever_json(self._categorias_file, [])
         if not self._lancamentos_file.exists():
-            self._escrever_json(self._lancamentos_file, [])
+            # Migração única do formato antigo (array em lancamentos.json)
+            legado = self._data_dir / "lancamentos.json"
+            if legado.exists():
+                self._escrever_ndjson(
+                    self._lancamentos_file, self._ler_json(legado) or []
+                )
+                legado.unlink()
+            else:
+                self._escrever_ndjson(self._lancamentos_file, [])
         if not self._orcamentos_file.exists():
             self._escrever_json(self._orcamentos_file, [])
         if not self._alertas_file.exists():
@@ -492,7 +995,15 @@ class JsonStorage:
     
     def limpar_dados(self) -> None:
         """Limpa todos os dados (cuidado!)."""
+        _data_de_iso.cache_clear()
+        self._pool_categorias.clear()
+        self._pool_alertas.clear()
+        self._modelos_cache.clear()
+        self._lanc_modelos_cache = None
+        self._cat_map_cache = None
+        self._lanc_map_cache = None
+        self._alerta_map_cache = None
         self._escrever_json(self._categorias_file, [])
-        self._escrever_json(self._lancamentos_file, [])
+        self._escrever_ndjson(self._lancamentos_file, [])
         self._escrever_json(self._orcamentos_file, [])
         self._escrever_json(self._alertas_file, [])
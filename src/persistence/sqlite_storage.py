@@ -0,0 +1,727 @@
+"""
+Módulo de Persistência SQLite - Backend alternativo ao JsonStorage.
+"""
+
+import json
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from ..models.categoria import Categoria, TipoCategoria
+from ..models.lancamento import Lancamento, Receita, Despesa, FormaPagamento
+from ..models.orcamento import OrcamentoMensal
+from ..models.alerta import Alerta
+
+from .json_storage import JsonStorage, _FORMA_POR_ROTULO, _data_de_iso
+
+# Esquema criado em inicializar_dados. IDs continuam sendo as strings
+# geradas pelos modelos (novo_id); os índices cobrem os filtros das
+# consultas quentes (lançamentos por categoria e por data)
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS categorias (
+    id TEXT PRIMARY KEY,
+    nome TEXT NOT NULL,
+    tipo TEXT NOT NULL,
+    limite_mensal REAL,
+    descricao TEXT
+);
+CREATE TABLE IF NOT EXISTS lancamentos (
+    id TEXT PRIMARY KEY,
+    tipo TEXT NOT NULL,
+    valor REAL NOT NULL,
+    categoria_id TEXT NOT NULL REFERENCES categorias(id),
+    data TEXT NOT NULL,
+    descricao TEXT NOT NULL,
+    forma_pagamento TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_lancamentos_categoria
+    ON lancamentos(categoria_id);
+CREATE INDEX IF NOT EXISTS idx_lancamentos_data
+    ON lancamentos(data);
+CREATE TABLE IF NOT EXISTS alertas (
+    id TEXT PRIMARY KEY,
+    tipo TEXT NOT NULL,
+    mensagem TEXT NOT NULL,
+    data_criacao TEXT,
+    lancamento_id TEXT,
+    categoria_id TEXT,
+    mes INTEGER,
+    ano INTEGER,
+    lido INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS orcamentos (
+    id TEXT PRIMARY KEY,
+    mes INTEGER NOT NULL,
+    ano INTEGER NOT NULL,
+    receitas_previstas REAL NOT NULL DEFAULT 0,
+    UNIQUE (mes, ano)
+);
+CREATE TABLE IF NOT EXISTS orcamento_lancamentos (
+    orcamento_id TEXT NOT NULL REFERENCES orcamentos(id) ON DELETE CASCADE,
+    lancamento_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_orc_lanc_orcamento
+    ON orcamento_lancamentos(orcamento_id);
+CREATE TABLE IF NOT EXISTS orcamento_alertas (
+    orcamento_id TEXT NOT NULL REFERENCES orcamentos(id) ON DELETE CASCADE,
+    alerta_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_orc_alerta_orcamento
+    ON orcamento_alertas(orcamento_id);
+CREATE TABLE IF NOT EXISTS configuracoes (
+    chave TEXT PRIMARY KEY,
+    valor TEXT NOT NULL
+);
+"""
+
+
+class SqliteStorage:
+    """
+    Persistência em SQLite com a mesma interface do JsonStorage.
+
+    Enquanto o backend JSON reescreve o arquivo inteiro a cada mutação
+    (IO O(N) por operação), aqui inserções, exclusões e atualizações são
+    O(log N) sobre índices do banco, e cada transação agrupa o fsync:
+    WAL + synchronous=NORMAL sincronizam uma vez por commit em vez de
+    uma vez por escrita. O JsonStorage segue disponível para
+    importação/exportação; na primeira abertura de um diretório que só
+    tem os arquivos JSON, os dados são migrados automaticamente.
+
+    Attributes:
+        data_dir: Diretório onde o banco é armazenado
+    """
+
+    def __init__(self, data_dir: str = "data"):
+        self._data_dir = Path(data_dir)
+        self._data_dir.mkdir(parents=True, exist_ok=True)
+        self._db_file = self._data_dir / "controle_despesas.db"
+
+        # isolation_level=None: autocommit, com transações explícitas
+        # em _transacao()/batch() — o wrapper padrão do sqlite3 abriria
+        # e confirmaria transações em momentos difíceis de agrupar
+        self._conn = sqlite3.connect(self._db_file, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+
+        # Profundidade de lote: dentro de batch() as mutações entram na
+        # mesma transação e o fsync acontece uma única vez no commit
+        self._batch_depth = 0
+
+    # ==================== PROPRIEDADES ====================
+
+    @property
+    def data_dir(self) -> Path:
+        """Retorna o diretório de dados."""
+        return self._data_dir
+
+    # ==================== TRANSAÇÕES ====================
+
+    @contextmanager
+    def _transacao(self) -> Iterator[sqlite3.Connection]:
+        """
+        Executa um bloco dentro de uma transação.
+
+        Fora de um lote, abre BEGIN e confirma (ou desfaz) ao final — um
+        fsync por operação lógica, não por statement. Dentro de batch(),
+        apenas reutiliza a transação já aberta pelo lote.
+        """
+        if self._batch_depth > 0:
+            yield self._conn
+            return
+        self._conn.execute("BEGIN")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    @contextmanager
+    def batch(self) -> Iterator["SqliteStorage"]:
+        """
+        Agrupa mutações numa única transação: N inserções em laço viram
+        um commit (e um fsync) na saída do bloco, espelhando o batch()
+        do JsonStorage.
+        """
+        if self._batch_depth == 0:
+            self._conn.execute("BEGIN")
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._conn.execute("ROLLBACK")
+            raise
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self._conn.execute("COMMIT")
+
+    def flush(self) -> None:
+        """Mantido por compatibilidade: commits acontecem por transação."""
+
+    def fechar(self) -> None:
+        """Fecha a conexão com o banco."""
+        self._conn.close()
+
+    # ==================== MÉTODOS DE CATEGORIAS ====================
+
+    def salvar_categorias(self, categorias: list[Categoria]) -> None:
+        """
+        Substitui o conjunto de categorias pelo informado.
+
+        Args:
+            categorias: Lista de categorias a salvar
+        """
+        with self._transacao() as conn:
+            conn.execute("DELETE FROM categorias")
+            conn.executemany(
+                "INSERT INTO categorias VALUES (?, ?, ?, ?, ?)",
+                [self._linha_categoria(cat) for cat in categorias],
+            )
+
+    def carregar_categorias(self) -> list[Categoria]:
+        """
+        Carrega as categorias do banco.
+
+        Returns:
+            Lista de categorias carregadas
+        """
+        linhas = self._conn.execute(
+            "SELECT id, nome, tipo, limite_mensal, descricao"
+            " FROM categorias ORDER BY lower(nome)"
+        ).fetchall()
+        return [self._categoria_de_linha(linha) for linha in linhas]
+
+    def adicionar_categoria(self, categoria: Categoria) -> None:
+        """
+        Adiciona uma categoria ao banco.
+
+        Args:
+            categoria: Categoria a adicionar
+        """
+        duplicada = self._conn.execute(
+            "SELECT 1 FROM categorias WHERE lower(nome) = ? AND tipo = ?",
+            (categoria._nome_lower, categoria.tipo.value),
+        ).fetchone()
+        if duplicada is not None:
+            raise ValueError(
+                f"Categoria '{categoria.nome}' do tipo {categoria.tipo.value} já existe."
+            )
+        with self._transacao() as conn:
+            conn.execute(
+                "INSERT INTO categorias VALUES (?, ?, ?, ?, ?)",
+                self._linha_categoria(categoria),
+            )
+
+    def atualizar_categoria(self, categoria: Categoria) -> None:
+        """
+        Atualiza uma categoria existente.
+
+        Args:
+            categoria: Categoria com dados atualizados
+        """
+        with self._transacao() as conn:
+            cursor = conn.execute(
+                "UPDATE categorias SET nome = ?, tipo = ?, limite_mensal = ?,"
+                " descricao = ? WHERE id = ?",
+                (
+                    categoria.nome,
+                    categoria.tipo.value,
+                    categoria.limite_mensal,
+                    categoria.descricao,
+                    categoria.id,
+                ),
+            )
+            if cursor.rowcount == 0:
+                raise ValueError(f"Categoria com ID '{categoria.id}' não encontrada.")
+
+    def excluir_categoria(self, categoria_id: str) -> Optional[Categoria]:
+        """
+        Exclui uma categoria pelo ID.
+
+        Args:
+            categoria_id: ID da categoria a excluir
+
+        Returns:
+            A categoria excluída, ou None se não encontrada
+        """
+        categoria = self.buscar_categoria(categoria_id)
+        if categoria is None:
+            return None
+        with self._transacao() as conn:
+            conn.execute("DELETE FROM categorias WHERE id = ?", (categoria_id,))
+        return categoria
+
+    def buscar_categoria(self, categoria_id: str) -> Optional[Categoria]:
+        """
+        Busca uma categoria pelo ID (lookup pela chave primária).
+
+        Args:
+            categoria_id: ID da categoria
+
+        Returns:
+            A categoria encontrada, ou None
+        """
+        linha = self._conn.execute(
+            "SELECT id, nome, tipo, limite_mensal, descricao"
+            " FROM categorias WHERE id = ?",
+            (categoria_id,),
+        ).fetchone()
+        return self._categoria_de_linha(linha) if linha else None
+
+    def buscar_categoria_por_nome(
+        self, nome: str, tipo: TipoCategoria
+    ) -> Optional[Categoria]:
+        """
+        Busca uma categoria pelo nome e tipo.
+
+        Args:
+            nome: Nome da categoria
+            tipo: Tipo da categoria
+
+        Returns:
+            A categoria encontrada, ou None
+        """
+        linha = self._conn.execute(
+            "SELECT id, nome, tipo, limite_mensal, descricao"
+            " FROM categorias WHERE lower(nome) = ? AND tipo = ?",
+            (nome.lower(), tipo.value),
+        ).fetchone()
+        return self._categoria_de_linha(linha) if linha else None
+
+    @staticmethod
+    def _linha_categoria(categoria: Categoria) -> tuple:
+        """Converte uma categoria na tupla de colunas da tabela."""
+        return (
+            categoria.id,
+            categoria.nome,
+            categoria.tipo.value,
+            categoria.limite_mensal,
+            categoria.descricao,
+        )
+
+    @staticmethod
+    def _categoria_de_linha(linha: tuple) -> Categoria:
+        """Reconstrói uma categoria a partir de uma linha da tabela."""
+        return Categoria(
+            id=linha[0],
+            nome=linha[1],
+            tipo=TipoCategoria(linha[2]),
+            limite_mensal=linha[3],
+            descricao=linha[4],
+        )
+
+    # ==================== MÉTODOS DE LANÇAMENTOS ====================
+
+    def salvar_lancamentos(self, lancamentos: list[Lancamento]) -> None:
+        """
+        Substitui o conjunto de lançamentos pelo informado.
+
+        Args:
+            lancamentos: Lista de lançamentos a salvar
+        """
+        with self._transacao() as conn:
+            conn.execute("DELETE FROM lancamentos")
+            conn.executemany(
+                "INSERT INTO lancamentos VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [self._linha_lancamento(lanc) for lanc in lancamentos],
+            )
+
+    def carregar_lancamentos(self, categorias: list[Categoria]) -> list[Lancamento]:
+        """
+        Carrega os lançamentos do banco.
+
+        Args:
+            categorias: Lista de categorias para vincular aos lançamentos
+
+        Returns:
+            Lista de lançamentos carregados
+        """
+        cat_map = {cat.id: cat for cat in categorias}
+        linhas = self._conn.execute(
+            "SELECT id, tipo, valor, categoria_id, data, descricao,"
+            " forma_pagamento FROM lancamentos"
+        ).fetchall()
+        # Mesmo caminho _unchecked do JsonStorage: os dados já foram
+        # validados na gravação
+        formas = _FORMA_POR_ROTULO
+        classes = {"RECEITA": Receita, "DESPESA": Despesa}
+        buscar_categoria = cat_map.get
+        return [
+            classe._unchecked(
+                linha[0],
+                linha[2],
+                categoria,
+                _data_de_iso(linha[4]),
+                linha[5],
+                formas[linha[6]],
+            )
+            for linha in linhas
+            if (categoria := buscar_categoria(linha[3])) is not None
+            and (classe := classes.get(linha[1])) is not None
+        ]
+
+    def adicionar_lancamento(
+        self, lancamento: Lancamento, categorias: list[Categoria]
+    ) -> None:
+        """
+        Adiciona um lançamento (INSERT único, sem reescrever o restante).
+
+        Args:
+            lancamento: Lançamento a adicionar
+            categorias: Mantido por compatibilidade de assinatura
+        """
+        with self._transacao() as conn:
+            conn.execute(
+                "INSERT INTO lancamentos VALUES (?, ?, ?, ?, ?, ?, ?)",
+                self._linha_lancamento(lancamento),
+            )
+
+    def excluir_lancamento(
+        self, lancamento_id: str, categorias: list[Categoria]
+    ) -> Optional[Lancamento]:
+        """
+        Exclui um lançamento pelo ID.
+
+        Args:
+            lancamento_id: ID do lançamento a excluir
+            categorias: Lista de categorias para reconstruir o excluído
+
+        Returns:
+            O lançamento excluído, ou None se não encontrado
+        """
+        linha = self._conn.execute(
+            "SELECT id, tipo, valor, categoria_id, data, descricao,"
+            " forma_pagamento FROM lancamentos WHERE id = ?",
+            (lancamento_id,),
+        ).fetchone()
+        if linha is None:
+            return None
+        categoria = next((c for c in categorias if c.id == linha[3]), None)
+        if categoria is None:
+            return None
+        with self._transacao() as conn:
+            conn.execute("DELETE FROM lancamentos WHERE id = ?", (lancamento_id,))
+        classe = Receita if linha[1] == "RECEITA" else Despesa
+        return classe._unchecked(
+            linha[0],
+            linha[2],
+            categoria,
+            _data_de_iso(linha[4]),
+            linha[5],
+            _FORMA_POR_ROTULO[linha[6]],
+        )
+
+    @staticmethod
+    def _linha_lancamento(lancamento: Lancamento) -> tuple:
+        """Converte um lançamento na tupla de colunas da tabela."""
+        return (
+            lancamento.id,
+            lancamento.tipo,
+            lancamento.valor,
+            lancamento.categoria.id,
+            lancamento.data.isoformat(),
+            lancamento.descricao,
+            lancamento.forma_pagamento.name,
+        )
+
+    # ==================== MÉTODOS DE ORÇAMENTOS ====================
+
+    def salvar_orcamentos(self, orcamentos: list[OrcamentoMensal]) -> None:
+        """
+        Substitui o conjunto de orçamentos (e seus vínculos).
+
+        Args:
+            orcamentos: Lista de orçamentos a salvar
+        """
+        with self._transacao() as conn:
+            conn.execute("DELETE FROM orcamentos")
+            conn.execute("DELETE FROM orcamento_lancamentos")
+            conn.execute("DELETE FROM orcamento_alertas")
+            for orcamento in orcamentos:
+                self._inserir_orcamento(conn, orcamento)
+
+    def carregar_orcamentos(
+        self,
+        lancamentos: list[Lancamento],
+        alertas: list[Alerta]
+    ) -> list[OrcamentoMensal]:
+        """
+        Carrega os orçamentos do banco.
+
+        Args:
+            lancamentos: Lista de lançamentos para vincular
+            alertas: Lista de alertas para vincular
+
+        Returns:
+            Lista de orçamentos carregados
+        """
+        lanc_map = {lanc.id: lanc for lanc in lancamentos}
+        alerta_map = {alerta.id: alerta for alerta in alertas}
+
+        # Vínculos agrupados por orçamento em duas consultas, em vez de
+        # uma consulta por orçamento
+        vinc_lanc: dict[str, list[str]] = {}
+        for orc_id, lanc_id in self._conn.execute(
+            "SELECT orcamento_id, lancamento_id FROM orcamento_lancamentos"
+        ):
+            vinc_lanc.setdefault(orc_id, []).append(lanc_id)
+        vinc_alerta: dict[str, list[str]] = {}
+        for orc_id, alerta_id in self._conn.execute(
+            "SELECT orcamento_id, alerta_id FROM orcamento_alertas"
+        ):
+            vinc_alerta.setdefault(orc_id, []).append(alerta_id)
+
+        orcamentos = []
+        for linha in self._conn.execute(
+            "SELECT id, mes, ano, receitas_previstas FROM orcamentos"
+            " ORDER BY ano, mes"
+        ):
+            orcamento = OrcamentoMensal(
+                id=linha[0], mes=linha[1], ano=linha[2],
+                receitas_previstas=linha[3],
+            )
+            vincular_lanc = orcamento._vincular_lancamento
+            for lanc in map(lanc_map.get, vinc_lanc.get(linha[0], [])):
+                if lanc is not None:
+                    vincular_lanc(lanc)
+            vincular_alerta = orcamento._vincular_alerta
+            for alerta in map(alerta_map.get, vinc_alerta.get(linha[0], [])):
+                if alerta is not None:
+                    vincular_alerta(alerta)
+            orcamentos.append(orcamento)
+        return orcamentos
+
+    def buscar_orcamento(
+        self, mes: int, ano: int, lancamentos: list[Lancamento], alertas: list[Alerta]
+    ) -> Optional[OrcamentoMensal]:
+        """
+        Busca um orçamento por mês/ano.
+
+        Args:
+            mes: Mês do orçamento
+            ano: Ano do orçamento
+            lancamentos: Lista de lançamentos
+            alertas: Lista de alertas
+
+        Returns:
+            O orçamento encontrado, ou None
+        """
+        for orcamento in self.carregar_orcamentos(lancamentos, alertas):
+            if orcamento.mes_ano == (mes, ano):
+                return orcamento
+        return None
+
+    def criar_ou_atualizar_orcamento(
+        self,
+        orcamento: OrcamentoMensal,
+        lancamentos: list[Lancamento],
+        alertas: list[Alerta]
+    ) -> None:
+        """
+        Cria ou atualiza um orçamento (upsert por mês/ano).
+
+        Args:
+            orcamento: Orçamento a salvar
+            lancamentos: Mantido por compatibilidade de assinatura
+            alertas: Mantido por compatibilidade de assinatura
+        """
+        with self._transacao() as conn:
+            conn.execute(
+                "DELETE FROM orcamentos WHERE mes = ? AND ano = ?",
+                (orcamento.mes, orcamento.ano),
+            )
+            self._inserir_orcamento(conn, orcamento)
+
+    @staticmethod
+    def _inserir_orcamento(
+        conn: sqlite3.Connection, orcamento: OrcamentoMensal
+    ) -> None:
+        """Insere um orçamento e seus vínculos (dentro de uma transação)."""
+        conn.execute(
+            "INSERT INTO orcamentos VALUES (?, ?, ?, ?)",
+            (orcamento.id, orcamento.mes, orcamento.ano,
+             orcamento.receitas_previstas),
+        )
+        conn.executemany(
+            "INSERT INTO orcamento_lancamentos VALUES (?, ?)",
+            [(orcamento.id, lanc.id) for lanc in orcamento.lancamentos],
+        )
+        conn.executemany(
+            "INSERT INTO orcamento_alertas VALUES (?, ?)",
+            [(orcamento.id, alerta.id) for alerta in orcamento.alertas],
+        )
+
+    # ==================== MÉTODOS DE ALERTAS ====================
+
+    def salvar_alertas(self, alertas: list[Alerta]) -> None:
+        """
+        Substitui o conjunto de alertas pelo informado.
+
+        Args:
+            alertas: Lista de alertas a salvar
+        """
+        with self._transacao() as conn:
+            conn.execute("DELETE FROM alertas")
+            conn.executemany(
+                "INSERT INTO alertas VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [self._linha_alerta(alerta) for alerta in alertas],
+            )
+
+    def carregar_alertas(self) -> list[Alerta]:
+        """
+        Carrega os alertas do banco.
+
+        Returns:
+            Lista de alertas carregados
+        """
+        linhas = self._conn.execute(
+            "SELECT id, tipo, mensagem, data_criacao, lancamento_id,"
+            " categoria_id, mes, ano, lido FROM alertas"
+        ).fetchall()
+        return [self._alerta_de_linha(linha) for linha in linhas]
+
+    def adicionar_alerta(self, alerta: Alerta) -> None:
+        """
+        Adiciona um alerta ao banco.
+
+        Args:
+            alerta: Alerta a adicionar
+        """
+        with self._transacao() as conn:
+            conn.execute(
+                "INSERT INTO alertas VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                self._linha_alerta(alerta),
+            )
+
+    def marcar_alerta_como_lido(self, alerta_id: str) -> bool:
+        """
+        Marca um alerta como lido (UPDATE pontual).
+
+        Args:
+            alerta_id: ID do alerta
+
+        Returns:
+            True se o alerta foi marcado, False se não encontrado
+        """
+        with self._transacao() as conn:
+            cursor = conn.execute(
+                "UPDATE alertas SET lido = 1 WHERE id = ?", (alerta_id,)
+            )
+        return cursor.rowcount > 0
+
+    @staticmethod
+    def _linha_alerta(alerta: Alerta) -> tuple:
+        """Converte um alerta na tupla de colunas da tabela."""
+        mes_ano = alerta.mes_ano
+        return (
+            alerta.id,
+            alerta.tipo.name,
+            alerta.mensagem,
+            alerta.data_criacao.isoformat(),
+            alerta.lancamento_id,
+            alerta.categoria_id,
+            mes_ano[0] if mes_ano else None,
+            mes_ano[1] if mes_ano else None,
+            int(alerta.lido),
+        )
+
+    @staticmethod
+    def _alerta_de_linha(linha: tuple) -> Alerta:
+        """Reconstrói um alerta a partir de uma linha da tabela."""
+        return Alerta.from_dict({
+            "id": linha[0],
+            "tipo": linha[1],
+            "mensagem": linha[2],
+            "data_criacao": linha[3],
+            "lancamento_id": linha[4],
+            "categoria_id": linha[5],
+            "mes_ano": (linha[6], linha[7]) if linha[6] is not None else None,
+            "lido": bool(linha[8]),
+        })
+
+    # ==================== MÉTODOS DE CONFIGURAÇÕES ====================
+
+    def carregar_configuracoes(self) -> dict[str, Any]:
+        """
+        Carrega as configurações do banco.
+
+        Returns:
+            Dicionário com as configurações
+        """
+        linhas = self._conn.execute(
+            "SELECT chave, valor FROM configuracoes"
+        ).fetchall()
+        if not linhas:
+            return self._configuracoes_padrao()
+        return {chave: json.loads(valor) for chave, valor in linhas}
+
+    def salvar_configuracoes(self, config: dict[str, Any]) -> None:
+        """
+        Salva as configurações no banco.
+
+        Args:
+            config: Dicionário de configurações
+        """
+        with self._transacao() as conn:
+            conn.execute("DELETE FROM configuracoes")
+            conn.executemany(
+                "INSERT INTO configuracoes VALUES (?, ?)",
+                [(chave, json.dumps(valor)) for chave, valor in config.items()],
+            )
+
+    def _configuracoes_padrao(self) -> dict[str, Any]:
+        """Retorna as configurações padrão do sistema."""
+        return {
+            "valor_minimo_alerta_alto_gasto": 500.0,
+            "meses_comparativo": 3,
+            "meta_economia_percentual": 20.0,
+            "moeda": "BRL",
+            "formato_data": "%d/%m/%Y",
+        }
+
+    # ==================== INICIALIZAÇÃO ====================
+
+    def inicializar_dados(self) -> None:
+        """
+        Cria o esquema se necessário e migra dados JSON existentes.
+
+        Num diretório que só tem os arquivos do backend JSON, a primeira
+        abertura importa todas as coleções numa única transação (mesmo
+        espírito da migração lancamentos.json -> NDJSON do JsonStorage);
+        os arquivos JSON são preservados como exportação legada.
+        """
+        self._conn.executescript(_ESQUEMA)
+
+        vazio = self._conn.execute(
+            "SELECT NOT EXISTS (SELECT 1 FROM categorias)"
+            " AND NOT EXISTS (SELECT 1 FROM lancamentos)"
+        ).fetchone()[0]
+        if not vazio:
+            return
+        legado = JsonStorage(str(self._data_dir))
+        categorias = legado.carregar_categorias()
+        if not categorias:
+            return
+        lancamentos = legado.carregar_lancamentos(categorias)
+        alertas = legado.carregar_alertas()
+        orcamentos = legado.carregar_orcamentos(lancamentos, alertas)
+        with self.batch():
+            self.salvar_categorias(categorias)
+            self.salvar_lancamentos(lancamentos)
+            self.salvar_alertas(alertas)
+            self.salvar_orcamentos(orcamentos)
+
+    def limpar_dados(self) -> None:
+        """Limpa todos os dados (cuidado!)."""
+        with self._transacao() as conn:
+            conn.execute("DELETE FROM orcamento_lancamentos")
+            conn.execute("DELETE FROM orcamento_alertas")
+            conn.execute("DELETE FROM orcamentos")
+            conn.execute("DELETE FROM alertas")
+            conn.execute("DELETE FROM lancamentos")
+            conn.execute("DELETE FROM categorias")
+            conn.execute("DELETE FROM configuracoes")
@@ -0,0 +1,84 @@
+"""
+Fixtures compartilhadas pelos testes de modelos.
+
+Política: não usar fixtures com autouse=True — elas rodam para todos os
+testes e o custo de coleta/setup cresce com testes × fixtures autouse.
+A regra é verificada por tests/test_fixtures_sem_autouse.py.
+
+Os testes de modelos também não devem introduzir estado global mutável
+nem I/O de arquivo: isso mantém a suíte segura para execução paralela
+com pytest-xdist (pytest -n auto --dist loadfile).
+"""
+
+import pytest
+from datetime import date
+from src.models.categoria import Categoria, TipoCategoria
+from src.models.lancamento import Receita, Despesa, FormaPagamento
+
+# Membros do enum resolvidos uma vez no módulo (evita lookup por acesso)
+_PIX, _DEBITO, _CREDITO = FormaPagamento.PIX, FormaPagamento.DEBITO, FormaPagamento.CREDITO
+
+# Datas de dezembro/2024 usadas repetidamente, construídas uma vez
+_DEZ_1, _DEZ_5, _DEZ_10, _DEZ_15 = (
+    date(2024, 12, 1), date(2024, 12, 5), date(2024, 12, 10), date(2024, 12, 15)
+)
+
+
+@pytest.fixture(scope="module")
+def categoria_receita():
+    """Fixture para categoria de receita."""
+    return Categoria(nome="Salário", tipo=TipoCategoria.RECEITA)
+
+
+@pytest.fixture(scope="module")
+def categoria_despesa():
+    """Fixture para categoria de despesa com limite."""
+    return Categoria(
+        nome="Alimentação",
+        tipo=TipoCategoria.DESPESA,
+        limite_mensal=500.0
+    )
+
+
+@pytest.fixture(scope="module")
+def receita_salario(categoria_receita):
+    """Receita padrão compartilhada (imutável, segura entre testes)."""
+    return Receita(
+        valor=1000.0,
+        categoria=categoria_receita,
+        data=_DEZ_1,
+        descricao="Salário",
+        forma_pagamento=_PIX
+    )
+
+
+@pytest.fixture(scope="module")
+def despesa_alto_valor(categoria_despesa):
+    """
+    Despesa acima do limiar de alto valor. Contrato somente leitura:
+    não a passe a adicionar_lancamento, que muta _alertas da instância —
+    testes que registram a despesa devem construir a sua própria.
+    """
+    return Despesa(
+        valor=600.0,
+        categoria=categoria_despesa,
+        data=_DEZ_1,
+        descricao="Compra grande",
+        forma_pagamento=_CREDITO
+    )
+
+
+@pytest.fixture
+def criar_receita(categoria_receita):
+    """Fábrica de receitas partindo dos padrões da receita_salario."""
+    def _criar(**campos):
+        padrao = dict(
+            valor=1000.0,
+            categoria=categoria_receita,
+            data=_DEZ_1,
+            descricao="Salário",
+            forma_pagamento=_PIX,
+        )
+        padrao.update(campos)
+        return Receita(**padrao)
+    return _criar
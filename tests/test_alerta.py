@@ -163,7 +163,7 @@ class TestAlerta:
         assert dados["tipo"] == "LIMITE_EXCEDIDO"
         assert dados["mensagem"] == "Limite excedido na categoria Alimentação"
         assert dados["categoria_id"] == "cat-123"
-        assert dados["mes_ano"] == [12, 2024]
+        assert dados["mes_ano"] == (12, 2024)
         assert dados["lido"] is False
     
     def test_from_dict(self):
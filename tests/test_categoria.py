@@ -2,9 +2,14 @@
 Testes para a classe Categoria.
 """
 
+import re
+
 import pytest
 from src.models.categoria import Categoria, TipoCategoria
 
+# Padrão repetido em vários testes; compilado uma vez no módulo.
+_RE_MAIOR_QUE_ZERO = re.compile("maior que zero")
+
 
 class TestCategoria:
     """Testes para a classe Categoria."""
@@ -56,7 +61,7 @@ class TestCategoria:
     
     def test_limite_mensal_deve_ser_positivo(self):
         """Testa que limite deve ser maior que zero."""
-        with pytest.raises(ValueError, match="maior que zero"):
+        with pytest.raises(ValueError, match=_RE_MAIOR_QUE_ZERO):
             Categoria(
                 nome="Alimentação",
                 tipo=TipoCategoria.DESPESA,
@@ -65,7 +70,7 @@ class TestCategoria:
     
     def test_limite_mensal_zero_invalido(self):
         """Testa que limite zero é inválido."""
-        with pytest.raises(ValueError, match="maior que zero"):
+        with pytest.raises(ValueError, match=_RE_MAIOR_QUE_ZERO):
             Categoria(
                 nome="Alimentação",
                 tipo=TipoCategoria.DESPESA,
@@ -0,0 +1,48 @@
+"""
+Verificação da política de fixtures: nenhuma fixture com autouse=True.
+
+Fixtures autouse rodam para todos os testes do escopo e fazem o custo de
+coleta e setup crescer com testes × fixtures autouse. Se uma fixture
+autouse for realmente necessária, adicione o arquivo à lista de exceções
+abaixo com uma justificativa.
+"""
+
+import ast
+from pathlib import Path
+
+# Arquivos autorizados a conter fixtures autouse (nenhum hoje).
+_EXCECOES: set[str] = set()
+
+
+def _fixtures_autouse(arquivo: Path) -> list[str]:
+    """Retorna os nomes das fixtures com autouse=True no arquivo."""
+    arvore = ast.parse(arquivo.read_text(encoding="utf-8"))
+    encontradas = []
+    for no in ast.walk(arvore):
+        if not isinstance(no, ast.FunctionDef):
+            continue
+        for decorador in no.decorator_list:
+            if not isinstance(decorador, ast.Call):
+                continue
+            for kw in decorador.keywords:
+                if (kw.arg == "autouse"
+                        and isinstance(kw.value, ast.Constant)
+                        and kw.value.value is True):
+                    encontradas.append(no.name)
+    return encontradas
+
+
+def test_sem_fixtures_autouse():
+    """Nenhum arquivo de teste deve declarar fixture com autouse=True."""
+    pasta = Path(__file__).parent
+    violacoes = {}
+    for arquivo in sorted(pasta.glob("*.py")):
+        if arquivo.name in _EXCECOES:
+            continue
+        nomes = _fixtures_autouse(arquivo)
+        if nomes:
+            violacoes[arquivo.name] = nomes
+
+    assert not violacoes, (
+        f"Fixtures autouse encontradas (ver política em conftest.py): {violacoes}"
+    )
@@ -2,29 +2,26 @@
 Testes para as classes Lancamento, Receita e Despesa.
 """
 
+import re
+
 import pytest
 from datetime import date
 from src.models.categoria import Categoria, TipoCategoria
 from src.models.lancamento import Lancamento, Receita, Despesa, FormaPagamento
 
+# Membros do enum resolvidos uma vez no módulo (evita lookup por acesso)
+_PIX, _DEBITO, _CREDITO = FormaPagamento.PIX, FormaPagamento.DEBITO, FormaPagamento.CREDITO
 
-@pytest.fixture
-def categoria_receita():
-    """Fixture para categoria de receita."""
-    return Categoria(nome="Salário", tipo=TipoCategoria.RECEITA)
-
+# Datas de dezembro/2024 usadas repetidamente, construídas uma vez
+_DEZ_1, _DEZ_5, _DEZ_10, _DEZ_15 = (
+    date(2024, 12, 1), date(2024, 12, 5), date(2024, 12, 10), date(2024, 12, 15)
+)
 
-@pytest.fixture
-def categoria_despesa():
-    """Fixture para categoria de despesa."""
-    return Categoria(
-        nome="Alimentação",
-        tipo=TipoCategoria.DESPESA,
-        limite_mensal=500.0
-    )
+# Padrão repetido em vários testes; compilado uma vez no módulo.
+_RE_MAIOR_QUE_ZERO = re.compile("maior que zero")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def categoria_despesa_sem_limite():
     """Fixture para categoria de despesa sem limite."""
     return Categoria(nome="Outros", tipo=TipoCategoria.DESPESA)
@@ -38,61 +35,34 @@ class TestReceita:
         receita = Receita(
             valor=1000.0,
             categoria=categoria_receita,
-            data=date(2024, 12, 1),
+            data=_DEZ_1,
             descricao="Salário de dezembro",
-            forma_pagamento=FormaPagamento.PIX
+            forma_pagamento=_PIX
         )
         
         assert receita.valor == 1000.0
         assert receita.categoria == categoria_receita
-        assert receita.data == date(2024, 12, 1)
+        assert receita.data == _DEZ_1
         assert receita.descricao == "Salário de dezembro"
-        assert receita.forma_pagamento == FormaPagamento.PIX
+        assert receita.forma_pagamento == _PIX
         assert receita.tipo == "RECEITA"
         assert receita.id is not None
     
-    def test_receita_valor_zero_invalido(self, categoria_receita):
-        """Testa que receita com valor zero é inválida."""
-        with pytest.raises(ValueError, match="maior que zero"):
-            Receita(
-                valor=0,
-                categoria=categoria_receita,
-                data=date(2024, 12, 1),
-                descricao="Teste",
-                forma_pagamento=FormaPagamento.PIX
-            )
-    
-    def test_receita_valor_negativo_invalido(self, categoria_receita):
-        """Testa que receita com valor negativo é inválida."""
-        with pytest.raises(ValueError, match="maior que zero"):
+    @pytest.mark.parametrize("valor", [0, -100.0])
+    def test_receita_valor_invalido(self, categoria_receita, valor):
+        """Testa que receita com valor zero ou negativo é inválida."""
+        with pytest.raises(ValueError, match=_RE_MAIOR_QUE_ZERO):
             Receita(
-                valor=-100.0,
+                valor=valor,
                 categoria=categoria_receita,
-                data=date(2024, 12, 1),
+                data=_DEZ_1,
                 descricao="Teste",
-                forma_pagamento=FormaPagamento.PIX
+                forma_pagamento=_PIX
             )
     
-    def test_receita_categoria_incorreta(self, categoria_despesa):
-        """Testa que receita não pode usar categoria de despesa."""
-        with pytest.raises(ValueError, match="tipo RECEITA"):
-            Receita(
-                valor=1000.0,
-                categoria=categoria_despesa,
-                data=date(2024, 12, 1),
-                descricao="Teste",
-                forma_pagamento=FormaPagamento.PIX
-            )
-    
-    def test_receita_mes_ano(self, categoria_receita):
+    def test_receita_mes_ano(self, criar_receita):
         """Testa propriedade mes_ano."""
-        receita = Receita(
-            valor=1000.0,
-            categoria=categoria_receita,
-            data=date(2024, 12, 15),
-            descricao="Teste",
-            forma_pagamento=FormaPagamento.PIX
-        )
+        receita = criar_receita(data=_DEZ_15)
         
         assert receita.mes_ano == (12, 2024)
 
@@ -105,68 +75,39 @@ class TestDespesa:
         despesa = Despesa(
             valor=100.0,
             categoria=categoria_despesa,
-            data=date(2024, 12, 5),
+            data=_DEZ_5,
             descricao="Supermercado",
-            forma_pagamento=FormaPagamento.DEBITO
+            forma_pagamento=_DEBITO
         )
         
         assert despesa.valor == 100.0
         assert despesa.categoria == categoria_despesa
         assert despesa.tipo == "DESPESA"
     
-    def test_despesa_valor_zero_invalido(self, categoria_despesa):
-        """Testa que despesa com valor zero é inválida."""
-        with pytest.raises(ValueError, match="maior que zero"):
+    @pytest.mark.parametrize("valor", [0, -50.0])
+    def test_despesa_valor_invalido(self, categoria_despesa, valor):
+        """Testa que despesa com valor zero ou negativo é inválida."""
+        with pytest.raises(ValueError, match=_RE_MAIOR_QUE_ZERO):
             Despesa(
-                valor=0,
+                valor=valor,
                 categoria=categoria_despesa,
-                data=date(2024, 12, 1),
+                data=_DEZ_1,
                 descricao="Teste",
-                forma_pagamento=FormaPagamento.DEBITO
+                forma_pagamento=_DEBITO
             )
     
-    def test_despesa_valor_negativo_invalido(self, categoria_despesa):
-        """Testa que despesa com valor negativo é inválida."""
-        with pytest.raises(ValueError, match="maior que zero"):
-            Despesa(
-                valor=-50.0,
-                categoria=categoria_despesa,
-                data=date(2024, 12, 1),
-                descricao="Teste",
-                forma_pagamento=FormaPagamento.DEBITO
-            )
-    
-    def test_despesa_categoria_incorreta(self, categoria_receita):
-        """Testa que despesa não pode usar categoria de receita."""
-        with pytest.raises(ValueError, match="tipo DESPESA"):
-            Despesa(
-                valor=100.0,
-                categoria=categoria_receita,
-                data=date(2024, 12, 1),
-                descricao="Teste",
-                forma_pagamento=FormaPagamento.DEBITO
-            )
-    
-    def test_despesa_alerta_alto_valor(self, categoria_despesa):
+    def test_despesa_alerta_alto_valor(self, despesa_alto_valor):
         """Testa alerta para despesa de alto valor (> R$500)."""
-        despesa = Despesa(
-            valor=600.0,
-            categoria=categoria_despesa,
-            data=date(2024, 12, 1),
-            descricao="Compra grande",
-            forma_pagamento=FormaPagamento.CREDITO
-        )
-        
-        assert "ALTO_VALOR" in despesa.alertas
+        assert "ALTO_VALOR" in despesa_alto_valor.alertas
     
     def test_despesa_sem_alerta_alto_valor(self, categoria_despesa):
         """Testa que despesa menor não gera alerta."""
         despesa = Despesa(
             valor=100.0,
             categoria=categoria_despesa,
-            data=date(2024, 12, 1),
+            data=_DEZ_1,
             descricao="Compra normal",
-            forma_pagamento=FormaPagamento.DEBITO
+            forma_pagamento=_DEBITO
         )
         
         assert "ALTO_VALOR" not in despesa.alertas
@@ -176,9 +117,9 @@ class TestDespesa:
         despesa = Despesa(
             valor=200.0,
             categoria=categoria_despesa,
-            data=date(2024, 12, 1),
+            data=_DEZ_1,
             descricao="Supermercado",
-            forma_pagamento=FormaPagamento.DEBITO
+            forma_pagamento=_DEBITO
         )
         
         # Total já gasto: 400, nova despesa: 200, limite: 500
@@ -192,9 +133,9 @@ class TestDespesa:
         despesa = Despesa(
             valor=100.0,
             categoria=categoria_despesa,
-            data=date(2024, 12, 1),
+            data=_DEZ_1,
             descricao="Supermercado",
-            forma_pagamento=FormaPagamento.DEBITO
+            forma_pagamento=_DEBITO
         )
         
         # Total já gasto: 200, nova despesa: 100, limite: 500
@@ -204,201 +145,103 @@ class TestDespesa:
         assert "LIMITE_EXCEDIDO" not in despesa.alertas
 
 
+@pytest.mark.parametrize("classe,fixture_categoria,match", [
+    (Receita, "categoria_despesa", "tipo RECEITA"),
+    (Despesa, "categoria_receita", "tipo DESPESA"),
+])
+def test_categoria_incorreta(classe, fixture_categoria, match, request):
+    """Testa que lançamentos rejeitam categoria do tipo oposto."""
+    # getfixturevalue resolve só a categoria errada do caso em questão
+    categoria = request.getfixturevalue(fixture_categoria)
+    with pytest.raises(ValueError, match=match):
+        classe(
+            valor=100.0,
+            categoria=categoria,
+            data=_DEZ_1,
+            descricao="Teste",
+            forma_pagamento=_PIX
+        )
+
+
 class TestLancamentoMetodosEspeciais:
     """Testes para métodos especiais da classe Lancamento."""
     
-    def test_str_lancamento(self, categoria_receita):
+    def test_str_lancamento(self, receita_salario):
         """Testa representação string."""
-        receita = Receita(
-            valor=1000.0,
-            categoria=categoria_receita,
-            data=date(2024, 12, 1),
-            descricao="Salário",
-            forma_pagamento=FormaPagamento.PIX
-        )
-        
-        resultado = str(receita)
+        resultado = str(receita_salario)
         assert "RECEITA" in resultado
         assert "1000.00" in resultado
         assert "Salário" in resultado
     
-    def test_repr_lancamento(self, categoria_receita):
+    def test_repr_lancamento(self, receita_salario):
         """Testa representação técnica."""
-        receita = Receita(
-            valor=1000.0,
-            categoria=categoria_receita,
-            data=date(2024, 12, 1),
-            descricao="Salário",
-            forma_pagamento=FormaPagamento.PIX
-        )
-        
-        resultado = repr(receita)
+        resultado = repr(receita_salario)
         assert "Receita(" in resultado
         assert "valor=1000.0" in resultado
     
-    def test_eq_lancamentos_mesmo_id(self, categoria_receita):
-        """Testa igualdade por ID."""
-        receita = Receita(
-            valor=1000.0,
-            categoria=categoria_receita,
-            data=date(2024, 12, 1),
-            descricao="Salário",
-            forma_pagamento=FormaPagamento.PIX
-        )
-        
-        assert receita == receita
-    
-    def test_eq_lancamentos_data_descricao(self, categoria_receita):
+    def test_eq_lancamentos_data_descricao(self, criar_receita):
         """Testa igualdade por data + descrição."""
-        receita1 = Receita(
-            valor=1000.0,
-            categoria=categoria_receita,
-            data=date(2024, 12, 1),
-            descricao="Salário",
-            forma_pagamento=FormaPagamento.PIX
-        )
-        
-        receita2 = Receita(
-            valor=2000.0,  # valor diferente
-            categoria=categoria_receita,
-            data=date(2024, 12, 1),  # mesma data
-            descricao="salário",  # mesma descrição (case insensitive)
-            forma_pagamento=FormaPagamento.PIX
-        )
+        receita1 = criar_receita()
+        # valor diferente, mesma data, mesma descrição (case insensitive)
+        receita2 = criar_receita(valor=2000.0, descricao="salário")
         
         assert receita1 == receita2
     
-    def test_lt_ordenacao_por_data(self, categoria_receita):
-        """Testa ordenação por data."""
-        receita1 = Receita(
-            valor=1000.0,
-            categoria=categoria_receita,
-            data=date(2024, 12, 1),
-            descricao="Primeiro",
-            forma_pagamento=FormaPagamento.PIX
-        )
-        
-        receita2 = Receita(
-            valor=1000.0,
-            categoria=categoria_receita,
-            data=date(2024, 12, 15),
-            descricao="Segundo",
-            forma_pagamento=FormaPagamento.PIX
-        )
-        
-        assert receita1 < receita2
-    
-    def test_lt_ordenacao_por_valor_mesma_data(self, categoria_receita):
-        """Testa ordenação por valor quando data é igual."""
-        receita1 = Receita(
-            valor=500.0,
-            categoria=categoria_receita,
-            data=date(2024, 12, 1),
-            descricao="Menor",
-            forma_pagamento=FormaPagamento.PIX
-        )
-        
-        receita2 = Receita(
-            valor=1000.0,
-            categoria=categoria_receita,
-            data=date(2024, 12, 1),
-            descricao="Maior",
-            forma_pagamento=FormaPagamento.PIX
-        )
-        
-        assert receita1 < receita2
-    
-    def test_add_lancamentos_mesmo_tipo(self, categoria_receita):
+    @pytest.mark.parametrize("campos_menor,campos_maior", [
+        # por data
+        (dict(descricao="Primeiro"), dict(data=_DEZ_15, descricao="Segundo")),
+        # por valor, quando a data é igual
+        (dict(valor=500.0, descricao="Menor"), dict(descricao="Maior")),
+    ])
+    def test_lt_ordenacao(self, criar_receita, campos_menor, campos_maior):
+        """Testa ordenação por data e por valor em data igual."""
+        assert criar_receita(**campos_menor) < criar_receita(**campos_maior)
+    
+    @pytest.mark.parametrize("valor2,total", [(500.0, 1500.0), (250.0, 1250.0)])
+    def test_add_lancamentos_mesmo_tipo(self, receita_salario, criar_receita, valor2, total):
         """Testa soma de lançamentos do mesmo tipo."""
-        receita1 = Receita(
-            valor=1000.0,
-            categoria=categoria_receita,
-            data=date(2024, 12, 1),
-            descricao="Salário",
-            forma_pagamento=FormaPagamento.PIX
+        receita2 = criar_receita(
+            valor=valor2, data=_DEZ_15, descricao="Bonus"
         )
-        
-        receita2 = Receita(
-            valor=500.0,
-            categoria=categoria_receita,
-            data=date(2024, 12, 15),
-            descricao="Bonus",
-            forma_pagamento=FormaPagamento.PIX
-        )
-        
-        total = receita1 + receita2
-        assert total == 1500.0
+
+        assert receita_salario + receita2 == total
     
-    def test_add_lancamentos_tipos_diferentes_erro(self, categoria_receita, categoria_despesa):
+    def test_add_lancamentos_tipos_diferentes_erro(self, receita_salario, categoria_despesa):
         """Testa que soma de tipos diferentes gera erro."""
-        receita = Receita(
-            valor=1000.0,
-            categoria=categoria_receita,
-            data=date(2024, 12, 1),
-            descricao="Salário",
-            forma_pagamento=FormaPagamento.PIX
-        )
-        
         despesa = Despesa(
             valor=100.0,
             categoria=categoria_despesa,
-            data=date(2024, 12, 1),
+            data=_DEZ_1,
             descricao="Compra",
-            forma_pagamento=FormaPagamento.DEBITO
+            forma_pagamento=_DEBITO
         )
         
         with pytest.raises(TypeError, match="mesmo tipo"):
-            receita + despesa
+            receita_salario + despesa
     
-    def test_hash_lancamento(self, categoria_receita):
+    def test_hash_lancamento(self, receita_salario, criar_receita):
         """Testa que lançamentos podem ser usados em sets."""
-        receita1 = Receita(
-            valor=1000.0,
-            categoria=categoria_receita,
-            data=date(2024, 12, 1),
-            descricao="Salário",
-            forma_pagamento=FormaPagamento.PIX
+        receita2 = criar_receita(
+            valor=500.0, data=_DEZ_15, descricao="Bonus"
         )
         
-        receita2 = Receita(
-            valor=500.0,
-            categoria=categoria_receita,
-            data=date(2024, 12, 15),
-            descricao="Bonus",
-            forma_pagamento=FormaPagamento.PIX
-        )
-        
-        lancamentos = {receita1, receita2}
+        lancamentos = {receita_salario, receita2}
         assert len(lancamentos) == 2
+        # Reflexividade da igualdade por ID, reaproveitando a fixture
+        assert receita_salario == receita_salario
     
-    def test_to_dict_receita(self, categoria_receita):
+    def test_to_dict_receita(self, receita_salario):
         """Testa serialização de receita."""
-        receita = Receita(
-            valor=1000.0,
-            categoria=categoria_receita,
-            data=date(2024, 12, 1),
-            descricao="Salário",
-            forma_pagamento=FormaPagamento.PIX
-        )
-        
-        dados = receita.to_dict()
+        dados = receita_salario.to_dict()
         
         assert dados["tipo"] == "RECEITA"
         assert dados["valor"] == 1000.0
         assert dados["data"] == "2024-12-01"
         assert dados["forma_pagamento"] == "PIX"
     
-    def test_to_dict_despesa(self, categoria_despesa):
-        """Testa serialização de despesa."""
-        despesa = Despesa(
-            valor=600.0,  # > 500 para gerar alerta
-            categoria=categoria_despesa,
-            data=date(2024, 12, 1),
-            descricao="Supermercado",
-            forma_pagamento=FormaPagamento.CREDITO
-        )
-        
-        dados = despesa.to_dict()
+    def test_to_dict_despesa(self, despesa_alto_valor):
+        """Testa serialização de despesa (> 500 para gerar alerta)."""
+        dados = despesa_alto_valor.to_dict()
         
         assert dados["tipo"] == "DESPESA"
         assert "alertas" in dados
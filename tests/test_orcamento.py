@@ -9,24 +9,16 @@ from src.models.lancamento import Receita, Despesa, FormaPagamento
 from src.models.orcamento import OrcamentoMensal
 from src.models.alerta import TipoAlerta
 
+# Membros do enum resolvidos uma vez no módulo (evita lookup por acesso)
+_PIX, _DEBITO, _CREDITO = FormaPagamento.PIX, FormaPagamento.DEBITO, FormaPagamento.CREDITO
 
-@pytest.fixture
-def categoria_receita():
-    """Fixture para categoria de receita."""
-    return Categoria(nome="Salário", tipo=TipoCategoria.RECEITA)
-
-
-@pytest.fixture
-def categoria_despesa():
-    """Fixture para categoria de despesa com limite."""
-    return Categoria(
-        nome="Alimentação",
-        tipo=TipoCategoria.DESPESA,
-        limite_mensal=500.0
-    )
+# Datas de dezembro/2024 usadas repetidamente, construídas uma vez
+_DEZ_1, _DEZ_5, _DEZ_10, _DEZ_15 = (
+    date(2024, 12, 1), date(2024, 12, 5), date(2024, 12, 10), date(2024, 12, 15)
+)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def categoria_despesa_transporte():
     """Fixture para segunda categoria de despesa."""
     return Categoria(
@@ -42,6 +34,102 @@ def orcamento_dezembro():
     return OrcamentoMensal(mes=12, ano=2024, receitas_previstas=5000.0)
 
 
+@pytest.fixture(scope="module")
+def orcamento_populado(categoria_despesa, categoria_despesa_transporte):
+    """
+    Orçamento com três despesas cobrindo as duas categorias e as três
+    formas de pagamento. Escopo de módulo com contrato somente leitura:
+    os testes que o usam apenas consultam os métodos de agregação.
+    """
+    orcamento = OrcamentoMensal(mes=12, ano=2024, receitas_previstas=5000.0)
+    orcamento.adicionar_lancamento(Despesa(
+        valor=200.0,
+        categoria=categoria_despesa,
+        data=_DEZ_5,
+        descricao="Supermercado",
+        forma_pagamento=_DEBITO
+    ))
+    orcamento.adicionar_lancamento(Despesa(
+        valor=100.0,
+        categoria=categoria_despesa_transporte,
+        data=_DEZ_10,
+        descricao="Uber",
+        forma_pagamento=_PIX
+    ))
+    orcamento.adicionar_lancamento(Despesa(
+        valor=100.0,
+        categoria=categoria_despesa,
+        data=_DEZ_15,
+        descricao="Restaurante",
+        forma_pagamento=_CREDITO
+    ))
+    return orcamento
+
+
+@pytest.fixture(scope="module")
+def orcamento_para_str(categoria_receita, categoria_despesa):
+    """
+    Orçamento com receita de 3000 e despesa de 500, construído uma vez
+    para as asserções de substring sobre str(). Contrato somente leitura.
+    """
+    orcamento = OrcamentoMensal(mes=12, ano=2024, receitas_previstas=5000.0)
+    orcamento.adicionar_lancamento(Receita(
+        valor=3000.0,
+        categoria=categoria_receita,
+        data=_DEZ_5,
+        descricao="Salário",
+        forma_pagamento=_PIX
+    ))
+    orcamento.adicionar_lancamento(Despesa(
+        valor=500.0,
+        categoria=categoria_despesa,
+        data=_DEZ_10,
+        descricao="Compra",
+        forma_pagamento=_DEBITO
+    ))
+    return orcamento
+
+
+@pytest.fixture(scope="module")
+def orcamentos_para_soma(categoria_receita, categoria_despesa):
+    """
+    Par de orçamentos (novembro e dezembro) com saldos 2500 e 3000,
+    construído uma vez para o teste de soma. Contrato somente leitura.
+    """
+    orc_nov = OrcamentoMensal(mes=11, ano=2024)
+    orc_dez = OrcamentoMensal(mes=12, ano=2024)
+
+    orc_nov.adicionar_lancamento(Receita(
+        valor=3000.0,
+        categoria=categoria_receita,
+        data=date(2024, 11, 5),
+        descricao="Salário nov",
+        forma_pagamento=_PIX
+    ))
+    orc_nov.adicionar_lancamento(Despesa(
+        valor=500.0,
+        categoria=categoria_despesa,
+        data=date(2024, 11, 10),
+        descricao="Compra nov",
+        forma_pagamento=_DEBITO
+    ))
+    orc_dez.adicionar_lancamento(Receita(
+        valor=4000.0,
+        categoria=categoria_receita,
+        data=_DEZ_5,
+        descricao="Salário dez",
+        forma_pagamento=_PIX
+    ))
+    orc_dez.adicionar_lancamento(Despesa(
+        valor=1000.0,
+        categoria=categoria_despesa,
+        data=_DEZ_10,
+        descricao="Compra dez",
+        forma_pagamento=_DEBITO
+    ))
+    return orc_nov, orc_dez
+
+
 class TestOrcamentoMensal:
     """Testes para a classe OrcamentoMensal."""
     
@@ -55,30 +143,19 @@ class TestOrcamentoMensal:
         assert orcamento.id is not None
         assert len(orcamento) == 0
     
-    def test_mes_invalido(self):
-        """Testa que mês inválido gera erro."""
-        with pytest.raises(ValueError, match="entre 1 e 12"):
-            OrcamentoMensal(mes=13, ano=2024)
+    @pytest.mark.parametrize("kwargs,match", [
+        (dict(mes=0, ano=2024), "entre 1 e 12"),
+        (dict(mes=13, ano=2024), "entre 1 e 12"),
+        (dict(mes=12, ano=2024, receitas_previstas=-1000.0), "não pode ser negativo"),
+    ])
+    def test_construcao_invalida(self, kwargs, match):
+        """Testa que mês fora de 1-12 e receitas negativas geram erro."""
+        with pytest.raises(ValueError, match=match):
+            OrcamentoMensal(**kwargs)
     
-    def test_mes_zero_invalido(self):
-        """Testa que mês zero é inválido."""
-        with pytest.raises(ValueError, match="entre 1 e 12"):
-            OrcamentoMensal(mes=0, ano=2024)
-    
-    def test_receitas_previstas_negativa(self):
-        """Testa que receitas previstas negativas são inválidas."""
-        with pytest.raises(ValueError, match="não pode ser negativo"):
-            OrcamentoMensal(mes=12, ano=2024, receitas_previstas=-1000.0)
-    
-    def test_adicionar_receita(self, orcamento_dezembro, categoria_receita):
+    def test_adicionar_receita(self, orcamento_dezembro, criar_receita):
         """Testa adição de receita."""
-        receita = Receita(
-            valor=3000.0,
-            categoria=categoria_receita,
-            data=date(2024, 12, 5),
-            descricao="Salário",
-            forma_pagamento=FormaPagamento.PIX
-        )
+        receita = criar_receita(valor=3000.0, data=_DEZ_5)
         
         alertas = orcamento_dezembro.adicionar_lancamento(receita)
         
@@ -91,9 +168,9 @@ class TestOrcamentoMensal:
         despesa = Despesa(
             valor=100.0,
             categoria=categoria_despesa,
-            data=date(2024, 12, 10),
+            data=_DEZ_10,
             descricao="Supermercado",
-            forma_pagamento=FormaPagamento.DEBITO
+            forma_pagamento=_DEBITO
         )
         
         alertas = orcamento_dezembro.adicionar_lancamento(despesa)
@@ -101,35 +178,23 @@ class TestOrcamentoMensal:
         assert len(orcamento_dezembro) == 1
         assert orcamento_dezembro.total_despesas == 100.0
     
-    def test_lancamento_mes_diferente_erro(self, orcamento_dezembro, categoria_receita):
+    def test_lancamento_mes_diferente_erro(self, orcamento_dezembro, criar_receita):
         """Testa que lançamento de outro mês é rejeitado."""
-        receita = Receita(
-            valor=1000.0,
-            categoria=categoria_receita,
-            data=date(2024, 11, 5),  # novembro, não dezembro
-            descricao="Salário",
-            forma_pagamento=FormaPagamento.PIX
-        )
+        receita = criar_receita(data=date(2024, 11, 5))  # novembro, não dezembro
         
         with pytest.raises(ValueError, match="não pertence"):
             orcamento_dezembro.adicionar_lancamento(receita)
     
-    def test_calcular_saldo(self, orcamento_dezembro, categoria_receita, categoria_despesa):
+    def test_calcular_saldo(self, orcamento_dezembro, criar_receita, categoria_despesa):
         """Testa cálculo de saldo."""
-        receita = Receita(
-            valor=3000.0,
-            categoria=categoria_receita,
-            data=date(2024, 12, 5),
-            descricao="Salário",
-            forma_pagamento=FormaPagamento.PIX
-        )
+        receita = criar_receita(valor=3000.0, data=_DEZ_5)
         
         despesa = Despesa(
             valor=500.0,
             categoria=categoria_despesa,
-            data=date(2024, 12, 10),
+            data=_DEZ_10,
             descricao="Supermercado",
-            forma_pagamento=FormaPagamento.DEBITO
+            forma_pagamento=_DEBITO
         )
         
         orcamento_dezembro.adicionar_lancamento(receita)
@@ -139,30 +204,26 @@ class TestOrcamentoMensal:
         assert orcamento_dezembro.total_despesas == 500.0
         assert orcamento_dezembro.saldo == 2500.0
     
-    def test_saldo_negativo_deficit(self, orcamento_dezembro, categoria_receita, categoria_despesa):
+    def test_saldo_negativo_deficit(self, orcamento_dezembro, criar_receita, categoria_despesa):
         """Testa detecção de déficit."""
-        receita = Receita(
-            valor=1000.0,
-            categoria=categoria_receita,
-            data=date(2024, 12, 5),
-            descricao="Salário parcial",
-            forma_pagamento=FormaPagamento.PIX
+        receita = criar_receita(
+            valor=1000.0, data=_DEZ_5, descricao="Salário parcial"
         )
         
         despesa = Despesa(
             valor=400.0,
             categoria=categoria_despesa,
-            data=date(2024, 12, 10),
+            data=_DEZ_10,
             descricao="Compra 1",
-            forma_pagamento=FormaPagamento.DEBITO
+            forma_pagamento=_DEBITO
         )
         
         despesa2 = Despesa(
             valor=700.0,
             categoria=categoria_despesa,
-            data=date(2024, 12, 15),
+            data=_DEZ_15,
             descricao="Compra 2",
-            forma_pagamento=FormaPagamento.CREDITO
+            forma_pagamento=_CREDITO
         )
         
         orcamento_dezembro.adicionar_lancamento(receita)
@@ -181,17 +242,17 @@ class TestOrcamentoMensal:
         despesa1 = Despesa(
             valor=400.0,
             categoria=categoria_despesa,
-            data=date(2024, 12, 5),
+            data=_DEZ_5,
             descricao="Compra 1",
-            forma_pagamento=FormaPagamento.DEBITO
+            forma_pagamento=_DEBITO
         )
         
         despesa2 = Despesa(
             valor=200.0,  # Vai exceder limite de 500
             categoria=categoria_despesa,
-            data=date(2024, 12, 10),
+            data=_DEZ_10,
             descricao="Compra 2",
-            forma_pagamento=FormaPagamento.DEBITO
+            forma_pagamento=_DEBITO
         )
         
         orcamento_dezembro.adicionar_lancamento(despesa1)
@@ -203,131 +264,48 @@ class TestOrcamentoMensal:
         assert "Alimentação" in alertas_limite[0].mensagem
     
     def test_alerta_alto_valor(self, orcamento_dezembro, categoria_despesa):
-        """Testa alerta para despesa de alto valor."""
+        """Testa alerta para despesa de alto valor (> R$500)."""
+        # Instância própria: adicionar_lancamento muta _alertas da
+        # despesa, e a fixture compartilhada é somente leitura
         despesa = Despesa(
-            valor=600.0,  # > R$500 = alto valor
+            valor=600.0,
             categoria=categoria_despesa,
-            data=date(2024, 12, 5),
+            data=_DEZ_1,
             descricao="Compra grande",
-            forma_pagamento=FormaPagamento.CREDITO
+            forma_pagamento=_CREDITO
         )
-        
         alertas = orcamento_dezembro.adicionar_lancamento(despesa)
         
         # Deve ter gerado alerta de alto valor
         alertas_alto = [a for a in alertas if a.tipo == TipoAlerta.ALTO_VALOR]
         assert len(alertas_alto) == 1
     
-    def test_despesas_por_categoria(
-        self, orcamento_dezembro, categoria_despesa, categoria_despesa_transporte
-    ):
+    def test_despesas_por_categoria(self, orcamento_populado):
         """Testa agrupamento de despesas por categoria."""
-        despesa1 = Despesa(
-            valor=200.0,
-            categoria=categoria_despesa,
-            data=date(2024, 12, 5),
-            descricao="Supermercado",
-            forma_pagamento=FormaPagamento.DEBITO
-        )
-        
-        despesa2 = Despesa(
-            valor=100.0,
-            categoria=categoria_despesa_transporte,
-            data=date(2024, 12, 10),
-            descricao="Uber",
-            forma_pagamento=FormaPagamento.PIX
-        )
-        
-        despesa3 = Despesa(
-            valor=150.0,
-            categoria=categoria_despesa,
-            data=date(2024, 12, 15),
-            descricao="Restaurante",
-            forma_pagamento=FormaPagamento.CREDITO
-        )
-        
-        orcamento_dezembro.adicionar_lancamento(despesa1)
-        orcamento_dezembro.adicionar_lancamento(despesa2)
-        orcamento_dezembro.adicionar_lancamento(despesa3)
-        
-        por_categoria = orcamento_dezembro.despesas_por_categoria()
+        por_categoria = orcamento_populado.despesas_por_categoria()
         
-        assert por_categoria["Alimentação"] == 350.0
+        assert por_categoria["Alimentação"] == 300.0
         assert por_categoria["Transporte"] == 100.0
     
-    def test_despesas_por_forma_pagamento(self, orcamento_dezembro, categoria_despesa):
+    def test_despesas_por_forma_pagamento(self, orcamento_populado):
         """Testa agrupamento de despesas por forma de pagamento."""
-        despesa1 = Despesa(
-            valor=100.0,
-            categoria=categoria_despesa,
-            data=date(2024, 12, 5),
-            descricao="Compra 1",
-            forma_pagamento=FormaPagamento.DEBITO
-        )
-        
-        despesa2 = Despesa(
-            valor=200.0,
-            categoria=categoria_despesa,
-            data=date(2024, 12, 10),
-            descricao="Compra 2",
-            forma_pagamento=FormaPagamento.PIX
-        )
-        
-        despesa3 = Despesa(
-            valor=50.0,
-            categoria=categoria_despesa,
-            data=date(2024, 12, 15),
-            descricao="Compra 3",
-            forma_pagamento=FormaPagamento.PIX
-        )
-        
-        orcamento_dezembro.adicionar_lancamento(despesa1)
-        orcamento_dezembro.adicionar_lancamento(despesa2)
-        orcamento_dezembro.adicionar_lancamento(despesa3)
+        por_pagamento = orcamento_populado.despesas_por_forma_pagamento()
         
-        por_pagamento = orcamento_dezembro.despesas_por_forma_pagamento()
-        
-        assert por_pagamento["DEBITO"] == 100.0
-        assert por_pagamento["PIX"] == 250.0
+        assert por_pagamento["DEBITO"] == 200.0
+        assert por_pagamento["PIX"] == 100.0
+        assert por_pagamento["CREDITO"] == 100.0
     
-    def test_percentual_por_categoria(
-        self, orcamento_dezembro, categoria_despesa, categoria_despesa_transporte
-    ):
+    def test_percentual_por_categoria(self, orcamento_populado):
         """Testa cálculo de percentual por categoria."""
-        despesa1 = Despesa(
-            valor=300.0,
-            categoria=categoria_despesa,
-            data=date(2024, 12, 5),
-            descricao="Alimentação",
-            forma_pagamento=FormaPagamento.DEBITO
-        )
-        
-        despesa2 = Despesa(
-            valor=100.0,
-            categoria=categoria_despesa_transporte,
-            data=date(2024, 12, 10),
-            descricao="Transporte",
-            forma_pagamento=FormaPagamento.PIX
-        )
-        
-        orcamento_dezembro.adicionar_lancamento(despesa1)
-        orcamento_dezembro.adicionar_lancamento(despesa2)
-        
-        percentuais = orcamento_dezembro.percentual_por_categoria()
+        percentuais = orcamento_populado.percentual_por_categoria()
         
         # Total: 400. Alimentação: 300/400 = 75%. Transporte: 100/400 = 25%
         assert percentuais["Alimentação"] == 75.0
         assert percentuais["Transporte"] == 25.0
     
-    def test_remover_lancamento(self, orcamento_dezembro, categoria_receita):
+    def test_remover_lancamento(self, orcamento_dezembro, criar_receita):
         """Testa remoção de lançamento."""
-        receita = Receita(
-            valor=1000.0,
-            categoria=categoria_receita,
-            data=date(2024, 12, 5),
-            descricao="Salário",
-            forma_pagamento=FormaPagamento.PIX
-        )
+        receita = criar_receita(data=_DEZ_5)
         
         orcamento_dezembro.adicionar_lancamento(receita)
         assert len(orcamento_dezembro) == 1
@@ -337,57 +315,30 @@ class TestOrcamentoMensal:
         assert removido == receita
         assert len(orcamento_dezembro) == 0
     
-    def test_iteracao_orcamento(self, orcamento_dezembro, categoria_receita, categoria_despesa):
+    def test_iteracao_orcamento(self, orcamento_dezembro, criar_receita, categoria_despesa):
         """Testa iteração sobre lançamentos do orçamento."""
-        receita = Receita(
-            valor=1000.0,
-            categoria=categoria_receita,
-            data=date(2024, 12, 5),
-            descricao="Salário",
-            forma_pagamento=FormaPagamento.PIX
-        )
+        receita = criar_receita(data=_DEZ_5)
         
         despesa = Despesa(
             valor=100.0,
             categoria=categoria_despesa,
-            data=date(2024, 12, 10),
+            data=_DEZ_10,
             descricao="Compra",
-            forma_pagamento=FormaPagamento.DEBITO
+            forma_pagamento=_DEBITO
         )
         
         orcamento_dezembro.adicionar_lancamento(receita)
         orcamento_dezembro.adicionar_lancamento(despesa)
         
-        lancamentos = list(orcamento_dezembro)
-        assert len(lancamentos) == 2
+        # conta via gerador, sem materializar lista intermediária
+        quantidade = sum(1 for _ in orcamento_dezembro)
+        assert quantidade == 2
     
-    def test_str_orcamento(self, orcamento_dezembro, categoria_receita, categoria_despesa):
+    # mês/ano, receitas, despesas e saldo (3000 - 500 = 2500)
+    @pytest.mark.parametrize("trecho", ["12/2024", "3000.00", "500.00", "2500.00"])
+    def test_str_orcamento(self, orcamento_para_str, trecho):
         """Testa representação string do orçamento."""
-        receita = Receita(
-            valor=3000.0,
-            categoria=categoria_receita,
-            data=date(2024, 12, 5),
-            descricao="Salário",
-            forma_pagamento=FormaPagamento.PIX
-        )
-        
-        despesa = Despesa(
-            valor=500.0,
-            categoria=categoria_despesa,
-            data=date(2024, 12, 10),
-            descricao="Compra",
-            forma_pagamento=FormaPagamento.DEBITO
-        )
-        
-        orcamento_dezembro.adicionar_lancamento(receita)
-        orcamento_dezembro.adicionar_lancamento(despesa)
-        
-        resultado = str(orcamento_dezembro)
-        
-        assert "12/2024" in resultado
-        assert "3000.00" in resultado
-        assert "500.00" in resultado
-        assert "2500.00" in resultado
+        assert trecho in str(orcamento_para_str)
     
     def test_eq_orcamentos(self):
         """Testa comparação de orçamentos por mês/ano."""
@@ -411,51 +362,13 @@ class TestOrcamentoMensal:
         assert orcamentos_ordenados[1] == orc_dez
         assert orcamentos_ordenados[2] == orc_jan_25
     
-    def test_add_saldos_orcamentos(self, categoria_receita, categoria_despesa):
+    def test_add_saldos_orcamentos(self, orcamentos_para_soma):
         """Testa soma de saldos de orçamentos."""
-        orc1 = OrcamentoMensal(mes=11, ano=2024)
-        orc2 = OrcamentoMensal(mes=12, ano=2024)
-        
-        receita1 = Receita(
-            valor=3000.0,
-            categoria=categoria_receita,
-            data=date(2024, 11, 5),
-            descricao="Salário nov",
-            forma_pagamento=FormaPagamento.PIX
-        )
-        
-        despesa1 = Despesa(
-            valor=500.0,
-            categoria=categoria_despesa,
-            data=date(2024, 11, 10),
-            descricao="Compra nov",
-            forma_pagamento=FormaPagamento.DEBITO
-        )
-        
-        receita2 = Receita(
-            valor=4000.0,
-            categoria=categoria_receita,
-            data=date(2024, 12, 5),
-            descricao="Salário dez",
-            forma_pagamento=FormaPagamento.PIX
-        )
-        
-        despesa2 = Despesa(
-            valor=1000.0,
-            categoria=categoria_despesa,
-            data=date(2024, 12, 10),
-            descricao="Compra dez",
-            forma_pagamento=FormaPagamento.DEBITO
-        )
-        
-        orc1.adicionar_lancamento(receita1)
-        orc1.adicionar_lancamento(despesa1)
-        orc2.adicionar_lancamento(receita2)
-        orc2.adicionar_lancamento(despesa2)
-        
+        orc_nov, orc_dez = orcamentos_para_soma
+
         # Nov: 3000 - 500 = 2500
         # Dez: 4000 - 1000 = 3000
         # Total: 5500
-        
-        total = orc1 + orc2
+
+        total = orc_nov + orc_dez
         assert total == 5500.0